@@ -11,33 +11,294 @@ Fitur:
 ✓ Mengubah struktur kalimat yang repetitif
 ✓ Menambahkan kontraksi dan ungkapan informal
 ✓ Analisis tingkat "kemanusiaan" teks
+✓ Konversi streaming untuk file besar (memori terbatas)
+✓ Statistik waktu per tahap dan profiling (--profile)
+✓ Kata berlebihan ditentukan dari model frekuensi korpus (--frequency-model)
+✓ Analisis inkremental: setelah teks diedit hanya kalimat yang berubah dihitung ulang
 """
 
+import json
+import logging
+import os
 import re
 import random
+import string
+import time
+from bisect import bisect_right
 from collections import Counter
-from typing import List, Tuple
+from itertools import chain
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Log progres konversi; diam kecuali logging dikonfigurasi (mis. --verbose)
+logger = logging.getLogger('ai_to_human')
+
+# Pemisah kalimat: spasi setelah tanda akhir kalimat
+SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+')
+
+# Awalan teks sampai batas kalimat terakhir (untuk memotong chunk streaming)
+_UNTIL_LAST_BOUNDARY = re.compile(r'.*[.!?]\s', re.DOTALL)
+
+# Ukuran blok baca default untuk konversi streaming (karakter)
+CHUNK_SIZE = 1024 * 1024
+
+# File lebih besar dari ini (byte) dikonversi secara streaming langsung ke file
+STREAM_THRESHOLD = 8 * 1024 * 1024
+
+# Kata kontraksi/informal yang dihitung oleh analyze_humanness
+CONTRACTION_WORDS = ('nggak', 'gak', 'itu', 'sih', 'dong', 'kan')
+
+# Tanda baca yang dibuang dari tepi token saat analisis ('_' termasuk \w jadi tidak dibuang)
+_EDGE_PUNCTUATION = string.punctuation.replace('_', '')
+
+def _word_trie_pattern(words) -> str:
+    """Regex \\b...\\b dari sekumpulan kata/frasa dalam bentuk trie (longest match)"""
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+    
+    def build(node: dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # Lanjutan yang lebih panjang dicoba dulu (greedy), baru kata yang berakhir di sini
+        return '(?:' + body + ')?' if '' in node else body
+    
+    first_letters = ''.join(sorted({re.escape(word[0]) for word in words if word}))
+    return r'(?=[' + first_letters + r'])\b' + build(trie) + r'\b'
+
+def _first_letter_lookahead(patterns) -> str:
+    """Lookahead huruf pertama untuk pola berbentuk \\bkata..., agar pencarian cepat melompati posisi lain"""
+    letters = set()
+    for pattern in patterns:
+        match = re.match(r'\\b([a-z])', pattern)
+        if not match:
+            return ''
+        letters.add(match.group(1))
+    return '(?=[' + ''.join(sorted(letters)) + '])'
+
+# Karakter penanda akhir kalimat
+SENTENCE_END = '.!?'
+
+
+class Document:
+    """Representasi teks yang dipakai bersama oleh semua tahap konversi:
+    daftar kalimat, setiap kalimat berupa daftar token (kata + tanda baca).
+    Teks hanya dirender sekali di akhir konversi."""
+    
+    __slots__ = ('sentences',)
+    
+    def __init__(self, sentences: List[List[str]]):
+        self.sentences = sentences
+    
+    @staticmethod
+    def segment(tokens: List[str]) -> List[List[str]]:
+        """Kelompokkan token menjadi kalimat (kalimat berakhir di token ber-.!?)"""
+        sentences = []
+        current = []
+        for token in tokens:
+            current.append(token)
+            if token[-1] in SENTENCE_END:
+                sentences.append(current)
+                current = []
+        if current or not sentences:
+            sentences.append(current)
+        return sentences
+    
+    @classmethod
+    def from_text(cls, text: str) -> 'Document':
+        """Tokenisasi teks sekali (spasi dinormalisasi)"""
+        # Kalimat kosong hanya muncul dari spasi di akhir teks
+        sentences = [tokens for tokens in map(str.split, SENTENCE_SPLIT.split(text)) if tokens]
+        return cls(sentences or [[]])
+    
+    def resegment(self):
+        """Bangun ulang batas kalimat setelah token dihapus"""
+        self.sentences = self.segment([token for tokens in self.sentences for token in tokens])
+    
+    @staticmethod
+    def sentence_length(tokens: List[str]) -> int:
+        """Panjang kalimat dalam karakter jika dirender"""
+        return sum(map(len, tokens)) + len(tokens) - 1 if tokens else 0
+    
+    def token_count(self) -> int:
+        """Jumlah token (kata + tanda baca yang menempel)"""
+        return sum(map(len, self.sentences))
+    
+    def render(self) -> str:
+        """Render Document kembali menjadi teks"""
+        return ' '.join(' '.join(tokens) for tokens in self.sentences)
+
+
+class ConversionState:
+    """Status konversi yang melintasi batas chunk pada mode streaming"""
+    
+    __slots__ = ('seen_patterns', 'word_count', 'word_reduce_count', 'sentence_index', 'carry', 'rng')
+    
+    def __init__(self, word_count: Optional[Counter] = None, rng: Optional[random.Random] = None):
+        self.seen_patterns = set()
+        # None: kata berlebihan dihitung per Document
+        self.word_count = word_count
+        self.word_reduce_count = {}
+        self.sentence_index = 0
+        # Kalimat terakhir chunk sebelumnya yang belum bertanda akhir
+        self.carry = []
+        # None: memakai RNG milik converter
+        self.rng = rng
+
+
+class StageStats:
+    """Statistik satu tahap pipeline"""
+    
+    __slots__ = ('calls', 'seconds', 'tokens_in', 'tokens_out', 'peak_bytes')
+    
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.tokens_in = 0
+        self.tokens_out = 0
+        self.peak_bytes = 0
+
+
+class ConversionStats:
+    """Statistik per tahap pipeline: waktu, ukuran input/output (token), jumlah panggilan.
+    
+    profile=True merekam cProfile selama konversi; trace_memory=True mengukur
+    puncak alokasi memori per tahap dengan tracemalloc (memperlambat konversi).
+    """
+    
+    def __init__(self, profile: bool = False, trace_memory: bool = False):
+        self.stages: Dict[str, StageStats] = {}
+        self.conversions = 0
+        self.profiler = None
+        if profile:
+            import cProfile
+            self.profiler = cProfile.Profile()
+        self.trace_memory = trace_memory
+    
+    def stage(self, name: str) -> StageStats:
+        """Statistik tahap (dibuat saat pertama kali dipakai)"""
+        stats = self.stages.get(name)
+        if stats is None:
+            stats = self.stages[name] = StageStats()
+        return stats
+    
+    def reset(self):
+        """Kosongkan semua statistik"""
+        self.stages.clear()
+        self.conversions = 0
+        if self.profiler:
+            import cProfile
+            self.profiler = cProfile.Profile()
+    
+    def as_dict(self) -> dict:
+        """Statistik dalam bentuk dict (untuk JSON)"""
+        return {
+            'conversions': self.conversions,
+            'stages': {
+                name: {key: getattr(stats, key) for key in StageStats.__slots__}
+                for name, stats in self.stages.items()
+            }
+        }
+    
+    def report(self) -> str:
+        """Tabel statistik per tahap"""
+        total = sum(stats.seconds for stats in self.stages.values()) or 1
+        lines = [
+            f"{'Tahap':<22} {'Panggilan':>9} {'Waktu(s)':>10} {'%':>6} {'Token masuk':>12} {'Token keluar':>12} {'Memori(KB)':>11}",
+            '-' * 86
+        ]
+        for name, stats in self.stages.items():
+            lines.append(
+                f"{name:<22} {stats.calls:>9} {stats.seconds:>10.4f} {stats.seconds / total:>6.1%} "
+                f"{stats.tokens_in:>12,} {stats.tokens_out:>12,} {stats.peak_bytes / 1024:>11,.1f}"
+            )
+        return '\n'.join(lines)
+    
+    def profile_report(self, limit: int = 15) -> str:
+        """Fungsi dengan waktu kumulatif terbesar dari cProfile"""
+        if not self.profiler:
+            return ''
+        import io
+        import pstats
+        output = io.StringIO()
+        pstats.Stats(self.profiler, stream=output).sort_stats('cumulative').print_stats(limit)
+        return output.getvalue()
+    
+    def dump_profile(self, path: str):
+        """Simpan hasil cProfile (.prof) untuk snakeviz/flameprof"""
+        if self.profiler:
+            self.profiler.dump_stats(path)
+
+
+def iter_sentence_chunks(file, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """Baca file per blok dan hasilkan chunk yang dipotong di batas kalimat"""
+    buffer = file.read(chunk_size)
+    while True:
+        # Buffer hanya dipotong jika masih ada blok berikutnya
+        block = file.read(chunk_size)
+        if not block:
+            break
+        match = _UNTIL_LAST_BOUNDARY.match(buffer)
+        if match:
+            yield buffer[:match.end()]
+            buffer = buffer[match.end():]
+        buffer += block
+    if buffer.strip():
+        yield buffer
+
 
 class AItoHumanConverter:
     """Mengkonversi teks buatan AI menjadi teks yang lebih manusiawi"""
     
-    def __init__(self):
+    # Tahap pipeline convert(): (nama, label log, method); setiap tahap dipanggil
+    # sebagai fungsi(doc, state) dan mengubah Document di tempat
+    PIPELINE = (
+        ('repetitive_patterns', 'Menghapus pola repetitif', '_remove_repetitive_patterns_doc'),
+        ('formal_words', 'Mengganti kata-kata formal', '_replace_formal_words_doc'),
+        ('overused_words', 'Menghapus penggunaan kata berlebihan', '_remove_overuse_doc'),
+        ('contractions', 'Menambahkan kontraksi', '_add_contractions_doc'),
+        ('sentence_structure', 'Memvariasikan struktur kalimat', '_vary_sentence_structure_doc'),
+        ('informal_touches', 'Menambahkan sentuhan informal', '_add_informal_touches_doc'),
+    )
+    
+    # Pada streaming, kalimat yang belum selesai ditahan setelah tahap ini
+    STREAM_SPLIT_STAGE = 'overused_words'
+    
+    def __init__(self, seed: Optional[int] = None, stats: Optional[ConversionStats] = None):
+        # Generator acak milik instance; tanpa seed memakai modul random global
+        self.rng = random.Random(seed) if seed is not None else random
+        
+        # Tahap-tahap yang dijalankan convert(); bisa diubah dengan add_stage/remove_stage
+        self.stages: List[Tuple[str, str, Callable]] = [
+            (name, label, getattr(self, method)) for name, label, method in self.PIPELINE
+        ]
+        self.stats = stats or ConversionStats()
+        
+        # Model frekuensi korpus (ai_to_human_frequency.FrequencyModel); jika sudah siap,
+        # model menentukan kata berlebihan dan setiap dokumen ditambahkan ke model
+        self.frequency_model = None
+        self.learn_frequencies = True
+        
         # Dictionary untuk mengganti kata-kata formal dengan informal
         self.formal_to_informal = {
-            'oleh karena itu': random.choice(['jadi', 'makanya', 'karena itu']),
-            'dengan demikian': random.choice(['dengan begitu', 'jadi', 'dengan cara ini']),
-            'namun demikian': random.choice(['tapi', 'meskipun begitu', 'tapi tetap saja']),
-            'sebaliknya': random.choice(['malah', 'justru', 'sebaliknya']),
+            'oleh karena itu': self.rng.choice(['jadi', 'makanya', 'karena itu']),
+            'dengan demikian': self.rng.choice(['dengan begitu', 'jadi', 'dengan cara ini']),
+            'namun demikian': self.rng.choice(['tapi', 'meskipun begitu', 'tapi tetap saja']),
+            'sebaliknya': self.rng.choice(['malah', 'justru', 'sebaliknya']),
             'hendaknya': 'harusnya',
             'sesungguhnya': 'sebenarnya',
             'tidaklah': 'nggak',
             'bukanlah': 'bukan',
             'sungguh': 'banget',
             'benar-benar': 'bener-bener',
-            'sangat': random.choice(['banget', 'sekali', 'parah']),
-            'mungkin': random.choice(['kayaknya', 'mungkin', 'sepertinya']),
-            'dapat': random.choice(['bisa', 'bisa', 'bisa']),
-            'akan': random.choice(['bakal', 'akan', 'akan']),
+            'sangat': self.rng.choice(['banget', 'sekali', 'parah']),
+            'mungkin': self.rng.choice(['kayaknya', 'mungkin', 'sepertinya']),
+            'dapat': self.rng.choice(['bisa', 'bisa', 'bisa']),
+            'akan': self.rng.choice(['bakal', 'akan', 'akan']),
             'di antara': 'antara',
             'sejak': 'dari',
             'mengingat': 'karena',
@@ -69,30 +330,102 @@ class AItoHumanConverter:
             'berdasarkan hasil analisis': 'berdasarkan analisisnya',
             'diperoleh informasi bahwa': 'didapat info kalau',
         }
+        
+        # Kontraksi Indonesia yang natural (pola regex -> pengganti)
+        self.contractions = {
+            r'\btidak\s+akan\b': "bakal nggak",
+            r'\btidak\s+bisa\b': "nggak bisa",
+            r'\btidak\s+ada\b': "nggak ada",
+            r'\bkamu\s+adalah\b': "kamu itu",
+            r'\bsaya\s+adalah\b': "saya itu",
+            r'\bdia\s+adalah\b': "dia itu",
+        }
+        
+        # Kata-kata yang sering digunakan AI dan harus dikurangi
+        self.overused_words = {
+            'adalah': 0.3,  # Kurangi hingga 30% dari kemunculan
+            'yang': 0.4,
+            'dapat': 0.3,
+            'dalam': 0.35,
+            'terdapat': 0.4,
+            'memiliki': 0.35,
+        }
+        
+        self._compile_replacements()
+        self._compile_analyzer()
+    
+    def dictionary_version(self) -> str:
+        """Sidik jari semua tabel kata (berubah jika kamus atau pilihan acaknya berubah)"""
+        tables = [
+            self.formal_to_informal, self.transition_words, self.filler_words,
+            self.phrase_replacements, self.contractions, self.overused_words
+        ]
+        import hashlib
+        data = json.dumps(tables, ensure_ascii=False, sort_keys=True).encode('utf-8')
+        return hashlib.sha256(data).hexdigest()[:16]
+    
+    def _compile_replacements(self):
+        """Kompilasi semua tabel substitusi sekali menjadi matcher gabungan"""
+        # Frasa menimpa kata dengan kunci yang sama (dulu frasa diganti lebih dulu)
+        self._replacements = {}
+        for table in (self.formal_to_informal, self.phrase_replacements):
+            for formal, informal in table.items():
+                self._replacements[formal.casefold()] = informal
+        
+        # Trie: alternatif terpanjang dicoba lebih dulu, frasa menang atas kata di dalamnya
+        self._formal_pattern = re.compile(_word_trie_pattern(self._replacements), re.IGNORECASE)
+        
+        # Setiap pola kontraksi menjadi satu named group dalam satu regex
+        self._contraction_values = {}
+        groups = []
+        for i, (pattern, contraction) in enumerate(self.contractions.items()):
+            groups.append(f'(?P<c{i}>{pattern})')
+            self._contraction_values[f'c{i}'] = contraction
+        self._contraction_pattern = re.compile(
+            _first_letter_lookahead(self.contractions) + '(?:' + '|'.join(groups) + ')', re.IGNORECASE
+        )
+    
+    def _compile_analyzer(self):
+        """Siapkan tabel hash untuk analyze_humanness"""
+        # Kunci berisi spasi tidak pernah cocok dengan satu token, jadi cukup kunci satu kata
+        single_words = [formal for formal in self.formal_to_informal if not any(c.isspace() for c in formal)]
+        self._formal_word_set = frozenset(formal.casefold() for formal in single_words)
+        self._formal_word_pattern = re.compile(
+            r'\b(?:' + '|'.join(re.escape(formal) for formal in single_words) + r')\b', re.IGNORECASE
+        )
+        self._filler_set = frozenset(self.filler_words)
+        self._contraction_word_set = frozenset(CONTRACTION_WORDS)
+        self._contraction_word_pattern = re.compile(
+            r'\b(?:' + '|'.join(CONTRACTION_WORDS) + r')\b', re.IGNORECASE
+        )
     
     def remove_repetitive_patterns(self, text: str) -> str:
         """Menghapus pola kalimat yang repetitif"""
-        # Hapus kalimat-kalimat yang terlalu sering diulang
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-        
+        doc = Document.from_text(text)
+        self._remove_repetitive_patterns_doc(doc)
+        return doc.render()
+    
+    def _remove_repetitive_patterns_doc(self, doc: 'Document', state: Optional[ConversionState] = None):
+        """Menghapus pola kalimat yang repetitif (pada Document)"""
         # Cek untuk pola repetitif
-        seen_patterns = set()
+        seen_patterns = state.seen_patterns if state else set()
         result = []
         
-        for sentence in sentences:
+        for tokens in doc.sentences:
             # Extract pola dasar kalimat
-            pattern = self._extract_pattern(sentence)
+            pattern = self._extract_pattern(' '.join(tokens[:3]))
             
             if pattern not in seen_patterns:
-                result.append(sentence)
+                result.append(tokens)
                 seen_patterns.add(pattern)
             else:
                 # Variasikan kalimat jika sudah ada yang serupa
+                sentence = ' '.join(tokens)
                 new_sentence = self._rephrase_sentence(sentence)
                 if new_sentence:
-                    result.append(new_sentence)
+                    result.append(tokens if new_sentence == sentence else new_sentence.split())
         
-        return ' '.join(result)
+        doc.sentences = result
     
     def _extract_pattern(self, sentence: str) -> str:
         """Ekstrak pola dasar dari kalimat"""
@@ -107,132 +440,204 @@ class AItoHumanConverter:
     
     def add_informal_touches(self, text: str) -> str:
         """Tambahkan sentuhan informal ke teks"""
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-        result = []
-        
-        for sentence in sentences:
+        doc = Document.from_text(text)
+        self._add_informal_touches_doc(doc)
+        return doc.render()
+    
+    def _add_informal_touches_doc(self, doc: 'Document', state: Optional[ConversionState] = None):
+        """Tambahkan sentuhan informal (pada Document)"""
+        rng = state.rng if state and state.rng else self.rng
+        for i, tokens in enumerate(doc.sentences):
             # Tambahkan kata-kata pengisi dengan probabilitas tertentu
-            if random.random() < 0.2:  # 20% chance
-                filler = random.choice(self.filler_words)
+            if rng.random() < 0.2:  # 20% chance
+                filler = rng.choice(self.filler_words)
+                # Buang tanda akhir kalimat dari token terakhir
+                words = tokens[:-1]
+                if tokens:
+                    last = tokens[-1].rstrip('.!?')
+                    if last:
+                        words.append(last)
                 # Insert di tengah-tengah kalimat
-                words = sentence.rstrip('.!?').split()
                 if len(words) > 3:
-                    insert_pos = random.randint(1, len(words)-1)
+                    insert_pos = rng.randint(1, len(words)-1)
                     words.insert(insert_pos, filler + ',')
-                sentence = ' '.join(words)
-            
-            result.append(sentence)
-        
-        return ' '.join(result)
+                doc.sentences[i] = words
     
     def replace_formal_words(self, text: str) -> str:
-        """Ganti kata-kata formal dengan informal"""
-        result = text
-        
-        # Ganti phrase terlebih dahulu (lebih panjang)
-        for formal, informal in self.phrase_replacements.items():
-            result = re.sub(r'\b' + formal + r'\b', informal, result, flags=re.IGNORECASE)
-        
-        # Ganti individual words
-        for formal, informal in self.formal_to_informal.items():
-            result = re.sub(r'\b' + formal + r'\b', informal, result, flags=re.IGNORECASE)
-        
-        return result
+        """Ganti kata-kata formal dengan informal (satu kali scan)"""
+        return self._formal_pattern.sub(self._replace_formal_match, text)
+    
+    def _replace_formal_match(self, match: re.Match) -> str:
+        """Pengganti untuk satu kecocokan kata/frasa formal"""
+        return self._replacements[match.group(0).casefold()]
+    
+    def _replace_formal_words_doc(self, doc: 'Document', state: Optional[ConversionState] = None):
+        """Ganti kata-kata formal dengan informal (pada Document)"""
+        for i, tokens in enumerate(doc.sentences):
+            sentence = ' '.join(tokens)
+            new_sentence = self._formal_pattern.sub(self._replace_formal_match, sentence)
+            if new_sentence != sentence:
+                doc.sentences[i] = new_sentence.split()
     
     def vary_sentence_structure(self, text: str) -> str:
         """Variasikan struktur kalimat"""
-        sentences = re.split(r'(?<=[.!?])\s+', text)
+        doc = Document.from_text(text)
+        self._vary_sentence_structure_doc(doc)
+        return doc.render()
+    
+    def _vary_sentence_structure_doc(self, doc: 'Document', state: Optional[ConversionState] = None):
+        """Variasikan struktur kalimat (pada Document)"""
         result = []
         
-        for i, sentence in enumerate(sentences):
+        # Nomor kalimat berlanjut antar chunk pada mode streaming
+        start_index = state.sentence_index if state else 0
+        if state:
+            state.sentence_index += len(doc.sentences)
+        
+        for i, tokens in enumerate(doc.sentences, start_index):
             # Setiap beberapa kalimat, ubah struktur sedikit
-            if i % 3 == 0 and len(sentence) > 50:
+            if i % 3 == 0 and Document.sentence_length(tokens) > 50:
                 # Potong kalimat panjang menjadi dua
-                words = sentence.split()
-                mid = len(words) // 2
-                sentence = ' '.join(words[:mid]) + '. ' + ' '.join(words[mid:])
-            
-            result.append(sentence)
+                mid = len(tokens) // 2
+                first_half = tokens[:mid-1] + [tokens[mid-1] + '.'] if mid else ['.']
+                result.append(first_half)
+                result.append(tokens[mid:])
+            else:
+                result.append(tokens)
         
-        return ' '.join(result)
+        doc.sentences = result
     
     def remove_overuse_of_certain_words(self, text: str) -> str:
         """Hapus penggunaan kata tertentu yang berlebihan"""
-        words = text.split()
-        word_count = Counter(words)
+        doc = Document.from_text(text)
+        self._remove_overuse_doc(doc)
+        return doc.render()
+    
+    def _remove_overuse_doc(self, doc: 'Document', state: Optional[ConversionState] = None):
+        """Hapus penggunaan kata berlebihan (pada Document)"""
+        model = self.frequency_model
+        if model is not None:
+            # Model korpus: hitung kata ternormalisasi per Document (per chunk pada streaming)
+            counts = Counter(word.lower().rstrip('.,!?;:') for word in chain.from_iterable(doc.sentences))
+            ratios = model.overuse_ratios(counts) if model.ready() else None
+            if self.learn_frequencies:
+                model.update_counts(counts)
+            if ratios is not None:
+                keep = {word: int(counts[word] * (1 - ratio)) for word, ratio in ratios.items()}
+                self._drop_overused(doc, keep, lambda word, word_lower: keep[word_lower], dict.fromkeys(keep, 0))
+                return
         
-        # Kata-kata yang sering digunakan AI dan harus dikurangi
-        overused_words = {
-            'adalah': 0.3,  # Kurangi hingga 30% dari kemunculan
-            'yang': 0.4,
-            'dapat': 0.3,
-            'dalam': 0.35,
-            'terdapat': 0.4,
-            'memiliki': 0.35,
-        }
+        overused_words = self.overused_words
         
-        result = []
-        word_reduce_count = {word: 0 for word in overused_words}
+        if state is None or state.word_count is None:
+            word_count = Counter(chain.from_iterable(doc.sentences))
+            word_reduce_count = {word: 0 for word in overused_words}
+        else:
+            # Streaming: jumlah kemunculan dihitung atas seluruh teks
+            word_count = state.word_count
+            word_reduce_count = state.word_reduce_count
+            for word in overused_words:
+                word_reduce_count.setdefault(word, 0)
         
-        for word in words:
-            word_lower = word.lower().rstrip('.,!?;:')
-            
-            if word_lower in overused_words:
-                # Hitungkan berapa banyak kata ini muncul
-                total_occurrences = word_count[word]
-                target_reduction = int(total_occurrences * (1 - overused_words[word_lower]))
+        def target_reduction(word, word_lower):
+            # Hitungkan berapa banyak kata ini muncul
+            return int(word_count[word] * (1 - overused_words[word_lower]))
+        
+        self._drop_overused(doc, overused_words, target_reduction, word_reduce_count)
+    
+    def _drop_overused(self, doc: 'Document', overused_words, target_reduction: Callable, word_reduce_count: dict):
+        """Pertahankan kemunculan kata berlebihan sampai targetnya, sisanya dibuang"""
+        removed_sentence_end = False
+        
+        for i, tokens in enumerate(doc.sentences):
+            result = []
+            for word in tokens:
+                word_lower = word.lower().rstrip('.,!?;:')
                 
-                if word_reduce_count[word_lower] < target_reduction:
+                if word_lower in overused_words:
+                    if word_reduce_count[word_lower] < target_reduction(word, word_lower):
+                        result.append(word)
+                        word_reduce_count[word_lower] += 1
+                    elif word[-1] in SENTENCE_END:
+                        # Skip: tanda akhir kalimat ikut terbuang
+                        removed_sentence_end = True
+                else:
                     result.append(word)
-                    word_reduce_count[word_lower] += 1
-                # Skip jika sudah mencapai target pengurangan
-            else:
-                result.append(word)
+            doc.sentences[i] = result
         
-        return ' '.join(result)
+        # Kalimat yang kehilangan tanda akhirnya menyatu dengan kalimat berikutnya
+        if removed_sentence_end or any(not tokens for tokens in doc.sentences):
+            doc.resegment()
     
     def add_contractions(self, text: str) -> str:
-        """Tambahkan kontraksi Indonesia yang natural"""
-        contractions = {
-            r'\btidak\s+akan\b': "bakal nggak",
-            r'\btidak\s+bisa\b': "nggak bisa",
-            r'\btidak\s+ada\b': "nggak ada",
-            r'\bkamu\s+adalah\b': "kamu itu",
-            r'\bsaya\s+adalah\b': "saya itu",
-            r'\bdia\s+adalah\b': "dia itu",
-        }
+        """Tambahkan kontraksi Indonesia yang natural (satu kali scan)"""
+        return self._contraction_pattern.sub(self._replace_contraction_match, text)
+    
+    def _replace_contraction_match(self, match: re.Match) -> str:
+        """Pengganti untuk satu kecocokan pola kontraksi"""
+        return self._contraction_values[match.lastgroup]
+    
+    def _add_contractions_doc(self, doc: 'Document', state: Optional[ConversionState] = None):
+        """Tambahkan kontraksi (pada Document)"""
+        for i, tokens in enumerate(doc.sentences):
+            sentence = ' '.join(tokens)
+            if self._contraction_pattern.search(sentence):
+                doc.sentences[i] = self._contraction_pattern.sub(self._replace_contraction_match, sentence).split()
+    
+    def _sentence_stats(self, sentence: str) -> Tuple[int, int, int, int]:
+        """Statistik satu kalimat: (kata, kata formal, kata pengisi, kontraksi)"""
+        words = sentence.split()
+        formal_count = filler_count = contraction_count = 0
         
-        result = text
-        for pattern, contraction in contractions.items():
-            result = re.sub(pattern, contraction, result, flags=re.IGNORECASE)
+        for word in words:
+            lower = word.lower()
+            if lower in self._filler_set:
+                filler_count += 1
+            
+            core = lower.strip(_EDGE_PUNCTUATION)
+            if core.isalnum():
+                # Token satu kata dengan tanda baca di tepi: cukup lookup hash
+                folded = core.casefold()
+                if folded in self._formal_word_set:
+                    formal_count += 1
+                if folded in self._contraction_word_set:
+                    contraction_count += 1
+            else:
+                # Token majemuk (mis. 'benar-benar', 'x-dapat'): pakai regex gabungan
+                if self._formal_word_pattern.search(word):
+                    formal_count += 1
+                contraction_count += len(self._contraction_word_pattern.findall(word))
         
-        return result
+        return len(words), formal_count, filler_count, contraction_count
     
     def analyze_humanness(self, text: str) -> dict:
-        """Analisis tingkat 'kemanusiaan' teks"""
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-        words = text.split()
+        """Analisis tingkat 'kemanusiaan' teks (tokenisasi sekali, satu lintasan)"""
+        sentences = SENTENCE_SPLIT.split(text)
+        
+        lengths = []
+        formal_words_count = filler_count = contraction_count = 0
+        for sentence in sentences:
+            word_count, formal, filler, contraction = self._sentence_stats(sentence)
+            lengths.append(word_count)
+            formal_words_count += formal
+            filler_count += filler
+            contraction_count += contraction
+        total_words = sum(lengths)
         
         metrics = {}
         
         # 1. Hitung rata-rata panjang kalimat (human: 15-25 kata)
-        avg_sentence_length = len(words) / len(sentences) if sentences else 0
+        avg_sentence_length = total_words / len(sentences) if sentences else 0
         metrics['avg_sentence_length'] = avg_sentence_length
-        metrics['sentence_variety'] = self._calculate_sentence_variety(sentences)
+        metrics['sentence_variety'] = self._variety_from_lengths(lengths)
         
         # 2. Hitung penggunaan kata-kata formal
-        formal_words_count = sum(1 for word in words if any(
-            re.search(r'\b' + formal + r'\b', word, re.IGNORECASE) 
-            for formal in self.formal_to_informal.keys()
-        ))
-        metrics['formal_words_ratio'] = formal_words_count / len(words) if words else 0
+        metrics['formal_words_ratio'] = formal_words_count / total_words if total_words else 0
         
         # 3. Hitung penggunaan kata pengisi (transisi) - lebih tinggi = lebih manusiawi
-        filler_count = sum(1 for word in words if word.lower() in self.filler_words)
-        metrics['filler_words_ratio'] = filler_count / len(words) if words else 0
+        metrics['filler_words_ratio'] = filler_count / total_words if total_words else 0
         
         # 4. Hitung kontraksi
-        contraction_count = len(re.findall(r"\b(nggak|gak|itu|sih|dong|kan)\b", text, re.IGNORECASE))
         metrics['contraction_count'] = contraction_count
         
         # 5. Skor kemanusiaan keseluruhan (0-100)
@@ -241,12 +646,19 @@ class AItoHumanConverter:
         
         return metrics
     
+    def incremental_analyzer(self, text: str = '') -> 'IncrementalAnalyzer':
+        """Analyzer yang bisa diperbarui setelah teks diedit"""
+        return IncrementalAnalyzer(self, text)
+    
     def _calculate_sentence_variety(self, sentences: List[str]) -> float:
         """Hitung variasi struktur kalimat"""
-        if len(sentences) < 2:
+        return self._variety_from_lengths([len(s.split()) for s in sentences])
+    
+    def _variety_from_lengths(self, lengths: List[int]) -> float:
+        """Hitung variasi struktur kalimat dari panjang tiap kalimat"""
+        if len(lengths) < 2:
             return 0
         
-        lengths = [len(s.split()) for s in sentences]
         avg_length = sum(lengths) / len(lengths)
         
         # Hitung variance
@@ -287,35 +699,259 @@ class AItoHumanConverter:
         
         return min(max(score, 0), 100)
     
+    def add_stage(self, name: str, func: Callable, label: str = '', after: Optional[str] = None):
+        """Tambahkan tahap fungsi(doc, state) ke pipeline (di akhir atau setelah tahap 'after')"""
+        index = len(self.stages)
+        if after is not None:
+            index = [stage[0] for stage in self.stages].index(after) + 1
+        self.stages.insert(index, (name, label or name, func))
+    
+    def remove_stage(self, name: str):
+        """Hapus tahap dari pipeline"""
+        self.stages = [stage for stage in self.stages if stage[0] != name]
+    
+    def _run_stages(self, doc: 'Document', state: ConversionState, stages: list, level: int = logging.DEBUG):
+        """Jalankan tahap-tahap pipeline dan catat statistiknya"""
+        stats = self.stats
+        trace_memory = stats.trace_memory
+        if trace_memory:
+            import tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+        
+        size = doc.token_count()
+        for number, (name, label, stage) in stages:
+            logger.log(level, '[%d] %s...', number, label)
+            if trace_memory:
+                tracemalloc.reset_peak()
+                base = tracemalloc.get_traced_memory()[0]
+            start = time.perf_counter()
+            stage(doc, state)
+            seconds = time.perf_counter() - start
+            
+            stage_stats = stats.stage(name)
+            stage_stats.calls += 1
+            stage_stats.seconds += seconds
+            stage_stats.tokens_in += size
+            size = doc.token_count()
+            stage_stats.tokens_out += size
+            if trace_memory:
+                stage_stats.peak_bytes = max(stage_stats.peak_bytes, tracemalloc.get_traced_memory()[1] - base)
+    
+    def _numbered_stages(self) -> list:
+        """Tahap pipeline beserta nomor urutnya (1..n)"""
+        return list(enumerate(self.stages, 1))
+    
+    def _convert_doc(self, doc: 'Document', state: ConversionState, level: int = logging.DEBUG) -> str:
+        """Jalankan seluruh pipeline pada satu Document"""
+        profiler = self.stats.profiler
+        if profiler:
+            profiler.enable()
+        try:
+            self._run_stages(doc, state, self._numbered_stages(), level)
+        finally:
+            if profiler:
+                profiler.disable()
+        self.stats.conversions += 1
+        return doc.render()
+    
     def convert(self, text: str) -> str:
         """Konversi teks AI menjadi teks manusiawi"""
-        print("[*] Memproses teks...")
+        logger.info("[*] Memproses teks...")
         
-        # Langkah-langkah konversi
-        print("[1] Menghapus pola repetitif...")
-        text = self.remove_repetitive_patterns(text)
+        # Teks dipecah sekali menjadi Document lalu dipakai oleh semua tahap
+        return self._convert_doc(Document.from_text(text), ConversionState(), logging.INFO)
+    
+    def convert_chunk(self, text: str, rng: Optional[random.Random] = None) -> str:
+        """Konversi satu chunk secara mandiri (untuk worker paralel)"""
+        return self._convert_doc(Document.from_text(text), ConversionState(rng=rng))
+    
+    def count_overused_words(self, chunks: Iterable[str]) -> Counter:
+        """Lintasan pertama streaming: hitung kata berlebihan setelah tahap 1-2"""
+        state = ConversionState()
+        overused_words = self.overused_words
+        word_count = Counter()
+        
+        for chunk in chunks:
+            doc = Document.from_text(chunk)
+            self._remove_repetitive_patterns_doc(doc, state)
+            self._replace_formal_words_doc(doc)
+            word_count.update(
+                word for tokens in doc.sentences for word in tokens
+                if word.lower().rstrip('.,!?;:') in overused_words
+            )
+        
+        return word_count
+    
+    def convert_stream(self, chunks: Iterable[str], word_count: Optional[Counter] = None) -> Iterator[str]:
+        """Konversi streaming: chunk teks (dipotong di batas kalimat) masuk, potongan hasil keluar.
         
-        print("[2] Mengganti kata-kata formal...")
-        text = self.replace_formal_words(text)
+        Potongan hasil digabung dengan spasi. Dengan word_count dari count_overused_words()
+        hasilnya sama dengan convert() atas seluruh teks; tanpa word_count kata berlebihan
+        dihitung per chunk.
+        """
+        state = ConversionState(word_count)
+        stages = self._numbered_stages()
+        split = [stage[1][0] for stage in stages].index(self.STREAM_SPLIT_STAGE) + 1
+        
+        for chunk in chunks:
+            doc = Document.from_text(chunk)
+            self._run_stages(doc, state, stages[:split])
+            
+            # Sambungkan sisa kalimat chunk sebelumnya, lalu tahan kalimat yang belum selesai
+            if state.carry:
+                doc.sentences[0] = state.carry + doc.sentences[0]
+            last = doc.sentences[-1]
+            state.carry = doc.sentences.pop() if not last or last[-1][-1] not in SENTENCE_END else []
+            
+            if doc.sentences:
+                self._run_stages(doc, state, stages[split:])
+                yield doc.render()
+        
+        if state.carry:
+            doc = Document([state.carry])
+            self._run_stages(doc, state, stages[split:])
+            yield doc.render()
+        self.stats.conversions += 1
+    
+    def convert_file(self, input_path: str, output_path: str, chunk_size: int = CHUNK_SIZE):
+        """Konversi file besar dengan memori terbatas (dua lintasan baca, tulis bertahap)"""
+        with open(input_path, 'r', encoding='utf-8') as f:
+            word_count = self.count_overused_words(iter_sentence_chunks(f, chunk_size))
         
-        print("[3] Menghapus penggunaan kata berlebihan...")
-        text = self.remove_overuse_of_certain_words(text)
+        with open(input_path, 'r', encoding='utf-8') as f, open(output_path, 'w', encoding='utf-8') as out:
+            separator = ''
+            for piece in self.convert_stream(iter_sentence_chunks(f, chunk_size), word_count):
+                out.write(separator)
+                out.write(piece)
+                separator = ' '
+
+
+class IncrementalAnalyzer:
+    """analyze_humanness yang bisa diperbarui: statistik per kalimat dan jumlah berjalan.
+    
+    edit() memecah ulang dan menghitung ulang hanya kalimat di sekitar bagian yang
+    diedit; update() menerima teks utuh dan memakai ulang kalimat awal/akhir yang sama.
+    Rata-rata dan variance dihitung dari jumlah berjalan (jumlah dan jumlah kuadrat
+    panjang kalimat). Variance di sini eksak, sedangkan analyze_humanness memakai
+    float dua lintasan, jadi tepat di batas pembulatan skor bisa berbeda 1 poin.
+    """
+    
+    def __init__(self, converter: AItoHumanConverter, text: str = ''):
+        self.converter = converter
+        self.text = ''
+        self.sentences = ['']
+        # Posisi awal setiap kalimat di dalam teks
+        self.offsets = [0]
+        self.stats = [converter._sentence_stats('')]
+        self.total_words = self.length_squares = 0
+        self.formal_count = self.filler_count = self.contraction_count = 0
+        # Jumlah kalimat yang dihitung ulang pada perubahan terakhir
+        self.rescored = 0
+        self.update(text)
+    
+    def _apply(self, stats, sign: int):
+        """Tambah (sign=1) atau kurangi (sign=-1) statistik kalimat dari jumlah berjalan"""
+        for words, formal, filler, contraction in stats:
+            self.total_words += sign * words
+            self.length_squares += sign * words * words
+            self.formal_count += sign * formal
+            self.filler_count += sign * filler
+            self.contraction_count += sign * contraction
+    
+    @staticmethod
+    def _split(text: str, base: int = 0) -> Tuple[List[str], List[int]]:
+        """Kalimat (sama dengan analyze_humanness) beserta posisi awalnya"""
+        return SENTENCE_SPLIT.split(text), [base] + [base + m.end() for m in SENTENCE_SPLIT.finditer(text)]
+    
+    def _splice(self, start: int, end: int, sentences: List[str], offsets: List[int]):
+        """Ganti kalimat[start:end]; kalimat awal/akhir yang sama tidak dihitung ulang"""
+        old = self.sentences
+        first, old_last, new_last = 0, end - start, len(sentences)
+        while first < min(old_last, new_last) and old[start + first] == sentences[first]:
+            first += 1
+        while old_last > first and new_last > first and old[start + old_last - 1] == sentences[new_last - 1]:
+            old_last -= 1
+            new_last -= 1
         
-        print("[4] Menambahkan kontraksi...")
-        text = self.add_contractions(text)
+        sentence_stats = self.converter._sentence_stats
+        added = [sentence_stats(sentence) for sentence in sentences[first:new_last]]
+        self._apply(self.stats[start + first:start + old_last], -1)
+        self._apply(added, 1)
+        self.stats[start + first:start + old_last] = added
+        self.sentences[start:end] = sentences
+        self.offsets[start:end] = offsets
+        self.rescored = len(added)
+    
+    def update(self, text: str) -> dict:
+        """Ganti seluruh teks; hanya kalimat yang berubah dihitung ulang"""
+        sentences, offsets = self._split(text)
+        self._splice(0, len(self.sentences), sentences, offsets)
+        self.text = text
+        return self.metrics()
+    
+    def edit(self, start: int, end: int, replacement: str) -> dict:
+        """Ganti teks[start:end] dengan replacement; waktu sebanding dengan ukuran edit"""
+        text = self.text
+        if not 0 <= start <= end <= len(text):
+            raise ValueError('Rentang edit di luar teks')
+        new_text = text[:start] + replacement + text[end:]
+        delta = len(replacement) - (end - start)
+        offsets = self.offsets
         
-        print("[5] Memvariasikan struktur kalimat...")
-        text = self.vary_sentence_structure(text)
+        # Ambil satu kalimat utuh sebelum dan sesudah bagian yang diedit, karena
+        # batas kalimat di sekitar edit bisa bergeser (kalimat menyatu/terpecah)
+        first = max(bisect_right(offsets, start) - 2, 0)
+        last = min(bisect_right(offsets, end) + 1, len(offsets))
+        region_start = offsets[first]
+        if last < len(offsets):
+            region_end = offsets[last - 1] + len(self.sentences[last - 1]) + delta
+        else:
+            region_end = len(new_text)
         
-        print("[6] Menambahkan sentuhan informal...")
-        text = self.add_informal_touches(text)
+        sentences, new_offsets = self._split(new_text[region_start:region_end], region_start)
+        if delta:
+            offsets[last:] = [offset + delta for offset in offsets[last:]]
+        self._splice(first, last, sentences, new_offsets)
+        self.text = new_text
+        return self.metrics()
+    
+    def metrics(self) -> dict:
+        """Metrik dengan kunci yang sama seperti analyze_humanness"""
+        count = len(self.sentences)
+        total_words = self.total_words
         
-        return text
+        metrics = {}
+        metrics['avg_sentence_length'] = total_words / count if count else 0
+        if count < 2:
+            metrics['sentence_variety'] = 0
+        else:
+            # Variance populasi dari jumlah berjalan (pembilang bilangan bulat, eksak)
+            variance = (count * self.length_squares - total_words * total_words) / (count * count)
+            metrics['sentence_variety'] = min(variance / 100, 1.0)
+        metrics['formal_words_ratio'] = self.formal_count / total_words if total_words else 0
+        metrics['filler_words_ratio'] = self.filler_count / total_words if total_words else 0
+        metrics['contraction_count'] = self.contraction_count
+        metrics['humanness_score'] = self.converter._calculate_humanness_score(metrics)
+        return metrics
 
 
-def main():
+def main(argv=None):
     """Main program"""
-    converter = AItoHumanConverter()
+    import argparse
+    parser = argparse.ArgumentParser(description='Konversi teks AI menjadi teks yang lebih manusiawi')
+    parser.add_argument('--verbose', '-v', action='store_true', help='tampilkan progres tiap tahap konversi')
+    parser.add_argument('--profile', nargs='?', const='', metavar='FILE',
+                        help='tampilkan statistik per tahap + cProfile/tracemalloc; simpan .prof ke FILE jika diberikan')
+    parser.add_argument('--frequency-model', metavar='FILE',
+                        help='model frekuensi korpus untuk menentukan kata berlebihan (diperbarui setiap konversi)')
+    args = parser.parse_args(argv)
+    
+    if args.verbose:
+        logging.basicConfig(level=logging.INFO, format='%(message)s')
+    profiling = args.profile is not None
+    stats = ConversionStats(profile=True, trace_memory=True) if profiling else None
+    converter = None
     
     print("\n" + "="*60)
     print("AI TEXT TO HUMAN TEXT CONVERTER")
@@ -328,6 +964,13 @@ def main():
     while True:
         choice = input("\nPilih opsi (1/2/3): ").strip()
         
+        if choice in ('1', '2') and converter is None:
+            # Converter (dan tabel katanya) baru dibuat saat pertama dibutuhkan
+            converter = AItoHumanConverter(stats=stats)
+            if args.frequency_model:
+                from ai_to_human_frequency import FrequencyModel
+                converter.frequency_model = FrequencyModel.load_or_create(args.frequency_model)
+        
         if choice == '1':
             print("\n[Masukkan teks AI (ketik 'END' di baris baru untuk selesai)]")
             lines = []
@@ -351,6 +994,10 @@ def main():
                 
                 # Konversi
                 human_text = converter.convert(ai_text)
+                if profiling:
+                    print_stats(converter.stats, args.profile)
+                if args.frequency_model:
+                    converter.frequency_model.save(args.frequency_model)
                 
                 # Analisis teks hasil konversi
                 print("\n[ANALISIS TEKS HASIL KONVERSI]")
@@ -383,6 +1030,20 @@ def main():
         elif choice == '2':
             filepath = input("Masukkan path file: ").strip()
             try:
+                if os.path.getsize(filepath) > STREAM_THRESHOLD:
+                    # File besar: konversi per chunk langsung ke file tanpa memuat seluruh teks
+                    output_file = filepath.replace('.txt', '_human.txt')
+                    if output_file == filepath:
+                        output_file = filepath + '_human.txt'
+                    print(f"\n[*] File besar, konversi streaming ke {output_file}...")
+                    converter.convert_file(filepath, output_file)
+                    if profiling:
+                        print_stats(converter.stats, args.profile)
+                    if args.frequency_model:
+                        converter.frequency_model.save(args.frequency_model)
+                    print(f"✓ Tersimpan ke {output_file}")
+                    continue
+                
                 with open(filepath, 'r', encoding='utf-8') as f:
                     ai_text = f.read()
                 
@@ -397,6 +1058,10 @@ def main():
                 
                 # Konversi
                 human_text = converter.convert(ai_text)
+                if profiling:
+                    print_stats(converter.stats, args.profile)
+                if args.frequency_model:
+                    converter.frequency_model.save(args.frequency_model)
                 
                 # Analisis teks hasil konversi
                 print("\n[ANALISIS TEKS HASIL KONVERSI]")
@@ -430,6 +1095,17 @@ def main():
             print("Opsi tidak valid. Coba lagi.")
 
 
+def print_stats(stats: ConversionStats, profile_path: str = ''):
+    """Print statistik per tahap lalu kosongkan untuk konversi berikutnya"""
+    print("\n[STATISTIK TAHAP]")
+    print(stats.report())
+    print(stats.profile_report())
+    if profile_path:
+        stats.dump_profile(profile_path)
+        print(f"✓ Profil cProfile tersimpan ke {profile_path}")
+    stats.reset()
+
+
 def print_metrics(metrics: dict, label: str):
     """Print analisis metrics"""
     print(f"\n{label}:")
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+KONVERSI BATCH SATU FOLDER AI KE TEKS MANUSIAWI
+================================================
+Mengkonversi semua file teks dalam satu pohon folder tanpa interaksi:
+✓ Filter file dengan pola glob (--include / --exclude)
+✓ Hasil ditulis ke folder output dengan struktur folder yang sama
+✓ File yang isinya tidak berubah sejak run sebelumnya dilewati (hash SHA-256)
+✓ Satu laporan JSONL/CSV berisi metrik analyze_humanness sebelum & sesudah
+✓ Satu converter dan satu process pool untuk semua file
+✓ Model frekuensi korpus (opsional) diperbarui dengan setiap file yang dikonversi
+
+Status file dicatat di <output>/.ai_to_human_manifest.json sehingga
+baris laporan file yang dilewati tetap berisi metrik dari run sebelumnya.
+Manifest juga mencatat path dan SHA-256 model frekuensi yang disimpan run
+terakhir; jika model ditambah, dihapus atau diubah di luar run ini, semua
+file dikonversi ulang.
+
+Contoh:
+    python ai_to_human_batch.py artikel/ hasil/ --include "*.txt" "*.md" --workers 8
+    python ai_to_human_batch.py artikel/ hasil/ --report laporan.csv
+"""
+
+import argparse
+import csv
+import fnmatch
+import hashlib
+import json
+import os
+import time
+from collections import deque
+from typing import Iterator, List, Optional
+
+from ai_to_human import AItoHumanConverter
+from ai_to_human_frequency import FrequencyModel
+from ai_to_human_parallel import CHUNK_SIZE, ParallelConverter
+
+MANIFEST_FILE = '.ai_to_human_manifest.json'
+MANIFEST_VERSION = 1
+
+# Manifest disimpan ulang setiap sekian file agar run yang terputus bisa dilanjutkan
+MANIFEST_SAVE_EVERY = 100
+
+# Urutan kolom metrik pada laporan
+METRIC_KEYS = (
+    'humanness_score', 'avg_sentence_length', 'sentence_variety',
+    'formal_words_ratio', 'filler_words_ratio', 'contraction_count'
+)
+REPORT_FIELDS = ['path', 'status', 'sha256', 'chars', 'error'] + \
+    [f'{when}_{key}' for when in ('before', 'after') for key in METRIC_KEYS]
+
+
+def matches(rel_path: str, patterns: List[str]) -> bool:
+    """Cocokkan path relatif atau nama file dengan salah satu pola glob"""
+    name = os.path.basename(rel_path)
+    return any(fnmatch.fnmatch(rel_path, p) or fnmatch.fnmatch(name, p) for p in patterns)
+
+
+def find_files(input_dir: str, include: List[str], exclude: List[str], skip_dir: Optional[str] = None) -> Iterator[str]:
+    """Path relatif (pemisah '/') semua file yang lolos filter, terurut"""
+    skip_dir = os.path.abspath(skip_dir) if skip_dir else None
+    for root, dirs, files in os.walk(input_dir):
+        # Jangan masuk ke folder output jika berada di dalam folder input
+        dirs[:] = sorted(d for d in dirs if os.path.abspath(os.path.join(root, d)) != skip_dir)
+        for name in sorted(files):
+            rel_path = os.path.relpath(os.path.join(root, name), input_dir).replace(os.sep, '/')
+            if matches(rel_path, include) and not matches(rel_path, exclude):
+                yield rel_path
+
+
+def file_sha256(path: Optional[str]) -> Optional[str]:
+    """SHA-256 isi file, None jika path kosong atau file tidak ada"""
+    if not path:
+        return None
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def load_manifest(path: str, seed: int, chunk_size: int, frequency_model_path: Optional[str] = None) -> dict:
+    """Muat manifest; dianggap kosong jika tidak ada, dibuat dengan seed/chunk/model frekuensi
+    berbeda, atau file model frekuensi berubah sejak run terakhir"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, ValueError):
+        manifest = None
+    settings = {
+        'seed': seed, 'chunk_size': chunk_size,
+        'frequency_model': os.path.abspath(frequency_model_path) if frequency_model_path else None
+    }
+    if (not manifest or manifest.get('versi') != MANIFEST_VERSION or manifest.get('settings') != settings
+            or manifest.get('frequency_model_sha256') != file_sha256(frequency_model_path)):
+        manifest = {'versi': MANIFEST_VERSION, 'settings': settings, 'files': {}}
+    return manifest
+
+
+def save_manifest(manifest: dict, path: str):
+    """Simpan manifest secara atomik"""
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False)
+    os.replace(temp_path, path)
+
+
+class ReportWriter:
+    """Penulis laporan JSONL atau CSV (ditentukan dari ekstensi file)"""
+
+    def __init__(self, path: str):
+        self.file = open(path, 'w', encoding='utf-8', newline='')
+        self.csv = None
+        if path.lower().endswith('.csv'):
+            self.csv = csv.DictWriter(self.file, REPORT_FIELDS)
+            self.csv.writeheader()
+
+    def write(self, row: dict):
+        if self.csv:
+            flat = {k: row.get(k) for k in ('path', 'status', 'sha256', 'chars', 'error')}
+            for when in ('before', 'after'):
+                for key, value in (row.get(when) or {}).items():
+                    flat[f'{when}_{key}'] = value
+            self.csv.writerow(flat)
+        else:
+            self.file.write(json.dumps(row, ensure_ascii=False) + '\n')
+
+    def close(self):
+        self.file.close()
+
+
+def pick_metrics(metrics: dict) -> dict:
+    """Metrik analyze_humanness dalam urutan kolom laporan"""
+    return {key: metrics[key] for key in METRIC_KEYS}
+
+
+def convert_directory(input_dir: str, output_dir: str, include: List[str], exclude: List[str],
+                      report_path: str, workers: Optional[int] = None, seed: int = 0,
+                      chunk_size: int = CHUNK_SIZE, force: bool = False,
+                      frequency_model_path: Optional[str] = None) -> dict:
+    """Konversi semua file yang cocok; mengembalikan ringkasan jumlah per status"""
+    os.makedirs(output_dir, exist_ok=True)
+    manifest_path = os.path.join(output_dir, MANIFEST_FILE)
+    manifest = load_manifest(manifest_path, seed, chunk_size, frequency_model_path)
+    entries = manifest['files']
+    # Model di memori berubah selama run: sampai model tersimpan, manifest tidak
+    # cocok dengan file model mana pun (run yang terputus mengkonversi ulang semua)
+    manifest['frequency_model_sha256'] = None
+
+    analyzer = AItoHumanConverter(seed)
+    frequency_model = FrequencyModel.load_or_create(frequency_model_path) if frequency_model_path else None
+    report = ReportWriter(report_path)
+    summary = {'converted': 0, 'skipped': 0, 'error': 0, 'score_gain': 0.0}
+    # File yang sedang dikonversi di pool: (rel_path, output_path, row)
+    pending = deque()
+
+    def jobs():
+        """Baca file satu per satu; yang tidak berubah langsung dilaporkan sebagai 'skipped'"""
+        for rel_path in find_files(input_dir, include, exclude, output_dir):
+            output_path = os.path.join(output_dir, *rel_path.split('/'))
+            try:
+                with open(os.path.join(input_dir, *rel_path.split('/')), 'rb') as f:
+                    data = f.read()
+                digest = hashlib.sha256(data).hexdigest()
+                entry = entries.get(rel_path)
+                if not force and entry and entry['sha256'] == digest and os.path.exists(output_path):
+                    report.write(dict(entry['row'], status='skipped'))
+                    summary['skipped'] += 1
+                    continue
+                text = data.decode('utf-8')
+            except (OSError, UnicodeDecodeError) as e:
+                report.write({'path': rel_path, 'status': 'error', 'error': f'{type(e).__name__}: {e}'})
+                summary['error'] += 1
+                continue
+
+            row = {
+                'path': rel_path, 'status': 'converted', 'sha256': digest, 'chars': len(text),
+                'before': pick_metrics(analyzer.analyze_humanness(text))
+            }
+            if frequency_model is not None:
+                frequency_model.update_text(text)
+            pending.append((rel_path, output_path, row))
+            yield rel_path, text
+
+    started = time.perf_counter()
+    try:
+        with ParallelConverter(seed, workers, chunk_size, frequency_model) as converter:
+            for human_text in converter.imap_keyed(jobs()):
+                rel_path, output_path, row = pending.popleft()
+                os.makedirs(os.path.dirname(output_path), exist_ok=True)
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    f.write(human_text)
+                row['after'] = pick_metrics(analyzer.analyze_humanness(human_text))
+                report.write(row)
+                entries[rel_path] = {'sha256': row['sha256'], 'row': row}
+                summary['converted'] += 1
+                summary['score_gain'] += row['after']['humanness_score'] - row['before']['humanness_score']
+                if summary['converted'] % MANIFEST_SAVE_EVERY == 0:
+                    save_manifest(manifest, manifest_path)
+    finally:
+        report.close()
+        if frequency_model is not None:
+            frequency_model.save(frequency_model_path)
+            manifest['frequency_model_sha256'] = file_sha256(frequency_model_path)
+        save_manifest(manifest, manifest_path)
+
+    summary['seconds'] = time.perf_counter() - started
+    return summary
+
+
+def main(argv=None):
+    """Main program konversi batch"""
+    parser = argparse.ArgumentParser(description='Konversi batch semua file teks dalam satu folder')
+    parser.add_argument('input_dir', help='folder sumber (dibaca rekursif)')
+    parser.add_argument('output_dir', help='folder hasil konversi')
+    parser.add_argument('--include', nargs='+', default=['*.txt'], help='pola glob file yang diproses (default: *.txt)')
+    parser.add_argument('--exclude', nargs='+', default=[], help='pola glob file yang dilewati')
+    parser.add_argument('--report', help='file laporan .jsonl atau .csv (default: <output_dir>/report.jsonl)')
+    parser.add_argument('--workers', type=int, default=None, help='jumlah proses worker (default: jumlah CPU)')
+    parser.add_argument('--seed', type=int, default=0, help='seed konversi (default: 0)')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help='ukuran chunk dalam karakter')
+    parser.add_argument('--force', action='store_true', help='konversi ulang walaupun file tidak berubah')
+    parser.add_argument('--frequency-model', metavar='FILE',
+                        help='model frekuensi korpus untuk kata berlebihan (dibuat/diperbarui)')
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.input_dir):
+        parser.error(f'folder tidak ditemukan: {args.input_dir}')
+    report_path = args.report or os.path.join(args.output_dir, 'report.jsonl')
+
+    summary = convert_directory(args.input_dir, args.output_dir, args.include, args.exclude, report_path,
+                                args.workers, args.seed, args.chunk_size, args.force,
+                                args.frequency_model)
+
+    print(f"✓ Dikonversi: {summary['converted']}, dilewati: {summary['skipped']}, error: {summary['error']} "
+          f"({summary['seconds']:.2f} detik)")
+    if summary['converted']:
+        print(f"✓ Rata-rata kenaikan Humanness Score: {summary['score_gain'] / summary['converted']:+.1f}")
+    print(f'✓ Laporan tersimpan ke {report_path}')
+
+
+if __name__ == '__main__':
+    main()
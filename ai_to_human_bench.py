@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK AI TEXT TO HUMAN TEXT CONVERTER
+==========================================
+Mengukur throughput dan memori ai_to_human.py dengan teks sintetis
+mirip bahasa Indonesia (1 KB sampai 100 MB):
+✓ Frasa formal, kontraksi dan kata berlebihan diambil dari kamus converter
+✓ Kata/detik dan puncak memori untuk convert, setiap tahap pipeline,
+  dan analyze_humanness
+✓ Seed tetap sehingga teks dan hasil konversi bisa diulang
+✓ Hasil JSON dibandingkan dengan baseline; perlambatan ditandai
+
+Teks lebih besar dari STREAM_THRESHOLD dikonversi lewat convert_file
+(streaming) dan dianalisis per chunk agar memori tetap terbatas.
+
+Contoh:
+    python ai_to_human_bench.py --sizes 1KB 1MB 10MB --json hasil.json
+    python ai_to_human_bench.py --sizes 100MB --no-memory
+    python ai_to_human_bench.py --baseline baseline.json   # exit code 1 jika ada regresi
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import re
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+from ai_to_human import STREAM_THRESHOLD, AItoHumanConverter, ConversionStats, iter_sentence_chunks
+
+# Ukuran default (byte)
+SIZES_DEFAULT = ['1KB', '100KB', '1MB', '10MB']
+
+# Perlambatan (atau kenaikan memori) di atas batas ini dianggap regresi
+TOLERANCE_DEFAULT = 0.20
+
+# Pengukuran dengan durasi di bawah ini terlalu berisik untuk dibandingkan (detik)
+MIN_COMPARABLE_SECONDS = 0.005
+
+# Kata umum untuk kalimat sintetis
+VOCABULARY = [
+    'saya', 'kamu', 'kami', 'mereka', 'dia', 'ini', 'itu', 'dan', 'atau', 'di', 'ke', 'dari',
+    'untuk', 'dengan', 'pada', 'karena', 'jika', 'tetapi', 'juga', 'sudah', 'belum', 'masih',
+    'bisa', 'harus', 'ingin', 'perlu', 'banyak', 'sedikit', 'baru', 'lama', 'besar', 'kecil',
+    'orang', 'rumah', 'kota', 'desa', 'sekolah', 'kantor', 'pasar', 'jalan', 'waktu', 'hari',
+    'tahun', 'data', 'hasil', 'proses', 'sistem', 'masyarakat', 'pemerintah', 'penelitian',
+    'teknologi', 'informasi', 'pendidikan', 'kesehatan', 'ekonomi', 'lingkungan', 'program',
+    'membuat', 'melihat', 'memberikan', 'menggunakan', 'menjadi', 'melakukan', 'mengembangkan',
+    'meningkatkan', 'menunjukkan', 'mendapatkan', 'penting', 'baik', 'buruk', 'cepat', 'lambat',
+    'tidak', 'bahwa', 'secara', 'lebih', 'paling', 'setiap', 'semua', 'beberapa', 'berbagai'
+]
+
+# Peluang sebuah kalimat mendapat frasa formal dari kamus
+PLANT_PROBABILITY = 0.3
+
+_SIZE_PATTERN = re.compile(r'^(\d+(?:\.\d+)?)\s*(B|KB|MB|GB)?$', re.IGNORECASE)
+_SIZE_UNITS = {'B': 1, 'KB': 1024, 'MB': 1024 ** 2, 'GB': 1024 ** 3}
+
+
+def parse_size(value: str) -> int:
+    """'1KB', '10MB', '512' -> jumlah byte"""
+    match = _SIZE_PATTERN.match(value.strip())
+    if not match:
+        raise argparse.ArgumentTypeError(f'ukuran tidak valid: {value}')
+    return int(float(match.group(1)) * _SIZE_UNITS[(match.group(2) or 'B').upper()])
+
+
+def format_size(size: int) -> str:
+    for unit in ('GB', 'MB', 'KB'):
+        if size >= _SIZE_UNITS[unit] and size % _SIZE_UNITS[unit] == 0:
+            return f'{size // _SIZE_UNITS[unit]}{unit}'
+    return f'{size}B'
+
+
+def planted_phrases(converter: AItoHumanConverter) -> list:
+    """Frasa formal, pola kontraksi dan kata berlebihan dari kamus converter"""
+    phrases = list(converter.formal_to_informal) + list(converter.phrase_replacements)
+    phrases += [re.sub(r'\\b', '', pattern).replace(r'\s+', ' ') for pattern in converter.contractions]
+    phrases += list(converter.overused_words)
+    return phrases
+
+
+def generate_sentences(rng: random.Random, phrases: list):
+    """Kalimat sintetis tanpa henti"""
+    vocabulary = VOCABULARY
+    while True:
+        words = rng.choices(vocabulary, k=rng.randint(5, 30))
+        if rng.random() < PLANT_PROBABILITY:
+            words.insert(rng.randrange(len(words) + 1), rng.choice(phrases))
+        if len(words) > 8 and rng.random() < 0.3:
+            comma = rng.randrange(2, len(words) - 2)
+            words[comma] += ','
+        sentence = ' '.join(words)
+        yield sentence[0].upper() + sentence[1:] + rng.choice('....?!')
+
+
+def write_text(path: str, size: int, seed: int, phrases: list) -> int:
+    """Tulis teks sintetis sekitar size byte ke file, mengembalikan jumlah kata"""
+    rng = random.Random(seed)
+    sentences = generate_sentences(rng, phrases)
+    written = words = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        while written < size:
+            block = []
+            block_size = 0
+            while block_size < 64 * 1024 and written + block_size < size:
+                sentence = next(sentences)
+                block.append(sentence)
+                block_size += len(sentence.encode('utf-8')) + 1
+                words += sentence.count(' ') + 1
+            text = ' '.join(block) + ' '
+            f.write(text)
+            written += block_size
+    return words
+
+
+def rate(words: int, seconds: float) -> float:
+    return words / seconds if seconds else 0.0
+
+
+def measure(function, trace_memory: bool):
+    """(hasil, detik, puncak memori byte) untuk satu panggilan"""
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    result = function()
+    seconds = time.perf_counter() - start
+    peak = 0
+    if trace_memory:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return result, seconds, peak
+
+
+def stage_results(stats: ConversionStats, memory_stats: ConversionStats = None) -> dict:
+    """Kata/detik (token masuk per detik) dan puncak memori setiap tahap"""
+    stages = {}
+    for name, stage in stats.stages.items():
+        stages[name] = {
+            'seconds': stage.seconds,
+            'words_per_s': rate(stage.tokens_in, stage.seconds),
+            'peak_bytes': memory_stats.stages[name].peak_bytes if memory_stats and name in memory_stats.stages else None
+        }
+    return stages
+
+
+def run_size(size: int, seed: int, folder: str, with_memory: bool) -> dict:
+    """Benchmark convert dan analyze_humanness untuk satu ukuran teks"""
+    phrases = planted_phrases(AItoHumanConverter(seed))
+    input_path = os.path.join(folder, f'input_{size}.txt')
+    output_path = os.path.join(folder, f'output_{size}.txt')
+    words = write_text(input_path, size, seed, phrases)
+    streaming = size > STREAM_THRESHOLD
+    result = {'size': format_size(size), 'size_bytes': size, 'words': words, 'streaming': streaming}
+
+    def run_convert(stats):
+        converter = AItoHumanConverter(seed, stats)
+        if streaming:
+            converter.convert_file(input_path, output_path)
+            return None
+        with open(input_path, 'r', encoding='utf-8') as f:
+            text = f.read()
+        return converter.convert(text)
+
+    def run_analyze():
+        converter = AItoHumanConverter(seed)
+        with open(input_path, 'r', encoding='utf-8') as f:
+            if streaming:
+                for chunk in iter_sentence_chunks(f):
+                    converter.analyze_humanness(chunk)
+                return None
+            return converter.analyze_humanness(f.read())
+
+    # Lintasan waktu (tanpa tracemalloc) dan lintasan memori terpisah
+    stats = ConversionStats()
+    _, seconds, _ = measure(lambda: run_convert(stats), False)
+    memory_stats = ConversionStats(trace_memory=True) if with_memory else None
+    peak = measure(lambda: run_convert(memory_stats), True)[2] if with_memory else None
+    result['convert'] = {
+        'seconds': seconds, 'words_per_s': rate(words, seconds), 'peak_bytes': peak,
+        'stages': stage_results(stats, memory_stats)
+    }
+
+    _, seconds, _ = measure(run_analyze, False)
+    peak = measure(run_analyze, True)[2] if with_memory else None
+    result['analyze'] = {'seconds': seconds, 'words_per_s': rate(words, seconds), 'peak_bytes': peak}
+    return result
+
+
+def iter_metrics(result: dict):
+    """(nama metrik, detik, kata/detik, puncak memori) dari satu hasil ukuran"""
+    yield 'convert', result['convert']['seconds'], result['convert']['words_per_s'], result['convert']['peak_bytes']
+    for name, stage in result['convert']['stages'].items():
+        yield f'convert.{name}', stage['seconds'], stage['words_per_s'], stage['peak_bytes']
+    yield 'analyze', result['analyze']['seconds'], result['analyze']['words_per_s'], result['analyze']['peak_bytes']
+
+
+def compare(results: list, baseline: list, tolerance: float) -> list:
+    """Daftar regresi dibanding baseline (kata/detik turun atau memori naik melebihi toleransi)"""
+    baseline_by_size = {item['size_bytes']: item for item in baseline}
+    regressions = []
+    for result in results:
+        old = baseline_by_size.get(result['size_bytes'])
+        if not old:
+            continue
+        old_metrics = {name: (seconds, speed, peak) for name, seconds, speed, peak in iter_metrics(old)}
+        for name, seconds, speed, peak in iter_metrics(result):
+            if name not in old_metrics:
+                continue
+            old_seconds, old_speed, old_peak = old_metrics[name]
+            label = f"{result['size']} {name}"
+            if min(seconds, old_seconds) >= MIN_COMPARABLE_SECONDS and speed < old_speed * (1 - tolerance):
+                regressions.append(f'{label}: {old_speed:,.0f} → {speed:,.0f} kata/detik ({speed / old_speed - 1:+.0%})')
+            if peak and old_peak and peak > old_peak * (1 + tolerance):
+                regressions.append(f'{label}: memori {old_peak / 1024:,.0f} → {peak / 1024:,.0f} KB ({peak / old_peak - 1:+.0%})')
+    return regressions
+
+
+def print_results(results: list):
+    """Tampilkan hasil benchmark dalam format tabel"""
+    print('\n' + '=' * 78)
+    print(f"{'Ukuran':>8} {'Metrik':<32} {'Detik':>10} {'Kata/detik':>13} {'Memori(KB)':>11}")
+    print('=' * 78)
+    for result in results:
+        for name, seconds, speed, peak in iter_metrics(result):
+            memory = f'{peak / 1024:>11,.0f}' if peak is not None else f"{'-':>11}"
+            print(f"{result['size']:>8} {name:<32} {seconds:>10.4f} {speed:>13,.0f} {memory}")
+        print('-' * 78)
+
+
+def main(argv=None):
+    """Main program benchmark"""
+    parser = argparse.ArgumentParser(description='Benchmark ai_to_human.py dengan teks sintetis')
+    parser.add_argument('--sizes', type=parse_size, nargs='+', default=[parse_size(s) for s in SIZES_DEFAULT],
+                        help='ukuran teks, mis. 1KB 1MB 100MB (default: 1KB 100KB 1MB 10MB)')
+    parser.add_argument('--seed', type=int, default=0, help='seed teks dan converter (default: 0)')
+    parser.add_argument('--no-memory', action='store_true', help='lewati pengukuran memori (tracemalloc)')
+    parser.add_argument('--json', metavar='FILE', help='simpan hasil benchmark ke file JSON')
+    parser.add_argument('--baseline', metavar='FILE', help='bandingkan dengan hasil JSON sebelumnya')
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE_DEFAULT,
+                        help='batas perlambatan sebelum ditandai regresi (default: 0.20)')
+    args = parser.parse_args(argv)
+
+    results = []
+    folder = tempfile.mkdtemp(prefix='ai_to_human_bench_')
+    try:
+        for size in args.sizes:
+            print(f'[*] Ukuran {format_size(size)}...')
+            results.append(run_size(size, args.seed, folder, not args.no_memory))
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+    print_results(results)
+
+    if args.json:
+        report = {
+            'meta': {
+                'tanggal': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'python': sys.version.split()[0],
+                'platform': platform.platform(),
+                'seed': args.seed
+            },
+            'results': results
+        }
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f'✓ Hasil tersimpan ke {args.json}')
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline['results'], args.tolerance)
+        if regressions:
+            print(f'\n✗ {len(regressions)} regresi dibanding {args.baseline}:')
+            for line in regressions:
+                print(f'  - {line}')
+            sys.exit(1)
+        print(f'✓ Tidak ada regresi dibanding {args.baseline} (toleransi {args.tolerance:.0%})')
+
+
+if __name__ == '__main__':
+    main()
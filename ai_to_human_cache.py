@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+CACHE HASIL KONVERSI DAN ANALISIS (CONTENT-ADDRESSED)
+======================================================
+Dokumen yang sama (atau hampir sama) sering dikirim ulang. Cache ini
+menghindari menjalankan convert dan analyze_humanness dari awal:
+✓ Kunci = SHA-256(jenis, teks, seed, versi kamus)
+✓ Tier memori: LRU dengan batas jumlah entri
+✓ Tier disk (opsional): file JSON per kunci, dibuang berdasarkan ukuran total
+✓ Memo per kalimat: tahap per-kalimat pipeline (kata formal, kontraksi) dan
+  statistik kalimat analyze_humanness, sehingga dokumen yang berbagi
+  sebagian besar kalimat memakai ulang hasil yang sudah ada
+
+Hasil convert di sini deterministik: RNG tiap dokumen di-seed dari
+(seed, hash teks), jadi teks yang sama selalu menghasilkan teks yang sama.
+
+Contoh:
+    cache = CachedConverter(seed=42, cache_dir='.cache_konversi')
+    human_text, sebelum, sesudah = cache.convert_with_metrics(teks)
+"""
+
+import hashlib
+import json
+import os
+import random
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+
+from ai_to_human import AItoHumanConverter, Document
+
+# Batas default tier memori (entri), tier disk (byte) dan memo kalimat (entri)
+MEMORY_ENTRIES = 1024
+DISK_BYTES = 256 * 1024 * 1024
+SENTENCE_ENTRIES = 100000
+
+# Tahap pipeline yang hasilnya hanya bergantung pada satu kalimat
+SENTENCE_STAGES = ('formal_words', 'contractions')
+
+# Setelah eviction, ukuran disk diturunkan sampai bagian ini dari batas
+DISK_LOW_WATER = 0.9
+
+
+class LRUCache:
+    """Cache LRU sederhana di memori"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key):
+        value = self._data.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        self._data.clear()
+
+
+class DiskCache:
+    """Cache di disk: satu file JSON per kunci, entri terlama dibuang jika ukuran melebihi batas"""
+
+    def __init__(self, directory: str, max_bytes: int = DISK_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+        self.total_bytes = sum(size for _, _, size in self._entries())
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + '.json')
+
+    def _entries(self):
+        """(mtime, path, ukuran) semua entri di disk"""
+        for sub in os.scandir(self.directory):
+            if not sub.is_dir():
+                continue
+            for entry in os.scandir(sub.path):
+                if entry.name.endswith('.json'):
+                    try:
+                        info = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    yield info.st_mtime, entry.path, info.st_size
+
+    def get(self, key: str):
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                value = json.load(f)
+        except (FileNotFoundError, ValueError):
+            self.misses += 1
+            return None
+        # mtime dipakai sebagai waktu akses terakhir untuk eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value):
+        path = self._path(key)
+        data = json.dumps(value, ensure_ascii=False).encode('utf-8')
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Kunci yang ditimpa: ukuran file lama tidak lagi terpakai
+        try:
+            old_size = os.stat(path).st_size
+        except FileNotFoundError:
+            old_size = 0
+        temp_path = f'{path}.{os.getpid()}.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+        self.total_bytes += len(data) - old_size
+        if self.total_bytes > self.max_bytes:
+            self.evict()
+
+    def evict(self):
+        """Buang entri yang paling lama tidak diakses sampai di bawah batas"""
+        entries = sorted(self._entries())
+        total = sum(size for _, _, size in entries)
+        target = self.max_bytes * DISK_LOW_WATER
+        for _, path, size in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+        self.total_bytes = total
+
+
+def memoize_sentence_stage(stage: Callable, cache: LRUCache, name: str) -> Callable:
+    """Bungkus tahap per-kalimat fungsi(doc, state) dengan memo per kalimat"""
+    def run(doc, state=None):
+        sentences = doc.sentences
+        for i, tokens in enumerate(sentences):
+            key = (name, ' '.join(tokens))
+            result = cache.get(key)
+            if result is None:
+                single = Document([tokens])
+                stage(single, state)
+                result = tuple(single.sentences[0])
+                cache.put(key, result)
+            # Salinan list: tahap berikutnya boleh mengubah token kalimat
+            sentences[i] = list(result)
+    return run
+
+
+class CachedConverter:
+    """AItoHumanConverter dengan cache content-addressed untuk convert dan analisis"""
+
+    def __init__(self, seed: int = 0, cache_dir: Optional[str] = None, memory_entries: int = MEMORY_ENTRIES,
+                 disk_bytes: int = DISK_BYTES, sentence_entries: int = SENTENCE_ENTRIES):
+        self.seed = seed
+        self.converter = AItoHumanConverter(seed)
+        self.dictionary_version = self.converter.dictionary_version()
+        self.memory = LRUCache(memory_entries)
+        self.disk = DiskCache(cache_dir, disk_bytes) if cache_dir else None
+        self.sentences = LRUCache(sentence_entries)
+        self._install_sentence_memo()
+
+    def _install_sentence_memo(self):
+        """Pasang memo per kalimat pada tahap pipeline dan statistik kalimat"""
+        converter = self.converter
+        converter.stages = [
+            (name, label, memoize_sentence_stage(stage, self.sentences, name) if name in SENTENCE_STAGES else stage)
+            for name, label, stage in converter.stages
+        ]
+
+        sentence_stats = converter._sentence_stats
+        cache = self.sentences
+
+        def cached_sentence_stats(sentence):
+            key = ('stats', sentence)
+            result = cache.get(key)
+            if result is None:
+                result = sentence_stats(sentence)
+                cache.put(key, result)
+            return result
+
+        converter._sentence_stats = cached_sentence_stats
+
+    def key(self, kind: str, text: str) -> str:
+        """Kunci cache: hash jenis operasi, seed, versi kamus dan teks"""
+        digest = hashlib.sha256(f'{kind}\0{self.seed}\0{self.dictionary_version}\0'.encode('utf-8'))
+        digest.update(text.encode('utf-8', 'surrogatepass'))
+        return digest.hexdigest()
+
+    def _cached(self, kind: str, text: str, compute: Callable):
+        """Ambil dari tier memori, lalu disk, lalu hitung dan simpan ke keduanya"""
+        key = self.key(kind, text)
+        value = self.memory.get(key)
+        if value is not None:
+            return value
+        if self.disk:
+            value = self.disk.get(key)
+            if value is not None:
+                self.memory.put(key, value)
+                return value
+        value = compute(key)
+        self.memory.put(key, value)
+        if self.disk:
+            self.disk.put(key, value)
+        return value
+
+    def convert(self, text: str) -> str:
+        """Konversi deterministik per teks (RNG di-seed dari kunci cache)"""
+        return self._cached('convert', text, lambda key: self.converter.convert_chunk(text, random.Random(key)))
+
+    def analyze(self, text: str) -> dict:
+        """analyze_humanness dengan cache (salinan dict)"""
+        return dict(self._cached('analyze', text, lambda key: self.converter.analyze_humanness(text)))
+
+    def convert_with_metrics(self, text: str) -> Tuple[str, dict, dict]:
+        """(teks hasil, metrik sebelum, metrik sesudah)"""
+        human_text = self.convert(text)
+        return human_text, self.analyze(text), self.analyze(human_text)
+
+    def info(self) -> dict:
+        """Statistik hit/miss per tier"""
+        info = {
+            'memory': {'entries': len(self.memory), 'hits': self.memory.hits, 'misses': self.memory.misses},
+            'sentences': {'entries': len(self.sentences), 'hits': self.sentences.hits, 'misses': self.sentences.misses},
+        }
+        if self.disk:
+            info['disk'] = {'bytes': self.disk.total_bytes, 'hits': self.disk.hits, 'misses': self.disk.misses}
+        return info
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+MODEL FREKUENSI KATA SELURUH KORPUS (MEMORI TETAP)
+===================================================
+Menghitung frekuensi kata dari banyak dokumen dengan batas memori tetap:
+✓ Count-Min sketch (conservative update) untuk perkiraan jumlah setiap kata
+✓ Daftar top-k kata paling sering untuk laporan
+✓ Disimpan ke file JSON dan diperbarui bertahap setiap ada teks baru
+
+Dipakai oleh tahap penghapusan kata berlebihan: kata dianggap berlebihan
+jika frekuensinya dalam dokumen jauh di atas frekuensinya di korpus, dan
+jumlah yang dikurangi sebanding dengan kelebihannya. Perkiraan Count-Min
+tidak pernah terlalu kecil, sehingga pengurangan cenderung konservatif.
+
+Contoh:
+    python ai_to_human_frequency.py build model_kata.json korpus/*.txt
+    python ai_to_human_frequency.py show model_kata.json --top 30
+"""
+
+import argparse
+import base64
+import heapq
+import json
+import os
+import sys
+import zlib
+from array import array
+from collections import Counter
+from typing import Dict, Iterable
+
+# Anggaran memori default untuk sketch (byte) dan jumlah baris hash
+MEMORY_BYTES = 2 * 1024 * 1024
+DEPTH = 4
+
+# Jumlah kata teratas yang dicatat
+TOP_K = 1000
+
+# Model baru dipakai setelah korpus berisi minimal sekian kata
+MIN_CORPUS_WORDS = 10000
+
+# Kata berlebihan: muncul minimal MIN_OCCURRENCES kali dalam dokumen dan
+# frekuensinya lebih dari OVERUSE_FACTOR kali frekuensi korpus
+MIN_OCCURRENCES = 3
+OVERUSE_FACTOR = 2.0
+
+# Batas bawah/atas porsi kemunculan yang dikurangi
+MIN_REDUCTION = 0.1
+MAX_REDUCTION = 0.5
+
+MODEL_FORMAT = 'frekuensi-kata'
+MODEL_VERSION = 1
+
+# Tanda baca yang dibuang dari akhir token (sama dengan tahap kata berlebihan)
+TRAILING_PUNCTUATION = '.,!?;:'
+
+
+def normalize_word(token: str) -> str:
+    """Bentuk kata yang dihitung: huruf kecil, tanpa tanda baca di akhir"""
+    return token.lower().rstrip(TRAILING_PUNCTUATION)
+
+
+class CountMinSketch:
+    """Count-Min sketch dengan conservative update; hash crc32 ber-salt per baris"""
+
+    def __init__(self, width: int, depth: int = DEPTH, counters: array = None):
+        self.width = width
+        self.depth = depth
+        self.counters = counters if counters is not None else array('Q', bytes(8 * width * depth))
+        self._salts = [0x9e3779b9 * (row + 1) & 0xffffffff for row in range(depth)]
+
+    def _cells(self, word: str):
+        data = word.encode('utf-8', 'surrogatepass')
+        width = self.width
+        return [row * width + zlib.crc32(data, salt) % width for row, salt in enumerate(self._salts)]
+
+    def add(self, word: str, count: int = 1) -> int:
+        """Tambah hitungan kata, mengembalikan perkiraan baru"""
+        counters = self.counters
+        cells = self._cells(word)
+        estimate = min(counters[cell] for cell in cells) + count
+        for cell in cells:
+            if counters[cell] < estimate:
+                counters[cell] = estimate
+        return estimate
+
+    def estimate(self, word: str) -> int:
+        """Perkiraan jumlah kemunculan kata (tidak pernah terlalu kecil)"""
+        counters = self.counters
+        return min(counters[cell] for cell in self._cells(word))
+
+
+class FrequencyModel:
+    """Model frekuensi kata korpus: Count-Min sketch + top-k, memori tetap"""
+
+    def __init__(self, memory_bytes: int = MEMORY_BYTES, depth: int = DEPTH, top_k: int = TOP_K):
+        self.sketch = CountMinSketch(max(memory_bytes // (8 * depth), 1), depth)
+        self.top_k = top_k
+        self.top: Dict[str, int] = {}
+        # Batas bawah nilai terkecil di top (hanya naik); menghindari scan top untuk kata jarang
+        self._top_floor = 0
+        self.total_words = 0
+        self.documents = 0
+
+    def ready(self) -> bool:
+        """Korpus sudah cukup besar untuk menentukan kata berlebihan"""
+        return self.total_words >= MIN_CORPUS_WORDS
+
+    # ---------- pembaruan ----------
+
+    def update_counts(self, counts: Dict[str, int]):
+        """Tambahkan hitungan kata (sudah dinormalisasi) dari satu dokumen"""
+        sketch = self.sketch
+        top = self.top
+        for word, count in counts.items():
+            if not word:
+                continue
+            estimate = sketch.add(word, count)
+            if word in top or len(top) < self.top_k:
+                top[word] = estimate
+            elif estimate > self._top_floor:
+                lowest = min(top, key=top.get)
+                if estimate > top[lowest]:
+                    del top[lowest]
+                    top[word] = estimate
+                self._top_floor = min(top.values())
+        self.total_words += sum(counts.values())
+        self.documents += 1
+
+    def update_text(self, text: str):
+        """Tambahkan satu dokumen teks ke model"""
+        self.update_counts(Counter(map(normalize_word, text.split())))
+
+    # ---------- pemakaian ----------
+
+    def estimate(self, word: str) -> int:
+        return self.sketch.estimate(word)
+
+    def most_common(self, n: int = 20):
+        """n kata paling sering (perkiraan)"""
+        return heapq.nlargest(n, self.top.items(), key=lambda item: item[1])
+
+    def overuse_ratios(self, counts: Dict[str, int]) -> Dict[str, float]:
+        """Kata berlebihan dalam satu dokumen dan porsi kemunculan yang perlu dikurangi"""
+        doc_total = sum(counts.values())
+        if not doc_total or not self.total_words:
+            return {}
+        scale = doc_total / self.total_words * OVERUSE_FACTOR
+        ratios = {}
+        for word, count in counts.items():
+            if count < MIN_OCCURRENCES or not word.isalpha():
+                continue
+            # Jumlah kemunculan yang masih wajar menurut korpus
+            allowed = self.sketch.estimate(word) * scale
+            if count > allowed:
+                ratio = min(1 - allowed / count, MAX_REDUCTION)
+                if ratio >= MIN_REDUCTION:
+                    ratios[word] = ratio
+        return ratios
+
+    # ---------- penyimpanan ----------
+
+    def to_dict(self) -> dict:
+        return {
+            'format': MODEL_FORMAT,
+            'versi': MODEL_VERSION,
+            'width': self.sketch.width,
+            'depth': self.sketch.depth,
+            'top_k': self.top_k,
+            'total_words': self.total_words,
+            'documents': self.documents,
+            'byteorder': sys.byteorder,
+            'top': self.top,
+            'counters': base64.b64encode(zlib.compress(self.sketch.counters.tobytes())).decode('ascii')
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'FrequencyModel':
+        if data.get('format') != MODEL_FORMAT or data.get('versi') != MODEL_VERSION:
+            raise ValueError('Format model frekuensi tidak dikenal')
+        counters = array('Q')
+        counters.frombytes(zlib.decompress(base64.b64decode(data['counters'])))
+        if data['byteorder'] != sys.byteorder:
+            counters.byteswap()
+        model = cls.__new__(cls)
+        model.sketch = CountMinSketch(data['width'], data['depth'], counters)
+        model.top_k = data['top_k']
+        model.top = dict(data['top'])
+        model._top_floor = 0
+        model.total_words = data['total_words']
+        model.documents = data['documents']
+        return model
+
+    def save(self, path: str):
+        """Simpan model secara atomik"""
+        temp_path = path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'FrequencyModel':
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+    @classmethod
+    def load_or_create(cls, path: str) -> 'FrequencyModel':
+        """Muat model dari file, atau model kosong jika file belum ada"""
+        if os.path.exists(path):
+            return cls.load(path)
+        return cls()
+
+
+def build(model: FrequencyModel, paths: Iterable[str]) -> int:
+    """Tambahkan file-file teks ke model, mengembalikan jumlah file"""
+    count = 0
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            model.update_text(f.read())
+        count += 1
+    return count
+
+
+def main(argv=None):
+    """Main program model frekuensi"""
+    parser = argparse.ArgumentParser(description='Model frekuensi kata korpus dengan memori tetap')
+    sub = parser.add_subparsers(dest='command', required=True)
+    build_parser = sub.add_parser('build', help='tambahkan file teks ke model (dibuat jika belum ada)')
+    build_parser.add_argument('model', help='file model (.json)')
+    build_parser.add_argument('files', nargs='+', help='file teks korpus')
+    build_parser.add_argument('--memory', type=int, default=MEMORY_BYTES, help='anggaran memori sketch (byte) untuk model baru')
+    show_parser = sub.add_parser('show', help='tampilkan ringkasan model')
+    show_parser.add_argument('model', help='file model (.json)')
+    show_parser.add_argument('--top', type=int, default=20, help='jumlah kata teratas')
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        model = FrequencyModel.load(args.model) if os.path.exists(args.model) else FrequencyModel(args.memory)
+        count = build(model, args.files)
+        model.save(args.model)
+        print(f'✓ {count} file ditambahkan; korpus: {model.documents} dokumen, {model.total_words:,} kata')
+        return
+
+    model = FrequencyModel.load(args.model)
+    print(f'Korpus: {model.documents} dokumen, {model.total_words:,} kata '
+          f'(sketch {model.sketch.width}x{model.sketch.depth}, siap: {"ya" if model.ready() else "belum"})')
+    for word, count in model.most_common(args.top):
+        print(f'  {word:<20} {count:>10,}  {count / model.total_words:.2%}')
+
+
+if __name__ == '__main__':
+    main()
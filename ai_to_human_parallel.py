@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+KONVERSI AI KE TEKS MANUSIAWI SECARA PARALEL
+=============================================
+Membagi dokumen (atau daftar dokumen) menjadi chunk rata-kalimat lalu
+mengkonversinya di process pool:
+- Setiap worker membuat satu AItoHumanConverter dengan seed yang sama
+- Setiap chunk memakai random.Random sendiri dengan seed dari
+  (seed, kunci dokumen, nomor chunk); kunci default adalah nomor dokumen
+- Hasil hanya bergantung pada seed dan ukuran chunk, tidak pada jumlah worker
+- Model frekuensi korpus (opsional) dibekukan sebagai salinan saat pool dibuat
+
+Chunk adalah unit konversi: pola repetitif dan kata berlebihan dihitung
+per chunk, sehingga dokumen yang lebih kecil dari satu chunk menghasilkan
+teks yang sama dengan convert_chunk() atas seluruh dokumen.
+
+Contoh:
+    python ai_to_human_parallel.py artikel1.txt artikel2.txt --workers 8 --seed 42
+"""
+
+import argparse
+import copy
+import io
+import os
+import random
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+from ai_to_human import AItoHumanConverter, iter_sentence_chunks
+
+
+# Ukuran chunk default (karakter) untuk pembagian kerja antar worker
+CHUNK_SIZE = 256 * 1024
+
+# Jumlah chunk yang dikirim ke worker sekaligus
+TASK_BATCH = 16
+
+# Jumlah batch yang boleh menunggu per worker (membatasi memori)
+BATCH_PER_WORKER = 2
+
+# Converter milik proses worker (dibuat oleh _init_worker)
+_converter = None
+
+
+def _make_converter(seed: int, frequency_model=None) -> AItoHumanConverter:
+    """Converter worker; model frekuensi hanya dibaca agar hasil tidak bergantung urutan"""
+    converter = AItoHumanConverter(seed)
+    converter.frequency_model = frequency_model
+    converter.learn_frequencies = False
+    return converter
+
+
+def _init_worker(seed: int, frequency_model=None):
+    """Initializer process pool: satu converter per worker"""
+    global _converter
+    _converter = _make_converter(seed, frequency_model)
+
+
+def _convert_tasks(tasks) -> List[str]:
+    """Mengkonversi sekumpulan chunk, masing-masing dengan RNG yang di-seed khusus"""
+    return [_converter.convert_chunk(text, random.Random(seed)) for seed, text in tasks]
+
+
+def chunk_seed(seed: int, doc_key: Union[int, str], chunk_index: int) -> str:
+    """Seed deterministik untuk satu chunk (string di-hash dengan SHA-512 oleh random)"""
+    return f'{seed}:{doc_key}:{chunk_index}'
+
+
+def split_document(text: str, chunk_size: int = CHUNK_SIZE) -> List[str]:
+    """Membagi teks menjadi chunk yang dipotong di batas kalimat"""
+    return list(iter_sentence_chunks(io.StringIO(text), chunk_size)) or ['']
+
+
+class ParallelConverter:
+    """Konversi paralel dengan process pool dan seed per chunk"""
+
+    def __init__(self, seed: int = 0, workers: Optional[int] = None, chunk_size: int = CHUNK_SIZE,
+                 frequency_model=None):
+        self.seed = seed
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        # Salinan beku: pemanggil boleh terus memperbarui modelnya sendiri
+        self.frequency_model = copy.deepcopy(frequency_model)
+        self._pool = None
+        self._local = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Menghentikan process pool"""
+        if self._pool:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _map(self, tasks: Iterable) -> Iterator[str]:
+        """Menjalankan task di pool (atau di proses ini jika hanya satu worker)"""
+        if self.workers == 1:
+            if self._local is None:
+                self._local = _make_converter(self.seed, self.frequency_model)
+            for chunk_seed_, text in tasks:
+                yield self._local.convert_chunk(text, random.Random(chunk_seed_))
+            return
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(self.workers, initializer=_init_worker,
+                                             initargs=(self.seed, self.frequency_model))
+
+        # Batch dikirim bertahap agar input tidak dibaca seluruhnya ke memori
+        tasks = iter(tasks)
+        pending = deque()
+        while True:
+            while len(pending) < self.workers * BATCH_PER_WORKER:
+                batch = list(islice(tasks, TASK_BATCH))
+                if not batch:
+                    break
+                pending.append(self._pool.submit(_convert_tasks, batch))
+            if not pending:
+                return
+            yield from pending.popleft().result()
+
+    def imap_keyed(self, items: Iterable[Tuple[Union[int, str], str]]) -> Iterator[str]:
+        """Mengkonversi pasangan (kunci, teks); kunci menentukan seed sehingga hasil
+        satu dokumen tidak bergantung pada dokumen lain. Hasil berurutan sesuai input."""
+        chunk_counts = []
+
+        def tasks():
+            for doc_key, text in items:
+                chunks = split_document(text, self.chunk_size)
+                chunk_counts.append(len(chunks))
+                for chunk_index, chunk in enumerate(chunks):
+                    yield chunk_seed(self.seed, doc_key, chunk_index), chunk
+
+        results = self._map(tasks())
+        doc_index = 0
+        for result in results:
+            pieces = [result]
+            pieces.extend(next(results) for _ in range(chunk_counts[doc_index] - 1))
+            doc_index += 1
+            yield ' '.join(pieces)
+
+    def imap(self, texts: Iterable[str]) -> Iterator[str]:
+        """Mengkonversi dokumen-dokumen, hasil dihasilkan berurutan sesuai input"""
+        return self.imap_keyed(enumerate(texts))
+
+    def convert_many(self, texts: Iterable[str]) -> List[str]:
+        """Mengkonversi daftar dokumen"""
+        return list(self.imap(texts))
+
+    def convert(self, text: str) -> str:
+        """Mengkonversi satu dokumen (besar) dengan membagi chunk-nya ke worker"""
+        return self.convert_many([text])[0]
+
+
+def main(argv=None):
+    """Main program konversi paralel"""
+    parser = argparse.ArgumentParser(description='Konversi teks AI ke teks manusiawi secara paralel')
+    parser.add_argument('files', nargs='+', help='file teks yang dikonversi (hasil: <nama>_human.txt)')
+    parser.add_argument('--workers', type=int, default=None, help='jumlah proses worker (default: jumlah CPU)')
+    parser.add_argument('--seed', type=int, default=0, help='seed konversi (default: 0)')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help='ukuran chunk dalam karakter')
+    args = parser.parse_args(argv)
+
+    def texts():
+        for path in args.files:
+            with open(path, 'r', encoding='utf-8') as f:
+                yield f.read()
+
+    mulai = time.perf_counter()
+    with ParallelConverter(args.seed, args.workers, args.chunk_size) as converter:
+        for path, human_text in zip(args.files, converter.imap(texts())):
+            root, ext = os.path.splitext(path)
+            output_file = f'{root}_human{ext or ".txt"}'
+            with open(output_file, 'w', encoding='utf-8') as f:
+                f.write(human_text)
+            print(f'✓ {path} → {output_file}')
+    durasi = time.perf_counter() - mulai
+    print(f'✓ {len(args.files)} file selesai dalam {durasi:.2f} detik ({converter.workers} worker)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+SKOR HUMANNESS BATCH UNTUK KORPUS BESAR
+========================================
+Menilai banyak dokumen sekaligus dengan metrik yang sama seperti
+analyze_humanness:
+✓ Statistik kalimat semua dokumen dikumpulkan ke array datar + offset dokumen
+✓ Rata-rata, variance, rasio dan humanness_score semua dokumen dihitung
+  sekaligus dengan operasi vektor NumPy
+✓ Tanpa NumPy: fallback Python murni dengan hasil yang sama
+
+Tokenisasi kalimat (_sentence_stats) tetap per kalimat; yang divektorisasi
+adalah semua perhitungan setelahnya, sehingga array yang sudah dikumpulkan
+bisa dinilai ulang dengan cepat (jutaan kalimat per detik).
+
+Contoh:
+    scorer = BatchScorer(AItoHumanConverter())
+    hasil = scorer.score(daftar_teks)     # list dict metrik, urutan sama dengan input
+    python ai_to_human_scoring.py korpus/*.txt --output skor.jsonl
+"""
+
+import argparse
+import json
+import time
+from array import array
+from typing import Dict, Iterable, List
+
+from ai_to_human import SENTENCE_SPLIT, AItoHumanConverter
+
+try:
+    import numpy as np
+except ImportError:  # NumPy opsional: dipakai fallback Python murni
+    np = None
+
+# Urutan kolom metrik (sama dengan kunci dict analyze_humanness)
+METRIC_KEYS = (
+    'avg_sentence_length', 'sentence_variety', 'formal_words_ratio',
+    'filler_words_ratio', 'contraction_count', 'humanness_score'
+)
+
+
+class SentenceArrays:
+    """Statistik kalimat banyak dokumen dalam array datar.
+
+    Kalimat dokumen ke-i ada di indeks offsets[i] sampai offsets[i + 1];
+    kolom per kalimat: jumlah kata, kata formal, kata pengisi, kontraksi.
+    """
+
+    def __init__(self):
+        self.offsets = array('q', [0])
+        self.lengths = array('q')
+        self.formal = array('q')
+        self.filler = array('q')
+        self.contractions = array('q')
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    @property
+    def sentence_count(self) -> int:
+        return len(self.lengths)
+
+    def add(self, converter: AItoHumanConverter, text: str):
+        """Tambahkan satu dokumen (dipecah seperti analyze_humanness)"""
+        sentence_stats = converter._sentence_stats
+        lengths, formal, filler, contractions = self.lengths, self.formal, self.filler, self.contractions
+        for sentence in SENTENCE_SPLIT.split(text):
+            word_count, formal_count, filler_count, contraction_count = sentence_stats(sentence)
+            lengths.append(word_count)
+            formal.append(formal_count)
+            filler.append(filler_count)
+            contractions.append(contraction_count)
+        self.offsets.append(len(lengths))
+
+    @classmethod
+    def collect(cls, converter: AItoHumanConverter, texts: Iterable[str]) -> 'SentenceArrays':
+        """Kumpulkan statistik kalimat semua dokumen"""
+        arrays = cls()
+        for text in texts:
+            arrays.add(converter, text)
+        return arrays
+
+
+def _score_numpy(arrays: SentenceArrays) -> Dict[str, 'np.ndarray']:
+    """Metrik semua dokumen dengan operasi vektor"""
+    offsets = np.frombuffer(arrays.offsets, dtype=np.int64)
+    lengths = np.frombuffer(arrays.lengths, dtype=np.int64)
+    starts, ends = offsets[:-1], offsets[1:]
+    counts = ends - starts
+
+    def per_document(column) -> 'np.ndarray':
+        """Jumlah kolom per kalimat untuk setiap dokumen (eksak, lewat cumsum bilangan bulat)"""
+        cumulative = np.concatenate(([0], np.cumsum(np.frombuffer(column, dtype=np.int64))))
+        return cumulative[ends] - cumulative[starts]
+
+    total_words = per_document(arrays.lengths)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        avg = np.where(counts > 0, total_words / counts, 0.0)
+
+        # Variance populasi per dokumen (dua lintasan, seperti _variety_from_lengths)
+        deviations = (lengths - np.repeat(avg, counts)) ** 2
+        variance = np.zeros(len(counts))
+        nonempty = counts > 0
+        if deviations.size:
+            variance[nonempty] = np.add.reduceat(deviations, starts[nonempty]) / counts[nonempty]
+        variety = np.where(counts >= 2, np.minimum(variance / 100, 1.0), 0.0)
+
+        formal_ratio = np.where(total_words > 0, per_document(arrays.formal) / total_words, 0.0)
+        filler_ratio = np.where(total_words > 0, per_document(arrays.filler) / total_words, 0.0)
+
+    # Aturan skor harus sama dengan AItoHumanConverter._calculate_humanness_score
+    score = np.full(len(counts), 50, dtype=np.int64)
+    score += np.select([(avg >= 15) & (avg <= 25), (avg >= 12) & (avg <= 30)], [20, 10], 0)
+    score += (variety * 20).astype(np.int64)
+    score += np.select([formal_ratio < 0.05, formal_ratio < 0.1, formal_ratio < 0.15], [15, 10, 5], 0)
+    score += np.select([(filler_ratio >= 0.01) & (filler_ratio <= 0.05), filler_ratio < 0.01], [10, 5], 0)
+
+    return {
+        'avg_sentence_length': avg,
+        'sentence_variety': variety,
+        'formal_words_ratio': formal_ratio,
+        'filler_words_ratio': filler_ratio,
+        'contraction_count': per_document(arrays.contractions),
+        'humanness_score': np.clip(score, 0, 100)
+    }
+
+
+def _score_python(converter: AItoHumanConverter, arrays: SentenceArrays) -> Dict[str, list]:
+    """Metrik semua dokumen dengan loop Python (tanpa NumPy)"""
+    columns = {key: [] for key in METRIC_KEYS}
+    offsets = arrays.offsets
+    for start, end in zip(offsets, offsets[1:]):
+        lengths = arrays.lengths[start:end]
+        total_words = sum(lengths)
+        metrics = {
+            'avg_sentence_length': total_words / len(lengths) if lengths else 0,
+            'sentence_variety': converter._variety_from_lengths(lengths),
+            'formal_words_ratio': sum(arrays.formal[start:end]) / total_words if total_words else 0,
+            'filler_words_ratio': sum(arrays.filler[start:end]) / total_words if total_words else 0,
+            'contraction_count': sum(arrays.contractions[start:end])
+        }
+        metrics['humanness_score'] = converter._calculate_humanness_score(metrics)
+        for key in METRIC_KEYS:
+            columns[key].append(metrics[key])
+    return columns
+
+
+class BatchScorer:
+    """Penilai humanness banyak dokumen sekaligus (NumPy jika tersedia)"""
+
+    def __init__(self, converter: AItoHumanConverter = None, use_numpy: bool = True):
+        self.converter = converter or AItoHumanConverter()
+        self.use_numpy = use_numpy and np is not None
+
+    def collect(self, texts: Iterable[str]) -> SentenceArrays:
+        return SentenceArrays.collect(self.converter, texts)
+
+    def score_arrays(self, arrays: SentenceArrays) -> dict:
+        """Metrik per kolom: {nama metrik: nilai semua dokumen}"""
+        if self.use_numpy:
+            return _score_numpy(arrays)
+        return _score_python(self.converter, arrays)
+
+    def score_columns(self, texts: Iterable[str]) -> dict:
+        """Metrik per kolom untuk daftar teks"""
+        return self.score_arrays(self.collect(texts))
+
+    def score(self, texts: Iterable[str]) -> List[dict]:
+        """Metrik per dokumen dalam bentuk dict analyze_humanness"""
+        return rows_from_columns(self.score_columns(texts))
+
+
+def rows_from_columns(columns: dict) -> List[dict]:
+    """Kolom metrik -> list dict per dokumen (nilai NumPy diubah ke tipe Python)"""
+    columns = [columns[key] for key in METRIC_KEYS]
+    if np is not None:
+        columns = [values.tolist() if isinstance(values, np.ndarray) else values for values in columns]
+    return [dict(zip(METRIC_KEYS, row)) for row in zip(*columns)]
+
+
+def main(argv=None):
+    """Main program skor batch"""
+    parser = argparse.ArgumentParser(description='Skor humanness banyak file teks sekaligus')
+    parser.add_argument('files', nargs='+', help='file teks yang dinilai')
+    parser.add_argument('--output', metavar='FILE', help='simpan metrik per file ke JSONL')
+    parser.add_argument('--no-numpy', action='store_true', help='pakai fallback Python murni')
+    args = parser.parse_args(argv)
+
+    scorer = BatchScorer(use_numpy=not args.no_numpy)
+    texts = []
+    for path in args.files:
+        with open(path, 'r', encoding='utf-8') as f:
+            texts.append(f.read())
+
+    start = time.perf_counter()
+    arrays = scorer.collect(texts)
+    collected = time.perf_counter()
+    columns = scorer.score_arrays(arrays)
+    scored = time.perf_counter()
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            for path, metrics in zip(args.files, rows_from_columns(columns)):
+                f.write(json.dumps({'path': path, **metrics}, ensure_ascii=False) + '\n')
+
+    sentences = arrays.sentence_count
+    mode = 'NumPy' if scorer.use_numpy else 'Python'
+    print(f'✓ {len(arrays)} dokumen, {sentences:,} kalimat')
+    print(f'  Kumpulkan statistik : {collected - start:.3f} detik ({sentences / max(collected - start, 1e-9):,.0f} kalimat/detik)')
+    print(f'  Hitung skor ({mode:<6}): {scored - collected:.3f} detik ({sentences / max(scored - collected, 1e-9):,.0f} kalimat/detik)')
+    scores = list(columns['humanness_score'])
+    print(f'  Rata-rata Humanness Score: {sum(scores) / len(scores):.1f}')
+    if args.output:
+        print(f'✓ Metrik tersimpan ke {args.output}')
+
+
+if __name__ == '__main__':
+    main()
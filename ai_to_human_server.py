@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+LAYANAN KONVERSI AI KE TEKS MANUSIAWI (HTTP/JSON)
+==================================================
+Layanan asyncio lokal agar converter bisa dipakai tool internal lewat
+HTTP, tanpa loop input main():
+✓ Pekerjaan CPU dijalankan di process pool (CachedConverter per worker)
+✓ Antrian request terbatas: jika penuh, request ditolak dengan 503
+✓ Request yang datang berdekatan dikirim ke worker sebagai satu batch
+✓ Metrik latensi (p50/p95/p99) dan throughput di GET /metrics
+✓ Worker mati (OOM, segfault, kill): pool dibuat ulang, hanya batch yang
+  sedang berjalan yang gagal
+
+Endpoint:
+    POST /convert   {"text": "...", "metrics": true}
+    POST /analyze   {"text": "..."}
+    GET  /metrics
+
+Hasil /convert deterministik per teks dan seed (lihat ai_to_human_cache).
+
+Contoh:
+    python ai_to_human_server.py --port 8081 --workers 4
+    curl -X POST localhost:8081/convert -d '{"text": "Oleh karena itu, hal ini sangat penting."}'
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional
+
+from ai_to_human_cache import CachedConverter
+from http_sederhana import HTTPError, ServerJSON
+
+# Batas antrian request yang menunggu worker
+QUEUE_SIZE = 1024
+
+# Batas satu batch (jumlah request dan total karakter) dan waktu tunggu mengumpulkan batch (detik)
+BATCH_SIZE = 32
+BATCH_CHARS = 512 * 1024
+BATCH_DELAY = 0.002
+
+# Batch yang boleh berjalan bersamaan per worker
+BATCH_PER_WORKER = 2
+
+# Jumlah sampel latensi terakhir untuk persentil, dan jendela throughput (detik)
+LATENCY_SAMPLES = 4096
+THROUGHPUT_WINDOW = 10.0
+
+JOB_KINDS = ('convert', 'analyze')
+
+# CachedConverter milik proses worker (dibuat oleh _init_worker)
+_worker = None
+
+
+def _init_worker(seed: int):
+    """Initializer process pool: satu CachedConverter per worker"""
+    global _worker
+    _worker = CachedConverter(seed)
+
+
+def _run_batch(jobs: List[tuple]) -> List[dict]:
+    """Menjalankan satu batch (jenis, teks, dengan_metrik) di worker"""
+    results = []
+    for kind, text, with_metrics in jobs:
+        try:
+            if kind == 'analyze':
+                results.append({'metrics': _worker.analyze(text)})
+            elif with_metrics:
+                human_text, before, after = _worker.convert_with_metrics(text)
+                results.append({'text': human_text, 'before': before, 'after': after})
+            else:
+                results.append({'text': _worker.convert(text)})
+        except Exception as e:
+            results.append({'error': f'{type(e).__name__}: {e}'})
+    return results
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Persentil dari list yang sudah terurut (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    index = min(int(fraction * len(sorted_values)), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+class ServiceMetrics:
+    """Metrik latensi dan throughput per jenis request"""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.latencies = {kind: deque(maxlen=LATENCY_SAMPLES) for kind in JOB_KINDS}
+        self.completed = {kind: 0 for kind in JOB_KINDS}
+        self.words = {kind: 0 for kind in JOB_KINDS}
+        self.errors = 0
+        self.rejected = 0
+        self.pool_restarts = 0
+        self.batches = 0
+        self.batched_jobs = 0
+        self._recent = deque()
+
+    def record(self, kind: str, seconds: float, words: int):
+        now = time.monotonic()
+        self.latencies[kind].append(seconds)
+        self.completed[kind] += 1
+        self.words[kind] += words
+        self._recent.append(now)
+
+    def record_batch(self, size: int):
+        self.batches += 1
+        self.batched_jobs += size
+
+    def _recent_rate(self) -> float:
+        """Request selesai per detik dalam jendela terakhir"""
+        limit = time.monotonic() - THROUGHPUT_WINDOW
+        while self._recent and self._recent[0] < limit:
+            self._recent.popleft()
+        return len(self._recent) / THROUGHPUT_WINDOW
+
+    def snapshot(self) -> dict:
+        uptime = time.monotonic() - self.started
+        endpoints = {}
+        for kind in JOB_KINDS:
+            values = sorted(self.latencies[kind])
+            endpoints[kind] = {
+                'completed': self.completed[kind],
+                'words_per_second': self.words[kind] / uptime if uptime else 0,
+                'latency_ms': {
+                    'mean': sum(values) / len(values) * 1000 if values else 0,
+                    'p50': percentile(values, 0.50) * 1000,
+                    'p95': percentile(values, 0.95) * 1000,
+                    'p99': percentile(values, 0.99) * 1000,
+                }
+            }
+        return {
+            'uptime_s': uptime,
+            'requests_per_second': self._recent_rate(),
+            'errors': self.errors,
+            'rejected': self.rejected,
+            'pool_restarts': self.pool_restarts,
+            'batches': self.batches,
+            'avg_batch_size': self.batched_jobs / self.batches if self.batches else 0,
+            'endpoints': endpoints
+        }
+
+
+class ConversionService:
+    """Antrian terbatas + dispatcher batch ke process pool"""
+
+    def __init__(self, seed: int = 0, workers: Optional[int] = None, queue_size: int = QUEUE_SIZE,
+                 batch_size: int = BATCH_SIZE, batch_delay: float = BATCH_DELAY):
+        self.seed = seed
+        self.workers = workers or os.cpu_count() or 1
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.metrics = ServiceMetrics()
+        self.queue = None
+        self.pool = None
+        self.in_flight = 0
+        self._slots = None
+        self._dispatcher = None
+
+    def start(self):
+        """Memulai pool dan dispatcher (harus dipanggil di dalam event loop)"""
+        self.queue = asyncio.Queue(self.queue_size)
+        self.pool = self._new_pool()
+        self._slots = asyncio.Semaphore(self.workers * BATCH_PER_WORKER)
+        self._dispatcher = asyncio.create_task(self._dispatch())
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(self.workers, initializer=_init_worker, initargs=(self.seed,))
+
+    def _restart_pool(self, broken: ProcessPoolExecutor):
+        """Ganti pool yang rusak (sekali saja walaupun beberapa batch gagal bersamaan)"""
+        if self.pool is not broken:
+            return
+        broken.shutdown(wait=False, cancel_futures=True)
+        self.pool = self._new_pool()
+        self.metrics.pool_restarts += 1
+
+    def close(self):
+        """Menghentikan dispatcher dan pool"""
+        if self._dispatcher:
+            self._dispatcher.cancel()
+        if self.pool:
+            self.pool.shutdown(cancel_futures=True)
+
+    async def submit(self, kind: str, text: str, with_metrics: bool = False) -> dict:
+        """Mengantrikan satu pekerjaan; 503 jika antrian penuh"""
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self.queue.put_nowait((kind, text, with_metrics, future))
+        except asyncio.QueueFull:
+            self.metrics.rejected += 1
+            raise HTTPError(503, 'Server sedang sibuk, coba lagi nanti')
+        started = time.perf_counter()
+        result = await future
+        if 'error' in result:
+            self.metrics.errors += 1
+            raise HTTPError(500, result['error'])
+        self.metrics.record(kind, time.perf_counter() - started, len(text.split()))
+        return result
+
+    async def _dispatch(self):
+        """Mengumpulkan request yang antri menjadi batch lalu mengirimnya ke pool"""
+        while True:
+            batch = [await self.queue.get()]
+            chars = len(batch[0][1])
+            waited = False
+            while len(batch) < self.batch_size and chars < BATCH_CHARS:
+                try:
+                    job = self.queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    if waited:
+                        break
+                    # Beri kesempatan request lain masuk ke batch yang sama
+                    await asyncio.sleep(self.batch_delay)
+                    waited = True
+                    continue
+                batch.append(job)
+                chars += len(job[1])
+
+            # Backpressure: batch baru menunggu jika semua slot worker terpakai,
+            # sehingga antrian terisi dan request berikutnya ditolak saat penuh
+            await self._slots.acquire()
+            asyncio.create_task(self._run(batch))
+
+    async def _run(self, batch: list):
+        """Menjalankan satu batch di pool dan menyelesaikan future-nya"""
+        self.in_flight += 1
+        self.metrics.record_batch(len(batch))
+        jobs = [(kind, text, with_metrics) for kind, text, with_metrics, _ in batch]
+        pool = self.pool
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(pool, _run_batch, jobs)
+        except BrokenProcessPool as e:
+            # Worker mati: tanpa pool baru setiap submit berikutnya juga gagal.
+            # Batch ini tidak diulang karena bisa jadi batch inilah penyebabnya.
+            self._restart_pool(pool)
+            results = [{'error': f'{type(e).__name__}: {e}'}] * len(batch)
+        except Exception as e:
+            results = [{'error': f'{type(e).__name__}: {e}'}] * len(batch)
+        finally:
+            self.in_flight -= 1
+            self._slots.release()
+        for (_, _, _, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+def validasi_teks(isi) -> str:
+    """Memastikan body berisi "text" berupa string"""
+    if not isinstance(isi, dict):
+        raise HTTPError(400, 'Body harus berupa object')
+    text = isi.get('text')
+    if not isinstance(text, str):
+        raise HTTPError(400, '"text" harus berupa string')
+    return text
+
+
+def buat_server(layanan: ConversionService) -> ServerJSON:
+    """Membuat ServerJSON dengan semua endpoint layanan konversi"""
+    server = ServerJSON()
+
+    @server.rute('POST', '/convert')
+    async def convert(permintaan):
+        isi = permintaan.json()
+        text = validasi_teks(isi)
+        return await layanan.submit('convert', text, bool(isi.get('metrics')))
+
+    @server.rute('POST', '/analyze')
+    async def analyze(permintaan):
+        return await layanan.submit('analyze', validasi_teks(permintaan.json()))
+
+    @server.rute('GET', '/metrics')
+    async def metrics(permintaan):
+        hasil = layanan.metrics.snapshot()
+        hasil.update({
+            'workers': layanan.workers,
+            'queue': {'size': layanan.queue.qsize(), 'max': layanan.queue_size},
+            'batches_in_flight': layanan.in_flight
+        })
+        return hasil
+
+    return server
+
+
+async def jalankan(host: str, port: int, seed: int, workers: Optional[int], queue_size: int, batch_size: int):
+    """Menjalankan layanan konversi"""
+    layanan = ConversionService(seed, workers, queue_size, batch_size)
+    layanan.start()
+    server = buat_server(layanan)
+    try:
+        await server.jalankan(host, port, lambda: print(
+            f'✓ Layanan konversi berjalan di http://{host}:{port} ({layanan.workers} worker)'))
+    finally:
+        layanan.close()
+
+
+def main(argv=None):
+    """Main program layanan"""
+    parser = argparse.ArgumentParser(description='Layanan HTTP/JSON konversi teks AI ke teks manusiawi')
+    parser.add_argument('--host', default='127.0.0.1', help='alamat host (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8081, help='port (default: 8081)')
+    parser.add_argument('--workers', type=int, default=None, help='jumlah proses worker (default: jumlah CPU)')
+    parser.add_argument('--seed', type=int, default=0, help='seed konversi (default: 0)')
+    parser.add_argument('--queue', type=int, default=QUEUE_SIZE, help=f'batas antrian request (default: {QUEUE_SIZE})')
+    parser.add_argument('--batch', type=int, default=BATCH_SIZE, help=f'maksimal request per batch (default: {BATCH_SIZE})')
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(jalankan(args.host, args.port, args.seed, args.workers, args.queue, args.batch))
+    except KeyboardInterrupt:
+        print('\n👋 Layanan dihentikan.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+ANALITIK POPULASI PEMERIKSAAN KESEHATAN MENTAL
+===============================================
+Counter inkremental untuk dashboard deteksi_kejiwaan.py:
+- Distribusi kategori_utama per kelompok usia
+- Distribusi kategori_utama per jenis kelamin
+- Distribusi kategori_utama per bulan
+- Gejala yang paling sering dilaporkan
+
+Counter diperbarui setiap kali pemeriksaan ditambah atau dihapus dan
+disimpan di samping file data, sehingga laporan tidak perlu membaca
+ulang seluruh riwayat pemeriksaan.
+"""
+
+import heapq
+import json
+import os
+
+# Versi struktur file analitik
+VERSI_ANALITIK = 1
+
+# Batas atas (inklusif) setiap kelompok usia
+KELOMPOK_USIA = [
+    (12, '0-12'),
+    (17, '13-17'),
+    (25, '18-25'),
+    (35, '26-35'),
+    (45, '36-45'),
+    (60, '46-60'),
+]
+KELOMPOK_USIA_TERTUA = '60+'
+
+def file_analitik(data_file):
+    """Nama file analitik yang disimpan di samping file data"""
+    dasar, _ = os.path.splitext(data_file)
+    return dasar + '_analitik.json'
+
+def kelompok_usia(usia):
+    """Menentukan kelompok usia dari usia dalam tahun"""
+    for batas, label in KELOMPOK_USIA:
+        if usia <= batas:
+            return label
+    return KELOMPOK_USIA_TERTUA
+
+def analitik_kosong():
+    """Membuat struktur counter analitik yang masih kosong"""
+    return {
+        'versi': VERSI_ANALITIK,
+        'total': 0,
+        'kategori': {},
+        'usia': {},
+        'jenis_kelamin': {},
+        'bulan': {},
+        'gejala': {}
+    }
+
+def muat_analitik(path):
+    """Memuat counter analitik, None jika file belum ada atau rusak"""
+    try:
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                analitik = json.load(f)
+            if analitik.get('versi') == VERSI_ANALITIK:
+                return analitik
+    except (json.JSONDecodeError, FileNotFoundError):
+        pass
+    return None
+
+def simpan_analitik(analitik, path):
+    """Menyimpan counter analitik ke file JSON (atomik lewat file sementara)"""
+    # Dipanggil pada setiap commit: tanpa indent agar serialisasi tetap murah
+    sementara = path + '.tmp'
+    with open(sementara, 'w', encoding='utf-8') as f:
+        json.dump(analitik, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(sementara, path)
+
+def _tambah(counter, kunci, delta):
+    """Menambah nilai counter dan membuang kunci yang menjadi nol"""
+    nilai = counter.get(kunci, 0) + delta
+    if nilai > 0:
+        counter[kunci] = nilai
+    else:
+        counter.pop(kunci, None)
+
+def _tambah_bertingkat(counter, grup, kategori, delta):
+    """Menambah counter kategori di dalam sebuah grup (usia, bulan, ...)"""
+    per_kategori = counter.setdefault(grup, {})
+    _tambah(per_kategori, kategori, delta)
+    if not per_kategori:
+        del counter[grup]
+
+def catat_pemeriksaan(analitik, pemeriksaan, delta=1):
+    """Memperbarui counter untuk satu pemeriksaan (delta=-1 untuk menghapus)"""
+    kategori = pemeriksaan['kategori_utama']
+    analitik['total'] += delta
+    _tambah(analitik['kategori'], kategori, delta)
+    _tambah_bertingkat(analitik['usia'], kelompok_usia(pemeriksaan['usia']), kategori, delta)
+    _tambah_bertingkat(analitik['jenis_kelamin'], pemeriksaan['jenis_kelamin'], kategori, delta)
+    _tambah_bertingkat(analitik['bulan'], pemeriksaan['tanggal_pemeriksaan'][:7], kategori, delta)
+    for gejala in pemeriksaan['gejala']:
+        _tambah(analitik['gejala'], gejala.strip().lower(), delta)
+
+def batalkan_pemeriksaan(analitik, pemeriksaan):
+    """Mengurangi counter untuk pemeriksaan yang dihapus"""
+    catat_pemeriksaan(analitik, pemeriksaan, delta=-1)
+
+def bangun_ulang(data):
+    """Membangun counter dari seluruh data (untuk migrasi atau perbaikan)"""
+    analitik = analitik_kosong()
+    for pemeriksaan in data:
+        catat_pemeriksaan(analitik, pemeriksaan)
+    return analitik
+
+def _persentase(counter):
+    """Mengubah counter menjadi persentase per kunci"""
+    total = sum(counter.values())
+    return {k: (v / total) * 100 for k, v in counter.items()} if total else {}
+
+def laporan(analitik, jumlah_gejala=10):
+    """Menyusun laporan distribusi langsung dari counter"""
+    return {
+        'total': analitik['total'],
+        'kategori': _persentase(analitik['kategori']),
+        'usia': {g: _persentase(c) for g, c in analitik['usia'].items()},
+        'jenis_kelamin': {g: _persentase(c) for g, c in analitik['jenis_kelamin'].items()},
+        'bulan': {g: _persentase(c) for g, c in sorted(analitik['bulan'].items())},
+        'gejala_teratas': heapq.nlargest(jumlah_gejala, analitik['gejala'].items(), key=lambda x: x[1])
+    }
+
+def tampilkan_laporan(analitik, jumlah_gejala=10):
+    """Menampilkan laporan analitik populasi"""
+    hasil = laporan(analitik, jumlah_gejala)
+
+    print('\n' + '='*70)
+    print('LAPORAN ANALITIK POPULASI')
+    print('='*70)
+    print(f'\nTotal pemeriksaan: {hasil["total"]}')
+
+    print(f'\n📊 DISTRIBUSI KATEGORI:')
+    for kategori, persen in sorted(hasil['kategori'].items(), key=lambda x: x[1], reverse=True):
+        print(f'   • {kategori.upper():15} : {persen:.1f}%')
+
+    urutan_usia = [label for _, label in KELOMPOK_USIA] + [KELOMPOK_USIA_TERTUA]
+    for judul, grup, urutan in [
+        ('KELOMPOK USIA', hasil['usia'], urutan_usia),
+        ('JENIS KELAMIN', hasil['jenis_kelamin'], sorted(hasil['jenis_kelamin'])),
+        ('BULAN', hasil['bulan'], list(hasil['bulan']))
+    ]:
+        print(f'\n📊 PER {judul}:')
+        for nama_grup in urutan:
+            if nama_grup not in grup:
+                continue
+            rincian = ', '.join(f'{k} {v:.0f}%' for k, v in sorted(grup[nama_grup].items(), key=lambda x: x[1], reverse=True))
+            print(f'   • {nama_grup:15} : {rincian}')
+
+    print(f'\n🔍 GEJALA TERBANYAK:')
+    for i, (gejala, jumlah) in enumerate(hasil['gejala_teratas'], 1):
+        print(f'   {i}. {gejala} ({jumlah}x)')
+
+    print('\n' + '='*70)
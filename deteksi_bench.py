@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK DETEKSI KESEHATAN MENTAL
+===================================
+Mengukur skala performa deteksi_kejiwaan.py dengan data sintetis:
+- Database gejala sintetis (10 sampai 1.000 kategori)
+- Kumpulan responden sintetis (1 ribu sampai 1 juta)
+
+Skenario yang diukur:
+✓ Deteksi tunggal (deteksi_mental per responden)
+✓ Deteksi batch (deteksi_mental_batch untuk semua responden)
+✓ Penyimpanan (save_tabel/load_tabel dan save_data/load_data) tanpa pengamat;
+  load diukur dingin (snapshot + replay WAL di PenyimpananWAL baru)
+✓ Pembangunan ulang analitik oleh pengamat penyimpanan
+✓ Pencarian riwayat berdasarkan nama
+
+Contoh:
+    python deteksi_bench.py --kategori 10 100 --responden 1000 10000
+    python deteksi_bench.py --profile profil/   # file .prof untuk snakeviz/flameprof
+"""
+
+import argparse
+import contextlib
+import cProfile
+import io
+import json
+import os
+import random
+import shutil
+import tempfile
+import time
+from datetime import datetime
+
+import deteksi_analitik
+import deteksi_kejiwaan
+import deteksi_ringkas
+import deteksi_wal
+
+# Ukuran default untuk grid benchmark
+KATEGORI_DEFAULT = [10, 100, 1000]
+RESPONDEN_DEFAULT = [1000, 10000]
+
+# Jumlah sampel untuk mengukur rata-rata deteksi tunggal
+SAMPEL_TUNGGAL = 200
+
+NAMA_DEPAN = ['Budi', 'Sari', 'Andi', 'Dewi', 'Rina', 'Agus', 'Putri', 'Joko', 'Wati', 'Eko']
+NAMA_BELAKANG = ['Santoso', 'Wijaya', 'Lestari', 'Pratama', 'Hidayat', 'Kusuma', 'Saputra']
+
+def buat_database(jumlah_kategori, gejala_per_kategori=8, seed=0):
+    """Membuat database gejala sintetis dengan struktur GEJALA_DATABASE"""
+    rng = random.Random(seed)
+    # Sebagian gejala dipakai bersama oleh beberapa kategori, seperti database asli
+    kumpulan_gejala = [f'gejala {i}' for i in range(max(jumlah_kategori * gejala_per_kategori // 2, gejala_per_kategori))]
+    database = {}
+    for i in range(jumlah_kategori):
+        database[f'kategori_{i:04d}'] = {
+            'gejala': rng.sample(kumpulan_gejala, gejala_per_kategori),
+            'deskripsi': f'Deskripsi kategori sintetis {i}.',
+            'tingkat_risiko': rng.choice(['Rendah', 'Sedang', 'Tinggi']),
+            'rekomendasi': [f'Rekomendasi {i}.{j}' for j in range(5)]
+        }
+    return database
+
+def buat_responden(jumlah, database, seed=0):
+    """Membuat daftar gejala responden sintetis dari database"""
+    rng = random.Random(seed)
+    semua_gejala = sorted({g for kategori in database.values() for g in kategori['gejala']})
+    return [rng.sample(semua_gejala, rng.randint(2, 6)) for _ in range(jumlah)]
+
+def buat_tabel(daftar_gejala, database, seed=0):
+    """Membuat tabel pemeriksaan sintetis untuk benchmark penyimpanan"""
+    rng = random.Random(seed)
+    kategori = list(database)
+    tabel = deteksi_ringkas.TabelPemeriksaan()
+    for i, gejala in enumerate(daftar_gejala, 1):
+        tabel.tambah({
+            'id': i,
+            'nama': f'{rng.choice(NAMA_DEPAN)} {rng.choice(NAMA_BELAKANG)}',
+            'usia': rng.randint(5, 90),
+            'jenis_kelamin': rng.choice(['Laki-laki', 'Perempuan']),
+            'gejala': gejala,
+            'kategori_utama': rng.choice(kategori),
+            'tanggal_pemeriksaan': datetime(2026, rng.randint(1, 12), rng.randint(1, 28)).strftime('%Y-%m-%d %H:%M:%S')
+        })
+    return tabel
+
+@contextlib.contextmanager
+def lingkungan_sintetis(database, data_file):
+    """Mengganti GEJALA_DATABASE, DATA_FILE dan ANALITIK_FILE sementara selama benchmark"""
+    asli = (deteksi_kejiwaan.GEJALA_DATABASE, deteksi_kejiwaan.DATA_FILE, deteksi_kejiwaan.ANALITIK_FILE)
+    deteksi_kejiwaan.GEJALA_DATABASE = database
+    deteksi_kejiwaan.DATA_FILE = data_file
+    deteksi_kejiwaan.ANALITIK_FILE = deteksi_analitik.file_analitik(data_file)
+    try:
+        yield
+    finally:
+        deteksi_kejiwaan.GEJALA_DATABASE, deteksi_kejiwaan.DATA_FILE, deteksi_kejiwaan.ANALITIK_FILE = asli
+
+@contextlib.contextmanager
+def tanpa_pengamat(penyimpanan):
+    """Melepas pengamat penyimpanan sementara agar yang diukur hanya penulisan data"""
+    pengamat, penyimpanan.pengamat = penyimpanan.pengamat, []
+    try:
+        yield
+    finally:
+        penyimpanan.pengamat = pengamat
+
+def muat_dingin(data_file):
+    """Memuat data dengan PenyimpananWAL baru (baca file snapshot dan replay WAL, tanpa cache)"""
+    return deteksi_wal.PenyimpananWAL(data_file).baca()
+
+def ukur(nama, fungsi, profil_dir=None):
+    """Menjalankan fungsi sekali dan mengembalikan durasinya dalam detik"""
+    profiler = cProfile.Profile() if profil_dir else None
+    with contextlib.redirect_stdout(io.StringIO()):
+        if profiler:
+            profiler.enable()
+        mulai = time.perf_counter()
+        fungsi()
+        durasi = time.perf_counter() - mulai
+        if profiler:
+            profiler.disable()
+    if profiler:
+        profiler.dump_stats(os.path.join(profil_dir, f'{nama}.prof'))
+    return durasi
+
+def jalankan_skenario(jumlah_kategori, jumlah_responden, seed=0, profil_dir=None):
+    """Menjalankan semua skenario untuk satu ukuran database dan responden"""
+    database = buat_database(jumlah_kategori, seed=seed)
+    responden = buat_responden(jumlah_responden, database, seed=seed)
+    tabel = buat_tabel(responden, database, seed=seed)
+    sampel = responden[:SAMPEL_TUNGGAL]
+    label = f'k{jumlah_kategori}_r{jumlah_responden}'
+    hasil = {'kategori': jumlah_kategori, 'responden': jumlah_responden}
+
+    folder = tempfile.mkdtemp(prefix='deteksi_bench_')
+    data_file = os.path.join(folder, 'pemeriksaan_mental.json')
+    try:
+        with lingkungan_sintetis(database, data_file):
+            def deteksi_tunggal():
+                for gejala in sampel:
+                    deteksi_kejiwaan.deteksi_mental(gejala)
+
+            durasi = ukur(f'{label}_deteksi_tunggal', deteksi_tunggal, profil_dir)
+            hasil['deteksi_tunggal_us'] = durasi / len(sampel) * 1e6
+
+            durasi = ukur(f'{label}_deteksi_batch', lambda: deteksi_kejiwaan.deteksi_mental_batch(responden), profil_dir)
+            hasil['deteksi_batch_s'] = durasi
+            hasil['deteksi_per_detik'] = jumlah_responden / durasi if durasi else 0
+
+            # Penyimpanan diukur tanpa pengamat; analitik diukur terpisah
+            penyimpanan = deteksi_kejiwaan.get_penyimpanan()
+            data = tabel.ke_data()
+            with tanpa_pengamat(penyimpanan):
+                hasil['save_tabel_s'] = ukur(f'{label}_save_tabel', lambda: deteksi_kejiwaan.save_tabel(tabel), profil_dir)
+                hasil['ukuran_file_byte'] = os.path.getsize(data_file)
+                hasil['load_tabel_s'] = ukur(f'{label}_load_tabel', lambda: muat_dingin(data_file), profil_dir)
+
+                hasil['save_data_s'] = ukur(f'{label}_save_data', lambda: deteksi_kejiwaan.save_data(data), profil_dir)
+                hasil['load_data_s'] = ukur(f'{label}_load_data', lambda: muat_dingin(data_file).ke_data(), profil_dir)
+
+            hasil['analitik_s'] = ukur(f'{label}_analitik',
+                                       lambda: deteksi_kejiwaan.perbarui_analitik(penyimpanan.baca(), None), profil_dir)
+
+            hasil['cari_nama_s'] = ukur(f'{label}_cari_nama', lambda: deteksi_kejiwaan.cari_berdasarkan_nama(tabel, 'wijaya'), profil_dir)
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+    return hasil
+
+def tampilkan_hasil(daftar_hasil):
+    """Menampilkan hasil benchmark dalam format tabel"""
+    print('\n' + '='*131)
+    print(f"{'Kategori':>8} {'Responden':>10} {'Tunggal(us)':>12} {'Batch(s)':>10} {'Deteksi/s':>12} "
+          f"{'SaveTbl(s)':>11} {'LoadTbl(s)':>11} {'SaveData(s)':>12} {'LoadData(s)':>12} {'Analitik(s)':>12} {'Cari(s)':>9}")
+    print('='*131)
+    for h in daftar_hasil:
+        print(f"{h['kategori']:>8} {h['responden']:>10} {h['deteksi_tunggal_us']:>12.1f} {h['deteksi_batch_s']:>10.3f} "
+              f"{h['deteksi_per_detik']:>12,.0f} {h['save_tabel_s']:>11.3f} {h['load_tabel_s']:>11.3f} "
+              f"{h['save_data_s']:>12.3f} {h['load_data_s']:>12.3f} {h['analitik_s']:>12.3f} {h['cari_nama_s']:>9.4f}")
+    print('='*131)
+
+def main(argv=None):
+    """Main program benchmark"""
+    parser = argparse.ArgumentParser(description='Benchmark deteksi_kejiwaan.py dengan data sintetis')
+    parser.add_argument('--kategori', type=int, nargs='+', default=KATEGORI_DEFAULT,
+                        help='jumlah kategori database sintetis (default: 10 100 1000)')
+    parser.add_argument('--responden', type=int, nargs='+', default=RESPONDEN_DEFAULT,
+                        help='jumlah responden sintetis (default: 1000 10000)')
+    parser.add_argument('--seed', type=int, default=0, help='seed data sintetis')
+    parser.add_argument('--profile', metavar='DIR',
+                        help='simpan output cProfile (.prof) per skenario ke folder ini')
+    parser.add_argument('--json', metavar='FILE', help='simpan hasil benchmark ke file JSON')
+    args = parser.parse_args(argv)
+
+    if args.profile:
+        os.makedirs(args.profile, exist_ok=True)
+
+    daftar_hasil = []
+    for jumlah_kategori in args.kategori:
+        for jumlah_responden in args.responden:
+            print(f'[*] Kategori={jumlah_kategori}, responden={jumlah_responden}...')
+            daftar_hasil.append(jalankan_skenario(jumlah_kategori, jumlah_responden, args.seed, args.profile))
+
+    tampilkan_hasil(daftar_hasil)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(daftar_hasil, f, ensure_ascii=False, indent=2)
+        print(f'✓ Hasil tersimpan ke {args.json}')
+    if args.profile:
+        print(f'✓ Profil cProfile tersimpan di {args.profile} (buka dengan snakeviz atau flameprof)')
+
+if __name__ == '__main__':
+    main()
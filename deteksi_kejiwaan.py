@@ -13,164 +13,226 @@ Fitur Utama:
 ✓ Deteksi kondisi mental berdasarkan gejala
 ✓ Rekomendasi tindakan
 ✓ Riwayat pemeriksaan
-✓ Data tersimpan dalam JSON
+✓ Data tersimpan dalam JSON (format ringkas, bisa diekspor ke JSON biasa)
+✓ Laporan analitik populasi
+✓ Aman dipakai beberapa stasiun sekaligus (write-ahead log)
 """
 
-import json
-import os
+import threading
 from datetime import datetime
 
+import deteksi_analitik
+
 # File untuk menyimpan data pemeriksaan
 DATA_FILE = 'pemeriksaan_mental.json'
 
-# Database gejala dan kategori kesehatan mental
-GEJALA_DATABASE = {
-    'depresi': {
-        'gejala': [
-            'sedih berkelanjutan',
-            'kehilangan minat',
-            'mudah lelah',
-            'sulit tidur',
-            'merasa bersalah',
-            'konsentrasi menurun',
-            'nafsu makan berubah',
-            'pemikiran negatif'
-        ],
-        'deskripsi': 'Depresi adalah gangguan mood yang ditandai dengan perasaan sedih mendalam dan kehilangan minat terhadap aktivitas.',
-        'tingkat_risiko': 'Tinggi',
-        'rekomendasi': [
-            'Konsultasi dengan psikolog profesional',
-            'Mulai terapi perilaku kognitif',
-            'Jaga rutinitas tidur dan makan',
-            'Lakukan aktivitas fisik ringan',
-            'Berbagi perasaan dengan orang terdekat'
-        ]
-    },
-    'kecemasan': {
-        'gejala': [
-            'khawatir berlebihan',
-            'gelisah',
-            'jantung berdebar',
-            'keringat dingin',
-            'sesak napas',
-            'insomnia',
-            'otot tegang',
-            'sulit berkonsentrasi'
-        ],
-        'deskripsi': 'Gangguan kecemasan ditandai dengan rasa khawatir yang berlebihan dan tidak dapat dikontrol.',
-        'tingkat_risiko': 'Sedang-Tinggi',
-        'rekomendasi': [
-            'Praktik teknik relaksasi dan pernapasan',
-            'Konsultasi dengan profesional kesehatan mental',
-            'Batasi kafein dan stimulan',
-            'Lakukan meditasi atau mindfulness',
-            'Olahraga teratur untuk mengurangi stres'
-        ]
-    },
-    'stres': {
-        'gejala': [
-            'mudah marah',
-            'kepala pusing',
-            'otot tegang',
-            'kelelahan ekstrem',
-            'sulit fokus',
-            'perubahan nafsu makan',
-            'iritabilitas',
-            'gangguan tidur'
-        ],
-        'deskripsi': 'Stres adalah respons tubuh terhadap tekanan atau tantangan yang dihadapi.',
-        'tingkat_risiko': 'Sedang',
-        'rekomendasi': [
-            'Identifikasi sumber stres',
-            'Atur waktu istirahat yang cukup',
-            'Lakukan hobi yang menyenangkan',
-            'Terhubung dengan keluarga dan teman',
-            'Coba teknik manajemen stres seperti yoga'
-        ]
-    },
-    'insomnia': {
-        'gejala': [
-            'sulit tidur',
-            'sering terbangun di malam hari',
-            'tidur tidak nyenyak',
-            'bangun terlalu pagi',
-            'kelelahan siang hari',
-            'mood buruk',
-            'konsentrasi menurun',
-            'rasa kantuk tetapi tidak bisa tidur'
-        ],
-        'deskripsi': 'Insomnia adalah kesulitan untuk tidur atau mempertahankan tidur yang berkualitas.',
-        'tingkat_risiko': 'Sedang',
-        'rekomendasi': [
-            'Buat rutinitas tidur yang konsisten',
-            'Hindari layar sebelum tidur',
-            'Batasi kafein setelah jam 2 sore',
-            'Ciptakan lingkungan tidur yang nyaman dan gelap',
-            'Konsultasi dokter jika berkelanjutan'
-        ]
-    },
-    'bipolar': {
-        'gejala': [
-            'perubahan mood ekstrem',
-            'energi tinggi berlebihan',
-            'depresi dalam',
-            'bicara cepat',
-            'investasi uang besar',
-            'kurang tidur tapi merasa bugar',
-            'impulsif',
-            'gangguan pikiran racing'
-        ],
-        'deskripsi': 'Gangguan bipolar ditandai dengan perubahan mood ekstrem antara manik dan depresi.',
-        'tingkat_risiko': 'Sangat Tinggi',
-        'rekomendasi': [
-            'Segera konsultasi dengan psikiater',
-            'Mungkin memerlukan obat-obatan',
-            'Terapi berkelanjutan sangat penting',
-            'Hindari pemicu stres',
-            'Monitor perubahan mood secara ketat'
-        ]
-    },
-    'sehat': {
-        'gejala': [
-            'mood stabil',
-            'tidur berkualitas',
-            'fokus dan konsentrasi baik',
-            'energi cukup',
-            'hubungan sosial positif',
-            'minat dalam aktivitas',
-            'tidak ada kekhawatiran berlebihan'
-        ],
-        'deskripsi': 'Kesehatan mental yang baik - terus jaga keseimbangan dan wellness Anda.',
-        'tingkat_risiko': 'Rendah',
-        'rekomendasi': [
-            'Pertahankan rutinitas hidup sehat',
-            'Lanjutkan aktivitas fisik',
-            'Jaga hubungan sosial yang positif',
-            'Lakukan self-care secara rutin',
-            'Pemeriksaan berkala untuk pencegahan'
-        ]
+# File counter analitik, disimpan di samping file data
+ANALITIK_FILE = deteksi_analitik.file_analitik(DATA_FILE)
+
+# Database gejala dan kategori kesehatan mental (GEJALA_DATABASE), dibangun saat pertama dipakai
+def bangun_gejala_database():
+    """Membangun database gejala dan kategori kesehatan mental"""
+    return {
+        'depresi': {
+            'gejala': [
+                'sedih berkelanjutan',
+                'kehilangan minat',
+                'mudah lelah',
+                'sulit tidur',
+                'merasa bersalah',
+                'konsentrasi menurun',
+                'nafsu makan berubah',
+                'pemikiran negatif'
+            ],
+            'deskripsi': 'Depresi adalah gangguan mood yang ditandai dengan perasaan sedih mendalam dan kehilangan minat terhadap aktivitas.',
+            'tingkat_risiko': 'Tinggi',
+            'rekomendasi': [
+                'Konsultasi dengan psikolog profesional',
+                'Mulai terapi perilaku kognitif',
+                'Jaga rutinitas tidur dan makan',
+                'Lakukan aktivitas fisik ringan',
+                'Berbagi perasaan dengan orang terdekat'
+            ]
+        },
+        'kecemasan': {
+            'gejala': [
+                'khawatir berlebihan',
+                'gelisah',
+                'jantung berdebar',
+                'keringat dingin',
+                'sesak napas',
+                'insomnia',
+                'otot tegang',
+                'sulit berkonsentrasi'
+            ],
+            'deskripsi': 'Gangguan kecemasan ditandai dengan rasa khawatir yang berlebihan dan tidak dapat dikontrol.',
+            'tingkat_risiko': 'Sedang-Tinggi',
+            'rekomendasi': [
+                'Praktik teknik relaksasi dan pernapasan',
+                'Konsultasi dengan profesional kesehatan mental',
+                'Batasi kafein dan stimulan',
+                'Lakukan meditasi atau mindfulness',
+                'Olahraga teratur untuk mengurangi stres'
+            ]
+        },
+        'stres': {
+            'gejala': [
+                'mudah marah',
+                'kepala pusing',
+                'otot tegang',
+                'kelelahan ekstrem',
+                'sulit fokus',
+                'perubahan nafsu makan',
+                'iritabilitas',
+                'gangguan tidur'
+            ],
+            'deskripsi': 'Stres adalah respons tubuh terhadap tekanan atau tantangan yang dihadapi.',
+            'tingkat_risiko': 'Sedang',
+            'rekomendasi': [
+                'Identifikasi sumber stres',
+                'Atur waktu istirahat yang cukup',
+                'Lakukan hobi yang menyenangkan',
+                'Terhubung dengan keluarga dan teman',
+                'Coba teknik manajemen stres seperti yoga'
+            ]
+        },
+        'insomnia': {
+            'gejala': [
+                'sulit tidur',
+                'sering terbangun di malam hari',
+                'tidur tidak nyenyak',
+                'bangun terlalu pagi',
+                'kelelahan siang hari',
+                'mood buruk',
+                'konsentrasi menurun',
+                'rasa kantuk tetapi tidak bisa tidur'
+            ],
+            'deskripsi': 'Insomnia adalah kesulitan untuk tidur atau mempertahankan tidur yang berkualitas.',
+            'tingkat_risiko': 'Sedang',
+            'rekomendasi': [
+                'Buat rutinitas tidur yang konsisten',
+                'Hindari layar sebelum tidur',
+                'Batasi kafein setelah jam 2 sore',
+                'Ciptakan lingkungan tidur yang nyaman dan gelap',
+                'Konsultasi dokter jika berkelanjutan'
+            ]
+        },
+        'bipolar': {
+            'gejala': [
+                'perubahan mood ekstrem',
+                'energi tinggi berlebihan',
+                'depresi dalam',
+                'bicara cepat',
+                'investasi uang besar',
+                'kurang tidur tapi merasa bugar',
+                'impulsif',
+                'gangguan pikiran racing'
+            ],
+            'deskripsi': 'Gangguan bipolar ditandai dengan perubahan mood ekstrem antara manik dan depresi.',
+            'tingkat_risiko': 'Sangat Tinggi',
+            'rekomendasi': [
+                'Segera konsultasi dengan psikiater',
+                'Mungkin memerlukan obat-obatan',
+                'Terapi berkelanjutan sangat penting',
+                'Hindari pemicu stres',
+                'Monitor perubahan mood secara ketat'
+            ]
+        },
+        'sehat': {
+            'gejala': [
+                'mood stabil',
+                'tidur berkualitas',
+                'fokus dan konsentrasi baik',
+                'energi cukup',
+                'hubungan sosial positif',
+                'minat dalam aktivitas',
+                'tidak ada kekhawatiran berlebihan'
+            ],
+            'deskripsi': 'Kesehatan mental yang baik - terus jaga keseimbangan dan wellness Anda.',
+            'tingkat_risiko': 'Rendah',
+            'rekomendasi': [
+                'Pertahankan rutinitas hidup sehat',
+                'Lanjutkan aktivitas fisik',
+                'Jaga hubungan sosial yang positif',
+                'Lakukan self-care secara rutin',
+                'Pemeriksaan berkala untuk pencegahan'
+            ]
+        }
     }
-}
+
+def get_gejala_database():
+    """Database gejala yang sedang aktif (dibangun sekali)"""
+    global GEJALA_DATABASE
+    try:
+        return GEJALA_DATABASE
+    except NameError:
+        GEJALA_DATABASE = bangun_gejala_database()
+        return GEJALA_DATABASE
+
+def __getattr__(nama):
+    """Akses deteksi_kejiwaan.GEJALA_DATABASE sebelum database dibangun"""
+    if nama == 'GEJALA_DATABASE':
+        return get_gejala_database()
+    raise AttributeError(f'module {__name__!r} has no attribute {nama!r}')
+
+# Penyimpanan WAL untuk DATA_FILE, dibuat saat pertama dipakai
+# (deteksi_wal dan deteksi_ringkas juga baru diimpor saat itu)
+_penyimpanan = None
+
+# Melindungi pembuatan _penyimpanan: deteksi_server memanggil get_penyimpanan
+# dari beberapa thread, dan setiap file data hanya boleh punya satu PenyimpananWAL
+_kunci_penyimpanan = threading.Lock()
+
+def get_penyimpanan():
+    """Penyimpanan WAL untuk DATA_FILE yang sedang aktif"""
+    global _penyimpanan
+    penyimpanan = _penyimpanan
+    if penyimpanan is not None and penyimpanan.data_file == DATA_FILE:
+        return penyimpanan
+    with _kunci_penyimpanan:
+        if _penyimpanan is None or _penyimpanan.data_file != DATA_FILE:
+            import deteksi_wal
+            penyimpanan = deteksi_wal.PenyimpananWAL(DATA_FILE)
+            penyimpanan.pengamat.append(perbarui_analitik)
+            _penyimpanan = penyimpanan
+        return _penyimpanan
+
+def load_tabel():
+    """Memuat data (snapshot + WAL) sebagai tabel rekaman ringkas"""
+    return get_penyimpanan().baca()
+
+def save_tabel(tabel):
+    """Mengganti seluruh data dengan tabel rekaman ringkas"""
+    get_penyimpanan().tulis_ulang(tabel)
+    print('\n✓ Data pemeriksaan berhasil disimpan.')
 
 def load_data():
     """Memuat data dari file JSON"""
-    try:
-        if os.path.exists(DATA_FILE):
-            with open(DATA_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-    except (json.JSONDecodeError, FileNotFoundError):
-        pass
-    return []
+    return load_tabel().ke_data()
 
 def save_data(data):
     """Menyimpan data ke file JSON"""
-    with open(DATA_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-    print('\n✓ Data pemeriksaan berhasil disimpan.')
+    import deteksi_ringkas
+    save_tabel(deteksi_ringkas.TabelPemeriksaan.dari_data(data))
+
+def perbarui_analitik(tabel, perubahan):
+    """Memperbarui counter analitik setelah data berubah (dipanggil di dalam kunci WAL)"""
+    analitik = deteksi_analitik.muat_analitik(ANALITIK_FILE)
+    if analitik is not None and perubahan is not None:
+        for operasi, pemeriksaan in perubahan:
+            if operasi == 'ubah':
+                lama, baru = pemeriksaan
+                deteksi_analitik.batalkan_pemeriksaan(analitik, lama)
+                deteksi_analitik.catat_pemeriksaan(analitik, baru)
+            else:
+                deteksi_analitik.catat_pemeriksaan(analitik, pemeriksaan, 1 if operasi == 'tambah' else -1)
+    if analitik is None or perubahan is None or analitik['total'] != len(tabel):
+        analitik = deteksi_analitik.bangun_ulang(tabel.iter_dict())
+    deteksi_analitik.simpan_analitik(analitik, ANALITIK_FILE)
 
 def hitung_gejala(gejala_input, kategori):
     """Menghitung kecocokan gejala dengan kategori"""
-    gejala_kategori = GEJALA_DATABASE[kategori]['gejala']
+    gejala_kategori = get_gejala_database()[kategori]['gejala']
     kecocokan = sum(1 for g in gejala_input if g.lower() in gejala_kategori)
     persentase = (kecocokan / len(gejala_kategori)) * 100 if gejala_kategori else 0
     return persentase, kecocokan
@@ -179,7 +241,7 @@ def deteksi_mental(gejala_input):
     """Mendeteksi kondisi mental berdasarkan gejala yang diberikan"""
     hasil_deteksi = {}
     
-    for kategori in GEJALA_DATABASE:
+    for kategori in get_gejala_database():
         persentase, jumlah = hitung_gejala(gejala_input, kategori)
         hasil_deteksi[kategori] = {
             'persentase': persentase,
@@ -190,6 +252,10 @@ def deteksi_mental(gejala_input):
     hasil_terurut = sorted(hasil_deteksi.items(), key=lambda x: x[1]['persentase'], reverse=True)
     return hasil_terurut[0][0], hasil_terurut
 
+def deteksi_mental_batch(daftar_gejala):
+    """Mendeteksi kondisi mental untuk banyak responden sekaligus"""
+    return [deteksi_mental(gejala) for gejala in daftar_gejala]
+
 def input_gejala():
     """Input gejala dari pengguna"""
     print('\n' + '='*60)
@@ -217,7 +283,7 @@ def input_gejala():
 
 def tampilkan_hasil_deteksi(nama, usia, jenis_kelamin, gejala, kategori_utama):
     """Menampilkan hasil deteksi kesehatan mental"""
-    data_kategori = GEJALA_DATABASE[kategori_utama]
+    data_kategori = get_gejala_database()[kategori_utama]
     
     print('\n' + '='*70)
     print('HASIL DETEKSI KESEHATAN MENTAL')
@@ -298,10 +364,8 @@ def tambah_pemeriksaan():
     # Tampilkan hasil
     tampilkan_hasil_deteksi(nama, usia, jenis_kelamin, gejala, kategori_utama)
     
-    # Simpan data
-    data = load_data()
+    # Simpan data (ID diberikan oleh penyimpanan)
     pemeriksaan_baru = {
-        'id': len(data) + 1,
         'nama': nama,
         'usia': usia,
         'jenis_kelamin': jenis_kelamin,
@@ -310,14 +374,14 @@ def tambah_pemeriksaan():
         'tanggal_pemeriksaan': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     }
     
-    data.append(pemeriksaan_baru)
-    save_data(data)
+    get_penyimpanan().tambah(pemeriksaan_baru)
+    print('\n✓ Data pemeriksaan berhasil disimpan.')
 
 def lihat_riwayat():
     """Melihat riwayat pemeriksaan"""
-    data = load_data()
+    tabel = load_tabel()
     
-    if not data:
+    if not tabel:
         print('\n⚠ Belum ada riwayat pemeriksaan.')
         return
     
@@ -325,7 +389,7 @@ def lihat_riwayat():
     print('RIWAYAT PEMERIKSAAN KESEHATAN MENTAL')
     print('='*80)
     
-    for pemeriksaan in data:
+    for pemeriksaan in tabel.iter_dict():
         print(f'\nID: {pemeriksaan["id"]}')
         print(f'├─ Nama              : {pemeriksaan["nama"]}')
         print(f'├─ Usia              : {pemeriksaan["usia"]} tahun')
@@ -337,12 +401,15 @@ def lihat_riwayat():
             print(f'   • {gejala}')
         print('-' * 80)
 
+def cari_berdasarkan_nama(tabel, nama):
+    """Mencari pemeriksaan yang namanya mengandung teks tertentu"""
+    nama = nama.lower()
+    return [tabel.ke_dict(p) for p in tabel if nama in p.nama.lower()]
+
 def cari_pemeriksaan():
     """Mencari pemeriksaan berdasarkan nama"""
     nama = input('\nCari berdasarkan nama: ').strip().lower()
-    data = load_data()
-    
-    hasil = [p for p in data if nama in p['nama'].lower()]
+    hasil = cari_berdasarkan_nama(load_tabel(), nama)
     
     if not hasil:
         print(f'\n⚠ Tidak ada pemeriksaan untuk "{nama}".')
@@ -369,17 +436,16 @@ def hapus_pemeriksaan():
     
     try:
         id_hapus = int(input('\nMasukkan ID pemeriksaan yang ingin dihapus: ').strip())
-        data = load_data()
+        tabel = load_tabel()
         
-        pemeriksaan = next((p for p in data if p['id'] == id_hapus), None)
+        pemeriksaan = tabel.cari_id(id_hapus)
         if not pemeriksaan:
             print('⚠ ID tidak ditemukan.')
             return
         
-        konfirmasi = input(f'Yakin hapus pemeriksaan "{pemeriksaan["nama"]}"? (y/n): ').lower()
+        konfirmasi = input(f'Yakin hapus pemeriksaan "{pemeriksaan.nama}"? (y/n): ').lower()
         if konfirmasi == 'y':
-            data = [p for p in data if p['id'] != id_hapus]
-            save_data(data)
+            get_penyimpanan().hapus(id_hapus)
             print('✓ Pemeriksaan berhasil dihapus.')
         else:
             print('✗ Penghapusan dibatalkan.')
@@ -387,8 +453,37 @@ def hapus_pemeriksaan():
     except ValueError:
         print('⚠ ID harus berupa angka.')
 
+def laporan_analitik():
+    """Menampilkan laporan analitik populasi dari counter"""
+    analitik = deteksi_analitik.muat_analitik(ANALITIK_FILE)
+    if analitik is None:
+        # Counter belum ada: bangun sekali dari data yang tersimpan
+        analitik = deteksi_analitik.bangun_ulang(load_tabel().iter_dict())
+        deteksi_analitik.simpan_analitik(analitik, ANALITIK_FILE)
+    
+    if not analitik['total']:
+        print('\n⚠ Belum ada data untuk dianalisis.')
+        return
+    
+    deteksi_analitik.tampilkan_laporan(analitik)
+
+def ekspor_data():
+    """Mengekspor data pemeriksaan ke format JSON biasa"""
+    tabel = load_tabel()
+    
+    if not tabel:
+        print('\n⚠ Belum ada data untuk diekspor.')
+        return
+    
+    nama_file = input('\nNama file ekspor (tanpa .json): ').strip() or 'pemeriksaan_mental_ekspor'
+    import deteksi_ringkas
+    deteksi_ringkas.ekspor_json(tabel, f'{nama_file}.json')
+    print(f'✓ {len(tabel)} pemeriksaan diekspor ke {nama_file}.json')
+
 def menu_utama():
     """Menampilkan menu utama"""
+    from deteksi_ringkas import DataTidakValid
+
     while True:
         print('\n' + '='*60)
         print('APLIKASI DETEKSI KESEHATAN MENTAL')
@@ -397,25 +492,36 @@ def menu_utama():
         print('2. Lihat Riwayat Pemeriksaan')
         print('3. Cari Pemeriksaan')
         print('4. Hapus Pemeriksaan')
-        print('5. Keluar')
+        print('5. Laporan Analitik')
+        print('6. Ekspor Data (JSON)')
+        print('7. Keluar')
         print('='*60)
         
-        pilihan = input('\nPilih menu (1-5): ').strip()
+        pilihan = input('\nPilih menu (1-7): ').strip()
         
-        if pilihan == '1':
-            tambah_pemeriksaan()
-        elif pilihan == '2':
-            lihat_riwayat()
-        elif pilihan == '3':
-            cari_pemeriksaan()
-        elif pilihan == '4':
-            hapus_pemeriksaan()
-        elif pilihan == '5':
-            print('\n👋 Terima kasih telah menggunakan aplikasi ini.')
-            print('Semoga Anda selalu menjaga kesehatan mental!')
-            break
-        else:
-            print('\n⚠ Pilihan tidak valid. Silakan pilih 1-5.')
+        try:
+            if pilihan == '1':
+                tambah_pemeriksaan()
+            elif pilihan == '2':
+                lihat_riwayat()
+            elif pilihan == '3':
+                cari_pemeriksaan()
+            elif pilihan == '4':
+                hapus_pemeriksaan()
+            elif pilihan == '5':
+                laporan_analitik()
+            elif pilihan == '6':
+                ekspor_data()
+            elif pilihan == '7':
+                print('\n👋 Terima kasih telah menggunakan aplikasi ini.')
+                print('Semoga Anda selalu menjaga kesehatan mental!')
+                break
+            else:
+                print('\n⚠ Pilihan tidak valid. Silakan pilih 1-7.')
+        except DataTidakValid as e:
+            # File data berisi rekaman yang tidak bisa dibaca (mis. diedit tangan)
+            print(f'\n⚠ Data pemeriksaan tidak bisa dimuat: {e}')
+            print('  Perbaiki rekaman tersebut di file data, lalu coba lagi.')
 
 if __name__ == '__main__':
     menu_utama()
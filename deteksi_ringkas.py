@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+REPRESENTASI RINGKAS DATA PEMERIKSAAN
+======================================
+Menyimpan pemeriksaan dalam bentuk yang hemat memori dan ruang file:
+- Rekaman berupa dataclass dengan __slots__
+- Gejala disimpan sebagai kode integer terhadap tabel kosakata
+- Kategori disimpan sebagai kode kecil terhadap tabel kategori
+- Jenis kelamin disimpan sebagai enum
+- Tanggal pemeriksaan disimpan sebagai detik (epoch)
+
+Format file lama (list of dict ber-indent) tetap bisa dibaca dan
+diekspor kembali lewat ekspor_json().
+"""
+
+import calendar
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass, replace
+from enum import IntEnum
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Penanda dan versi format file ringkas
+FORMAT_RINGKAS = 'pemeriksaan-ringkas'
+VERSI_RINGKAS = 1
+
+# Format tanggal pada data pemeriksaan
+FORMAT_TANGGAL = '%Y-%m-%d %H:%M:%S'
+
+# Kunci dict pemeriksaan -> field rekaman ringkas
+KOLOM_RINGKAS = {
+    'nama': 'nama',
+    'usia': 'usia',
+    'jenis_kelamin': 'jenis_kelamin',
+    'gejala': 'gejala',
+    'kategori_utama': 'kategori',
+    'tanggal_pemeriksaan': 'tanggal',
+}
+
+class DataTidakValid(ValueError):
+    """Rekaman pemeriksaan tidak bisa dienkode (mis. file lama yang diedit tangan)"""
+
+def _uraian_error(e: Exception) -> str:
+    """Uraian singkat error enkode untuk pesan DataTidakValid"""
+    if isinstance(e, KeyError):
+        return f'field {e.args[0]!r} tidak ada'
+    return str(e)
+
+class JenisKelamin(IntEnum):
+    """Jenis kelamin responden"""
+    LAKI_LAKI = 1
+    PEREMPUAN = 2
+
+    @property
+    def label(self) -> str:
+        return _LABEL_JENIS_KELAMIN[self]
+
+    @classmethod
+    def dari_label(cls, label: str) -> 'JenisKelamin':
+        try:
+            return _JENIS_KELAMIN_DARI_LABEL[label]
+        except (KeyError, TypeError):
+            raise ValueError(f'jenis kelamin tidak dikenal: {label!r}') from None
+
+_LABEL_JENIS_KELAMIN = {
+    JenisKelamin.LAKI_LAKI: 'Laki-laki',
+    JenisKelamin.PEREMPUAN: 'Perempuan',
+}
+_JENIS_KELAMIN_DARI_LABEL = {v: k for k, v in _LABEL_JENIS_KELAMIN.items()}
+
+class KosaKata:
+    """Tabel string <-> kode integer (interning)"""
+
+    __slots__ = ('daftar', 'indeks')
+
+    def __init__(self, daftar: Optional[List[str]] = None):
+        self.daftar: List[str] = []
+        self.indeks: Dict[str, int] = {}
+        for teks in daftar or []:
+            self.kode(teks)
+
+    def kode(self, teks: str) -> int:
+        """Kode integer untuk teks, ditambahkan ke tabel jika belum ada"""
+        kode = self.indeks.get(teks)
+        if kode is None:
+            kode = len(self.daftar)
+            teks = sys.intern(teks)
+            self.daftar.append(teks)
+            self.indeks[teks] = kode
+        return kode
+
+    def teks(self, kode: int) -> str:
+        """Teks untuk kode integer"""
+        return self.daftar[kode]
+
+    def __len__(self):
+        return len(self.daftar)
+
+@dataclass(slots=True)
+class Pemeriksaan:
+    """Satu rekaman pemeriksaan dalam bentuk ringkas"""
+    id: int
+    nama: str
+    usia: int
+    jenis_kelamin: JenisKelamin
+    gejala: Tuple[int, ...]
+    kategori: int
+    tanggal: int
+
+def tanggal_ke_epoch(tanggal: str) -> int:
+    """Mengubah string tanggal pemeriksaan menjadi detik"""
+    return calendar.timegm(time.strptime(tanggal, FORMAT_TANGGAL))
+
+def epoch_ke_tanggal(detik: int) -> str:
+    """Mengubah detik menjadi string tanggal pemeriksaan"""
+    return time.strftime(FORMAT_TANGGAL, time.gmtime(detik))
+
+class TabelPemeriksaan:
+    """Kumpulan rekaman ringkas beserta tabel kosakatanya"""
+
+    def __init__(self):
+        self.gejala = KosaKata()
+        self.kategori = KosaKata()
+        self.rekaman: List[Pemeriksaan] = []
+        # Informasi tambahan milik penyimpanan (mis. posisi WAL yang sudah diterapkan)
+        self.meta: dict = {}
+        # ID -> posisi di rekaman, dibangun saat pertama dicari
+        self._indeks_id: Optional[Dict[int, int]] = None
+
+    def __len__(self):
+        return len(self.rekaman)
+
+    def __iter__(self) -> Iterator[Pemeriksaan]:
+        return iter(self.rekaman)
+
+    def enkode(self, data: dict) -> Pemeriksaan:
+        """Mengubah dict pemeriksaan menjadi rekaman ringkas (DataTidakValid jika tidak valid)"""
+        try:
+            return Pemeriksaan(
+                id=data['id'],
+                nama=sys.intern(data['nama']),
+                usia=data['usia'],
+                jenis_kelamin=JenisKelamin.dari_label(data['jenis_kelamin']),
+                gejala=tuple(self.gejala.kode(g) for g in data['gejala']),
+                kategori=self.kategori.kode(data['kategori_utama']),
+                tanggal=tanggal_ke_epoch(data['tanggal_pemeriksaan'])
+            )
+        except (KeyError, ValueError, TypeError) as e:
+            id_pemeriksaan = data.get('id', '?') if isinstance(data, dict) else '?'
+            raise DataTidakValid(f'pemeriksaan ID {id_pemeriksaan} tidak valid: {_uraian_error(e)}') from e
+
+    def _enkode_nilai(self, kunci: str, nilai):
+        """Nilai satu kunci dict pemeriksaan dalam bentuk ringkas (seperti enkode)"""
+        if kunci == 'nama':
+            return sys.intern(nilai)
+        if kunci == 'jenis_kelamin':
+            return JenisKelamin.dari_label(nilai)
+        if kunci == 'gejala':
+            return tuple(self.gejala.kode(g) for g in nilai)
+        if kunci == 'kategori_utama':
+            return self.kategori.kode(nilai)
+        if kunci == 'tanggal_pemeriksaan':
+            return tanggal_ke_epoch(nilai)
+        return nilai
+
+    def ke_dict(self, rekaman: Pemeriksaan) -> dict:
+        """Mengubah rekaman ringkas menjadi dict pemeriksaan"""
+        return {
+            'id': rekaman.id,
+            'nama': rekaman.nama,
+            'usia': rekaman.usia,
+            'jenis_kelamin': rekaman.jenis_kelamin.label,
+            'gejala': [self.gejala.teks(k) for k in rekaman.gejala],
+            'kategori_utama': self.kategori.teks(rekaman.kategori),
+            'tanggal_pemeriksaan': epoch_ke_tanggal(rekaman.tanggal)
+        }
+
+    def tambah(self, data: dict) -> Pemeriksaan:
+        """Menambahkan pemeriksaan (dalam bentuk dict) ke tabel"""
+        rekaman = self.enkode(data)
+        self.rekaman.append(rekaman)
+        if self._indeks_id is not None:
+            self._indeks_id[rekaman.id] = len(self.rekaman) - 1
+        return rekaman
+
+    def _posisi(self, id_pemeriksaan: int) -> Optional[int]:
+        """Posisi rekaman dengan ID tertentu; indeks dibangun ulang jika tidak cocok lagi"""
+        indeks = self._indeks_id
+        if indeks is not None and len(indeks) == len(self.rekaman):
+            posisi = indeks.get(id_pemeriksaan)
+            if posisi is not None and self.rekaman[posisi].id == id_pemeriksaan:
+                return posisi
+        indeks = self._indeks_id = {r.id: i for i, r in enumerate(self.rekaman)}
+        return indeks.get(id_pemeriksaan)
+
+    def cari_id(self, id_pemeriksaan: int) -> Optional[Pemeriksaan]:
+        """Mencari rekaman berdasarkan ID"""
+        posisi = self._posisi(id_pemeriksaan)
+        return self.rekaman[posisi] if posisi is not None else None
+
+    def ubah(self, id_pemeriksaan: int, perubahan: dict) -> Optional[Pemeriksaan]:
+        """Mengganti sebagian field pemeriksaan (kunci dict), mengembalikan rekaman baru"""
+        posisi = self._posisi(id_pemeriksaan)
+        if posisi is None:
+            return None
+        field = self.enkode_perubahan(id_pemeriksaan, perubahan)
+        rekaman = self.rekaman[posisi] = replace(self.rekaman[posisi], **field)
+        return rekaman
+
+    def enkode_perubahan(self, id_pemeriksaan: int, perubahan: dict) -> dict:
+        """Field rekaman ringkas untuk perubahan (kunci dict); hanya field yang berubah yang dienkode"""
+        try:
+            return {KOLOM_RINGKAS[k]: self._enkode_nilai(k, v) for k, v in perubahan.items() if k in KOLOM_RINGKAS}
+        except (ValueError, TypeError, AttributeError) as e:
+            raise DataTidakValid(f'perubahan pemeriksaan ID {id_pemeriksaan} tidak valid: {e}') from e
+
+    def hapus(self, id_pemeriksaan: int) -> Optional[Pemeriksaan]:
+        """Menghapus rekaman berdasarkan ID, mengembalikan rekaman yang dihapus"""
+        posisi = self._posisi(id_pemeriksaan)
+        if posisi is None:
+            return None
+        # Posisi rekaman sesudahnya bergeser: indeks dibangun ulang saat dibutuhkan
+        self._indeks_id = None
+        return self.rekaman.pop(posisi)
+
+    def salinan(self) -> 'TabelPemeriksaan':
+        """Salinan daftar rekaman untuk dibaca thread lain tanpa kunci.
+
+        Rekaman tidak pernah diubah di tempat (ubah membuat objek baru) dan
+        kosakata hanya bertambah, sehingga keduanya aman dipakai bersama.
+        """
+        tabel = TabelPemeriksaan()
+        tabel.gejala = self.gejala
+        tabel.kategori = self.kategori
+        tabel.rekaman = list(self.rekaman)
+        tabel.meta = dict(self.meta)
+        return tabel
+
+    def iter_dict(self) -> Iterator[dict]:
+        """Iterasi rekaman sebagai dict, satu per satu"""
+        for rekaman in self.rekaman:
+            yield self.ke_dict(rekaman)
+
+    def ke_data(self) -> List[dict]:
+        """Seluruh rekaman sebagai list of dict (format lama)"""
+        return list(self.iter_dict())
+
+    @classmethod
+    def dari_data(cls, data: List[dict]) -> 'TabelPemeriksaan':
+        """Membangun tabel dari list of dict (format lama)"""
+        tabel = cls()
+        for pemeriksaan in data:
+            tabel.tambah(pemeriksaan)
+        return tabel
+
+    def ke_json_ringkas(self) -> dict:
+        """Struktur JSON untuk file ringkas"""
+        return {
+            'format': FORMAT_RINGKAS,
+            'versi': VERSI_RINGKAS,
+            'meta': self.meta,
+            'gejala': self.gejala.daftar,
+            'kategori': self.kategori.daftar,
+            'rekaman': [
+                [r.id, r.nama, r.usia, int(r.jenis_kelamin), list(r.gejala), r.kategori, r.tanggal]
+                for r in self.rekaman
+            ]
+        }
+
+    @classmethod
+    def dari_json_ringkas(cls, isi: dict) -> 'TabelPemeriksaan':
+        """Membangun tabel dari struktur JSON file ringkas"""
+        tabel = cls()
+        tabel.gejala = KosaKata(isi['gejala'])
+        tabel.kategori = KosaKata(isi['kategori'])
+        tabel.meta = isi.get('meta', {})
+        try:
+            tabel.rekaman = [
+                Pemeriksaan(id_, sys.intern(nama), usia, JenisKelamin(jk), tuple(gejala), kategori, tanggal)
+                for id_, nama, usia, jk, gejala, kategori, tanggal in isi['rekaman']
+            ]
+        except (KeyError, ValueError, TypeError) as e:
+            raise DataTidakValid(f'rekaman ringkas tidak valid: {_uraian_error(e)}') from e
+        return tabel
+
+def adalah_format_ringkas(isi) -> bool:
+    """Cek apakah isi JSON berformat ringkas"""
+    return isinstance(isi, dict) and isi.get('format') == FORMAT_RINGKAS
+
+def dari_isi_json(isi) -> TabelPemeriksaan:
+    """Membangun tabel dari isi file JSON, format ringkas maupun lama"""
+    if adalah_format_ringkas(isi):
+        return TabelPemeriksaan.dari_json_ringkas(isi)
+    return TabelPemeriksaan.dari_data(isi)
+
+def muat_tabel(path: str) -> TabelPemeriksaan:
+    """Memuat tabel dari file (format ringkas maupun format lama).
+
+    Rekaman yang tidak valid menghasilkan DataTidakValid yang menyebut file
+    dan ID-nya; file tidak diganti tabel kosong agar datanya tidak tertimpa.
+    """
+    try:
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                return dari_isi_json(json.load(f))
+    except (json.JSONDecodeError, FileNotFoundError):
+        pass
+    except DataTidakValid as e:
+        raise DataTidakValid(f'{path}: {e}') from e
+    return TabelPemeriksaan()
+
+def simpan_tabel(tabel: TabelPemeriksaan, path: str):
+    """Menyimpan tabel ke file dalam format ringkas (atomik lewat file sementara)"""
+    sementara = path + '.tmp'
+    with open(sementara, 'w', encoding='utf-8') as f:
+        json.dump(tabel.ke_json_ringkas(), f, ensure_ascii=False, separators=(',', ':'))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(sementara, path)
+
+def ekspor_json(tabel: TabelPemeriksaan, path: str):
+    """Mengekspor tabel ke format JSON lama (list of dict ber-indent)"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(tabel.ke_data(), f, ensure_ascii=False, indent=2)
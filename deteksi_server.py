@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+LAYANAN SKRINING KESEHATAN MENTAL (HTTP/JSON)
+==============================================
+Layanan asyncio lokal agar deteksi_mental bisa dipanggil dari form
+intake web, tanpa loop terminal menu_utama.
+
+Endpoint:
+    POST /skrining        {"gejala": [...], "simpan": {"nama", "usia", "jenis_kelamin"}}
+    POST /skrining/batch  {"daftar": [{"gejala": [...]}, ...]}
+    GET  /riwayat?nama=...&batas=50
+    GET  /status
+
+Database gejala dan cache hasil disimpan di memori. Pemeriksaan yang
+perlu disimpan dikumpulkan lalu ditulis per batch lewat penyimpanan WAL.
+
+Contoh:
+    python deteksi_server.py --port 8080
+    curl -X POST localhost:8080/skrining -d '{"gejala": ["sulit tidur", "mudah lelah"]}'
+"""
+
+import argparse
+import asyncio
+from collections import OrderedDict
+from datetime import datetime
+
+import deteksi_kejiwaan
+from http_sederhana import HTTPError, ServerJSON
+
+# Jumlah hasil deteksi yang disimpan di cache
+UKURAN_CACHE = 10000
+
+# Batas penulisan per batch dan waktu tunggu untuk mengumpulkan batch (detik)
+BATCH_TULIS = 256
+JEDA_BATCH = 0.01
+
+# Batas jumlah responden dalam satu request batch
+BATAS_BATCH = 1000
+
+class LayananDeteksi:
+    """Logika layanan skrining: cache deteksi dan penulisan per batch"""
+
+    def __init__(self, ukuran_cache=UKURAN_CACHE):
+        self.ukuran_cache = ukuran_cache
+        self._cache = OrderedDict()
+        self.cache_hit = 0
+        self.cache_miss = 0
+        self._antrian_tulis = None
+        self._penulis = None
+        self.jumlah_disimpan = 0
+
+    # ---------- deteksi ----------
+
+    def deteksi(self, gejala):
+        """deteksi_mental dengan cache LRU (urutan gejala tidak berpengaruh)"""
+        kunci = tuple(sorted(g.lower() for g in gejala))
+        hasil = self._cache.get(kunci)
+        if hasil is not None:
+            self._cache.move_to_end(kunci)
+            self.cache_hit += 1
+            return hasil
+
+        self.cache_miss += 1
+        kategori_utama, hasil_terurut = deteksi_kejiwaan.deteksi_mental(list(gejala))
+        data_kategori = deteksi_kejiwaan.GEJALA_DATABASE[kategori_utama]
+        hasil = {
+            'kategori_utama': kategori_utama,
+            'deskripsi': data_kategori['deskripsi'],
+            'tingkat_risiko': data_kategori['tingkat_risiko'],
+            'rekomendasi': data_kategori['rekomendasi'],
+            'peringkat': [
+                {'kategori': kategori, 'persentase': data['persentase'], 'jumlah_kecocokan': data['jumlah_kecocokan']}
+                for kategori, data in hasil_terurut
+            ]
+        }
+        self._cache[kunci] = hasil
+        if len(self._cache) > self.ukuran_cache:
+            self._cache.popitem(last=False)
+        return hasil
+
+    def kosongkan_cache(self):
+        """Mengosongkan cache, mis. setelah GEJALA_DATABASE berubah"""
+        self._cache.clear()
+
+    # ---------- penulisan per batch ----------
+
+    @property
+    def antrian_tulis(self) -> int:
+        """Jumlah pemeriksaan yang menunggu ditulis"""
+        return self._antrian_tulis.qsize() if self._antrian_tulis else 0
+
+    def mulai(self):
+        """Memulai task penulis (harus dipanggil di dalam event loop)"""
+        self._antrian_tulis = asyncio.Queue()
+        self._penulis = asyncio.create_task(self._jalankan_penulis())
+
+    async def simpan(self, pemeriksaan):
+        """Mengantrikan pemeriksaan dan menunggu sampai ter-commit"""
+        future = asyncio.get_running_loop().create_future()
+        await self._antrian_tulis.put((pemeriksaan, future))
+        return await future
+
+    async def _jalankan_penulis(self):
+        """Mengumpulkan pemeriksaan yang antri lalu menulisnya sekaligus"""
+        while True:
+            batch = [await self._antrian_tulis.get()]
+            await asyncio.sleep(JEDA_BATCH)
+            while len(batch) < BATCH_TULIS and not self._antrian_tulis.empty():
+                batch.append(self._antrian_tulis.get_nowait())
+
+            penyimpanan = deteksi_kejiwaan.get_penyimpanan()
+            try:
+                hasil = await asyncio.to_thread(penyimpanan.tambah_banyak, [p for p, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            self.jumlah_disimpan += len(hasil)
+            for (_, future), data in zip(batch, hasil):
+                if not future.done():
+                    future.set_result(data)
+
+    # ---------- riwayat ----------
+
+    @staticmethod
+    def _cari_riwayat(nama, batas):
+        # Salinan diambil di dalam kunci penyimpanan: penulis batch dan checkpoint
+        # bisa mengubah tabel aktif selama pencarian berjalan di thread ini
+        tabel = deteksi_kejiwaan.get_penyimpanan().salinan()
+        if nama:
+            hasil = deteksi_kejiwaan.cari_berdasarkan_nama(tabel, nama)
+        else:
+            hasil = [tabel.ke_dict(p) for p in tabel.rekaman[-batas:]]
+        return hasil[-batas:]
+
+    async def riwayat(self, nama, batas):
+        """Mencari riwayat pemeriksaan (dibaca di thread terpisah)"""
+        return await asyncio.to_thread(self._cari_riwayat, nama, batas)
+
+def validasi_gejala(gejala):
+    """Memastikan gejala berupa list string yang tidak kosong"""
+    if not isinstance(gejala, list) or not gejala or not all(isinstance(g, str) and g.strip() for g in gejala):
+        raise HTTPError(400, '"gejala" harus berupa list string yang tidak kosong')
+    return [g.strip() for g in gejala]
+
+def validasi_responden(data):
+    """Memastikan data responden untuk disimpan valid"""
+    if not isinstance(data, dict):
+        raise HTTPError(400, '"simpan" harus berupa object')
+    nama = data.get('nama')
+    usia = data.get('usia')
+    jenis_kelamin = data.get('jenis_kelamin')
+    if not isinstance(nama, str) or not nama.strip():
+        raise HTTPError(400, 'Nama tidak boleh kosong')
+    # bool adalah subclass int: JSON true tidak boleh lolos sebagai usia 1
+    if isinstance(usia, bool) or not isinstance(usia, int) or usia < 0 or usia > 150:
+        raise HTTPError(400, 'Usia tidak valid. Masukkan usia antara 0-150')
+    if jenis_kelamin not in ('Laki-laki', 'Perempuan'):
+        raise HTTPError(400, 'Jenis kelamin harus "Laki-laki" atau "Perempuan"')
+    return nama.strip(), usia, jenis_kelamin
+
+def buat_server(layanan):
+    """Membuat ServerJSON dengan semua endpoint layanan skrining"""
+    server = ServerJSON()
+
+    @server.rute('POST', '/skrining')
+    async def skrining(permintaan):
+        isi = permintaan.json()
+        if not isinstance(isi, dict):
+            raise HTTPError(400, 'Body harus berupa object')
+        gejala = validasi_gejala(isi.get('gejala'))
+        responden = validasi_responden(isi['simpan']) if 'simpan' in isi else None
+
+        hasil = dict(layanan.deteksi(gejala))
+        if responden:
+            nama, usia, jenis_kelamin = responden
+            tersimpan = await layanan.simpan({
+                'nama': nama,
+                'usia': usia,
+                'jenis_kelamin': jenis_kelamin,
+                'gejala': gejala,
+                'kategori_utama': hasil['kategori_utama'],
+                'tanggal_pemeriksaan': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            })
+            hasil['id'] = tersimpan['id']
+        return hasil
+
+    @server.rute('POST', '/skrining/batch')
+    async def skrining_batch(permintaan):
+        isi = permintaan.json()
+        daftar = isi.get('daftar') if isinstance(isi, dict) else None
+        if not isinstance(daftar, list) or not daftar:
+            raise HTTPError(400, '"daftar" harus berupa list yang tidak kosong')
+        if len(daftar) > BATAS_BATCH:
+            raise HTTPError(413, f'Maksimal {BATAS_BATCH} responden per batch')
+        semua_gejala = [validasi_gejala(item.get('gejala') if isinstance(item, dict) else item) for item in daftar]
+        return {'hasil': [layanan.deteksi(gejala) for gejala in semua_gejala]}
+
+    @server.rute('GET', '/riwayat')
+    async def riwayat(permintaan):
+        try:
+            batas = int(permintaan.query.get('batas', '50'))
+        except ValueError:
+            raise HTTPError(400, '"batas" harus berupa angka')
+        if batas < 1:
+            raise HTTPError(400, '"batas" minimal 1')
+        hasil = await layanan.riwayat(permintaan.query.get('nama', '').strip(), batas)
+        return {'jumlah': len(hasil), 'pemeriksaan': hasil}
+
+    @server.rute('GET', '/status')
+    async def status(permintaan):
+        return {
+            'kategori': len(deteksi_kejiwaan.GEJALA_DATABASE),
+            'cache': {'ukuran': len(layanan._cache), 'hit': layanan.cache_hit, 'miss': layanan.cache_miss},
+            'antrian_tulis': layanan.antrian_tulis,
+            'jumlah_disimpan': layanan.jumlah_disimpan
+        }
+
+    return server
+
+async def jalankan(host, port):
+    """Menjalankan layanan skrining"""
+    layanan = LayananDeteksi()
+    layanan.mulai()
+    server = buat_server(layanan)
+    await server.jalankan(host, port, lambda: print(f'✓ Layanan skrining berjalan di http://{host}:{port}'))
+
+def main(argv=None):
+    """Main program layanan"""
+    parser = argparse.ArgumentParser(description='Layanan HTTP/JSON skrining kesehatan mental')
+    parser.add_argument('--host', default='127.0.0.1', help='alamat host (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8080, help='port (default: 8080)')
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(jalankan(args.host, args.port))
+    except KeyboardInterrupt:
+        print('\n👋 Layanan dihentikan.')
+
+if __name__ == '__main__':
+    main()
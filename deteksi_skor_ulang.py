@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+SKOR ULANG PEMERIKSAAN TERHADAP DATABASE GEJALA TERBARU
+========================================================
+Setelah GEJALA_DATABASE berubah, kategori_utama pemeriksaan yang sudah
+tersimpan bisa tidak sesuai lagi. Job ini menghitung ulang semuanya:
+- Rekaman dibaca per chunk (urut ID) dan dinilai di process pool
+- Hanya rekaman yang kategorinya berubah yang ditulis (operasi 'ubah' di WAL)
+- Counter analitik ikut diperbarui lewat pengamat penyimpanan
+- Progres ditampilkan selama job berjalan
+- Bisa dilanjutkan: ID terakhir yang selesai disimpan di <DATA_FILE>.skor_ulang
+  bersama sidik jari database gejala; jika database berubah lagi, job
+  dimulai dari awal
+
+Contoh:
+    python deteksi_skor_ulang.py
+    python deteksi_skor_ulang.py --data pemeriksaan_mental.json --workers 4 --chunk 20000
+    python deteksi_skor_ulang.py --coba     # hanya menghitung, tidak menulis
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from operator import attrgetter
+
+import deteksi_analitik
+import deteksi_kejiwaan
+
+# Jumlah rekaman per chunk yang dikirim ke worker
+UKURAN_CHUNK = 10000
+
+# Chunk yang boleh menunggu di pool per worker
+CHUNK_PER_WORKER = 2
+
+# Batas memo gejala -> kategori per worker
+UKURAN_MEMO = 100000
+
+VERSI_PROGRES = 1
+
+# Penilai milik proses worker (dibuat oleh _init_worker)
+_penilai = None
+
+class PenilaiKategori:
+    """Kategori utama seperti deteksi_mental, dengan himpunan gejala per kategori dan memo"""
+
+    def __init__(self, database):
+        self.kategori = [
+            (nama, set(data['gejala']), len(data['gejala']))
+            for nama, data in database.items()
+        ]
+        self.memo = {}
+
+    def _hitung(self, gejala):
+        gejala = [g.lower() for g in gejala]
+        terbaik, persentase_terbaik = None, None
+        for nama, himpunan, jumlah in self.kategori:
+            kecocokan = sum(1 for g in gejala if g in himpunan)
+            persentase = (kecocokan / jumlah) * 100 if jumlah else 0
+            # Sama seperti pengurutan stabil di deteksi_mental: kategori pertama menang jika seri
+            if persentase_terbaik is None or persentase > persentase_terbaik:
+                terbaik, persentase_terbaik = nama, persentase
+        return terbaik
+
+    def __call__(self, gejala):
+        kategori = self.memo.get(gejala)
+        if kategori is None:
+            if len(self.memo) >= UKURAN_MEMO:
+                self.memo.clear()
+            kategori = self.memo[gejala] = self._hitung(gejala)
+        return kategori
+
+def _init_worker(database):
+    """Initializer process pool: penilai untuk database gejala yang dipakai"""
+    global _penilai
+    _penilai = PenilaiKategori(database)
+
+def _nilai_chunk(chunk):
+    """Menilai satu chunk [(id, gejala, kategori lama)]; mengembalikan yang berubah saja"""
+    berubah = []
+    for id_pemeriksaan, gejala, kategori_lama in chunk:
+        kategori = _penilai(gejala)
+        if kategori != kategori_lama:
+            berubah.append((id_pemeriksaan, kategori_lama, kategori))
+    return berubah
+
+def sidik_database(database):
+    """Sidik jari database gejala (berubah jika isi database berubah)"""
+    data = json.dumps(database, ensure_ascii=False, sort_keys=True).encode('utf-8')
+    return hashlib.sha256(data).hexdigest()[:16]
+
+def file_progres(data_file):
+    """Nama file progres yang disimpan di samping file data"""
+    return data_file + '.skor_ulang'
+
+def progres_baru(sidik):
+    """Progres job yang belum berjalan"""
+    return {'versi': VERSI_PROGRES, 'database': sidik, 'id_terakhir': 0, 'diperiksa': 0, 'diubah': 0,
+            'hilang': 0, 'perpindahan': {}}
+
+def muat_progres(path, sidik):
+    """Memuat progres; dimulai dari awal jika tidak ada atau dibuat untuk database lain"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            progres = json.load(f)
+    except (FileNotFoundError, ValueError):
+        progres = None
+    if not progres or progres.get('versi') != VERSI_PROGRES or progres.get('database') != sidik:
+        progres = progres_baru(sidik)
+    return progres
+
+def simpan_progres(progres, path):
+    """Menyimpan progres secara atomik"""
+    sementara = path + '.tmp'
+    with open(sementara, 'w', encoding='utf-8') as f:
+        json.dump(progres, f, ensure_ascii=False)
+    os.replace(sementara, path)
+
+def _chunk_rekaman(tabel, rekaman, ukuran_chunk):
+    """Chunk [(id, gejala, kategori)] dengan teks gejala/kategori dari kosakata tabel"""
+    daftar_gejala = tabel.gejala.daftar
+    daftar_kategori = tabel.kategori.daftar
+    for awal in range(0, len(rekaman), ukuran_chunk):
+        yield [
+            (r.id, tuple(daftar_gejala[k] for k in r.gejala), daftar_kategori[r.kategori])
+            for r in rekaman[awal:awal + ukuran_chunk]
+        ]
+
+def _nilai_semua(chunks, database, workers):
+    """(chunk, hasil) berurutan; chunk dikirim bertahap ke pool agar memori tetap terbatas"""
+    if workers == 1:
+        _init_worker(database)
+        for chunk in chunks:
+            yield chunk, _nilai_chunk(chunk)
+        return
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(database,)) as pool:
+        pending = deque()
+        while True:
+            while len(pending) < workers * CHUNK_PER_WORKER:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    break
+                pending.append((chunk, pool.submit(_nilai_chunk, chunk)))
+            if not pending:
+                return
+            chunk, future = pending.popleft()
+            yield chunk, future.result()
+
+def skor_ulang(penyimpanan, database=None, workers=None, ukuran_chunk=UKURAN_CHUNK,
+               path_progres=None, coba=False, laporan=None):
+    """Menilai ulang semua pemeriksaan dan menulis yang kategorinya berubah.
+
+    laporan(progres, total, detik) dipanggil setelah setiap chunk.
+    """
+    database = database or deteksi_kejiwaan.get_gejala_database()
+    workers = workers or os.cpu_count() or 1
+    progres = muat_progres(path_progres, sidik_database(database)) if path_progres else progres_baru(sidik_database(database))
+    mulai_dari = progres['id_terakhir']
+
+    # Salinan daftar rekaman: tabel di penyimpanan ikut berubah saat hasil ditulis
+    tabel = penyimpanan.baca()
+    rekaman = [r for r in tabel.rekaman if r.id > mulai_dari]
+    rekaman.sort(key=attrgetter('id'))
+    total = progres['diperiksa'] + len(rekaman)
+    perpindahan = Counter(progres['perpindahan'])
+
+    mulai = time.perf_counter()
+    for chunk, berubah in _nilai_semua(_chunk_rekaman(tabel, rekaman, ukuran_chunk), database, workers):
+        if berubah and not coba:
+            hasil = penyimpanan.ubah_banyak([(id_pemeriksaan, {'kategori_utama': baru})
+                                             for id_pemeriksaan, _, baru in berubah])
+            # Rekaman yang dihapus stasiun lain selama job berjalan
+            progres['hilang'] += hasil.count(None)
+        perpindahan.update(f'{lama} -> {baru}' for _, lama, baru in berubah)
+        progres['id_terakhir'] = chunk[-1][0]
+        progres['diperiksa'] += len(chunk)
+        progres['diubah'] += len(berubah)
+        progres['perpindahan'] = dict(perpindahan)
+        if path_progres and not coba:
+            simpan_progres(progres, path_progres)
+        if laporan:
+            laporan(progres, total, time.perf_counter() - mulai)
+
+    progres['detik'] = time.perf_counter() - mulai
+    progres['dilanjutkan_dari'] = mulai_dari
+    return progres
+
+def tampilkan_progres(progres, total, detik):
+    """Satu baris progres yang ditimpa setiap chunk"""
+    diperiksa = progres['diperiksa']
+    persen = diperiksa / total if total else 1
+    laju = diperiksa / detik if detik else 0
+    sisa = (total - diperiksa) / laju if laju else 0
+    print(f'\r[*] {diperiksa:,}/{total:,} ({persen:.1%}) · diubah {progres["diubah"]:,} · '
+          f'{laju:,.0f} rekaman/detik · sisa ~{sisa:.0f} detik   ', end='', flush=True)
+
+def main(argv=None):
+    """Main program skor ulang"""
+    parser = argparse.ArgumentParser(description='Menilai ulang pemeriksaan tersimpan dengan GEJALA_DATABASE terbaru')
+    parser.add_argument('--data', default=deteksi_kejiwaan.DATA_FILE,
+                        help=f'file data pemeriksaan (default: {deteksi_kejiwaan.DATA_FILE})')
+    parser.add_argument('--workers', type=int, default=None, help='jumlah proses worker (default: jumlah CPU)')
+    parser.add_argument('--chunk', type=int, default=UKURAN_CHUNK, help=f'rekaman per chunk (default: {UKURAN_CHUNK})')
+    parser.add_argument('--ulang', action='store_true', help='abaikan progres sebelumnya dan mulai dari awal')
+    parser.add_argument('--coba', action='store_true', help='hanya hitung perubahan, tanpa menulis data')
+    args = parser.parse_args(argv)
+
+    deteksi_kejiwaan.DATA_FILE = args.data
+    deteksi_kejiwaan.ANALITIK_FILE = deteksi_analitik.file_analitik(args.data)
+    path_progres = file_progres(args.data)
+    if args.ulang and os.path.exists(path_progres):
+        os.remove(path_progres)
+
+    hasil = skor_ulang(deteksi_kejiwaan.get_penyimpanan(), workers=args.workers, ukuran_chunk=args.chunk,
+                       path_progres=path_progres, coba=args.coba, laporan=tampilkan_progres)
+    print()
+
+    if hasil['dilanjutkan_dari']:
+        print(f"✓ Dilanjutkan setelah ID {hasil['dilanjutkan_dari']} (jumlah di bawah termasuk run sebelumnya)")
+    print(f"✓ Diperiksa: {hasil['diperiksa']:,}, kategori berubah: {hasil['diubah']:,} "
+          f"({hasil['detik']:.2f} detik){' — mode coba, tidak ada yang ditulis' if args.coba else ''}")
+    if hasil['hilang']:
+        print(f"⚠ {hasil['hilang']:,} rekaman sudah dihapus sebelum sempat diubah")
+    for perpindahan, jumlah in sorted(hasil['perpindahan'].items(), key=lambda x: x[1], reverse=True):
+        print(f'   • {perpindahan:<30} : {jumlah:,}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+PENYIMPANAN PEMERIKSAAN BERBASIS WRITE-AHEAD LOG
+=================================================
+Penyimpanan yang aman dipakai beberapa stasiun pemeriksaan sekaligus
+pada satu file data bersama:
+- Setiap perubahan ditulis sebagai satu baris WAL (dengan checksum CRC32)
+- Akses file dikunci (fcntl/msvcrt) sehingga ID tidak pernah ganda
+- Group commit: perubahan dari banyak thread ditulis dengan satu fsync
+- Pemulihan crash: baris terakhir yang terpotong/rusak dibuang
+- Checkpoint: isi WAL digabung ke file snapshot (format ringkas)
+
+File yang dipakai untuk DATA_FILE 'pemeriksaan_mental.json':
+    pemeriksaan_mental.json        snapshot (format ringkas)
+    pemeriksaan_mental.json.wal    log perubahan sejak snapshot
+    pemeriksaan_mental.json.lock   file kunci antar-proses
+"""
+
+import contextlib
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+import zlib
+from typing import Callable, List, Optional, Tuple
+
+from deteksi_ringkas import DataTidakValid, TabelPemeriksaan, muat_tabel, simpan_tabel
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# Ukuran WAL (byte) yang memicu checkpoint otomatis
+BATAS_CHECKPOINT = 4 * 1024 * 1024
+
+# Error pengamat dicatat di sini; commit tetap dianggap berhasil
+logger = logging.getLogger('deteksi_wal')
+
+class WALRusak(Exception):
+    """Header WAL tidak valid sehingga log tidak bisa diputar ulang"""
+
+@contextlib.contextmanager
+def kunci_file(path):
+    """Mengunci file secara eksklusif antar-proses selama blok berjalan"""
+    with open(path, 'a+b') as f:
+        if fcntl:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    time.sleep(0.01)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+def enkode_baris(isi: dict) -> bytes:
+    """Mengubah satu entri menjadi baris WAL: '<crc32> <json>\\n'"""
+    data = json.dumps(isi, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return b'%08x ' % zlib.crc32(data) + data + b'\n'
+
+def dekode_baris(baris: bytes) -> Optional[dict]:
+    """Membaca satu baris WAL (tanpa '\\n'), None jika rusak"""
+    if len(baris) < 10 or baris[8:9] != b' ':
+        return None
+    data = baris[9:]
+    try:
+        if int(baris[:8], 16) != zlib.crc32(data):
+            return None
+        return json.loads(data.decode('utf-8'))
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+class _Tiket:
+    """Sekumpulan operasi yang menunggu group commit"""
+
+    __slots__ = ('operasi', 'hasil', 'error', 'selesai')
+
+    def __init__(self, operasi):
+        self.operasi = operasi
+        self.hasil = None
+        self.error = None
+        self.selesai = False
+
+class PenyimpananWAL:
+    """Penyimpanan pemeriksaan dengan WAL, kunci file dan group commit"""
+
+    def __init__(self, data_file: str, batas_checkpoint: int = BATAS_CHECKPOINT):
+        self.data_file = data_file
+        self.wal_file = data_file + '.wal'
+        self.lock_file = data_file + '.lock'
+        self.batas_checkpoint = batas_checkpoint
+        # Dipanggil sebagai fungsi(tabel, perubahan) di dalam kunci setelah commit;
+        # perubahan berisi list (operasi, dict pemeriksaan) atau None jika data ditulis ulang.
+        # Untuk operasi 'ubah' isinya pasangan (dict lama, dict baru).
+        # Error pengamat hanya dicatat; commit berikutnya mengirim None (bangun ulang)
+        self.pengamat: List[Callable] = []
+        self._pengamat_gagal = False
+        self.tabel = TabelPemeriksaan()
+        self.id_terakhir = 0
+        self._generasi = None
+        self._posisi = 0
+        self._kunci = threading.RLock()
+        self._kondisi = threading.Condition()
+        self._antrian: List[_Tiket] = []
+        self._sedang_commit = False
+
+    # ---------- pembacaan dan pemulihan ----------
+
+    @contextlib.contextmanager
+    def _terkunci(self):
+        """Kunci antar-thread dan antar-proses"""
+        with self._kunci, kunci_file(self.lock_file):
+            yield
+
+    def _muat_snapshot(self):
+        """Memuat ulang snapshot dari file data"""
+        self.tabel = muat_tabel(self.data_file)
+        self.id_terakhir = max([self.tabel.meta.get('id_terakhir', 0)] + [r.id for r in self.tabel])
+
+    def _buat_wal_baru(self):
+        """Membuat WAL kosong dengan generasi baru (atomik)"""
+        generasi = uuid.uuid4().hex
+        header = enkode_baris({'generasi': generasi})
+        sementara = self.wal_file + '.tmp'
+        with open(sementara, 'wb') as f:
+            f.write(header)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(sementara, self.wal_file)
+        self._generasi = generasi
+        self._posisi = len(header)
+
+    def _terapkan(self, entri: dict):
+        """Menerapkan satu entri WAL ke tabel di memori"""
+        if entri['op'] == 'tambah':
+            self.tabel.tambah(entri['data'])
+            self.id_terakhir = max(self.id_terakhir, entri['data']['id'])
+        elif entri['op'] == 'ubah':
+            self.tabel.ubah(entri['id'], entri['data'])
+        elif entri['op'] == 'hapus':
+            self.tabel.hapus(entri['id'])
+
+    def _segarkan(self):
+        """Menyinkronkan tabel di memori dengan snapshot dan WAL (harus dalam kunci)"""
+        if not os.path.exists(self.wal_file):
+            self._muat_snapshot()
+            self._buat_wal_baru()
+            return
+
+        with open(self.wal_file, 'rb') as f:
+            baris_header = f.readline()
+            header = dekode_baris(baris_header.rstrip(b'\n'))
+            if not header or 'generasi' not in header:
+                raise WALRusak(f'Header WAL tidak valid: {self.wal_file}')
+
+            if header['generasi'] != self._generasi:
+                # WAL baru (checkpoint oleh proses lain) atau pertama kali dibuka
+                self._muat_snapshot()
+                wal_snapshot = self.tabel.meta.get('wal', {})
+                self._generasi = header['generasi']
+                if wal_snapshot.get('generasi') == self._generasi:
+                    # Crash setelah snapshot ditulis tapi sebelum WAL diganti
+                    self._posisi = wal_snapshot['posisi']
+                else:
+                    self._posisi = len(baris_header)
+
+            f.seek(self._posisi)
+            sisa = f.read()
+
+        posisi = self._posisi
+        awal = 0
+        while True:
+            akhir = sisa.find(b'\n', awal)
+            if akhir < 0:
+                break
+            entri = dekode_baris(sisa[awal:akhir])
+            if entri is None:
+                break
+            try:
+                self._terapkan(entri)
+            except DataTidakValid:
+                # Sebagian WAL sudah diterapkan: muat ulang dari snapshot pada pembacaan berikutnya
+                self._generasi = None
+                raise
+            posisi += akhir + 1 - awal
+            awal = akhir + 1
+
+        if awal < len(sisa):
+            # Baris terakhir terpotong atau rusak karena crash: buang
+            with open(self.wal_file, 'r+b') as f:
+                f.truncate(posisi)
+        self._posisi = posisi
+
+    def baca(self) -> TabelPemeriksaan:
+        """Tabel terbaru (snapshot + WAL); jangan diubah langsung"""
+        with self._terkunci():
+            self._segarkan()
+            return self.tabel
+
+    def salinan(self) -> TabelPemeriksaan:
+        """Salinan tabel terbaru yang konsisten, aman dibaca di luar kunci"""
+        with self._terkunci():
+            self._segarkan()
+            return self.tabel.salinan()
+
+    # ---------- penulisan ----------
+
+    def _commit(self, batch: List[_Tiket]):
+        """Menulis semua operasi dalam batch dengan satu kali fsync"""
+        with self._terkunci():
+            try:
+                self._tulis_batch(batch)
+            except Exception:
+                # Tabel di memori mungkin sudah tidak sesuai file: paksa muat ulang
+                self._generasi = None
+                raise
+
+    @staticmethod
+    def _periksa_tiket(tiket: _Tiket, pemeriksa: TabelPemeriksaan):
+        """Memastikan semua operasi tiket bisa dienkode, tanpa mengubah tabel.
+
+        Dijalankan pada tabel coretan sebelum operasi diterapkan, sehingga data
+        yang tidak valid hanya menggagalkan tiket pemiliknya, bukan seluruh batch.
+        """
+        for op, nilai in tiket.operasi:
+            try:
+                if op == 'tambah':
+                    pemeriksa.enkode(dict(nilai, id='baru'))
+                    enkode_baris(nilai)
+                elif op == 'ubah':
+                    pemeriksa.enkode_perubahan(nilai[0], nilai[1])
+                    enkode_baris(nilai[1])
+            except DataTidakValid:
+                raise
+            except (TypeError, ValueError) as e:
+                raise DataTidakValid(f'operasi {op} tidak valid: {e}') from e
+
+    def _tulis_batch(self, batch: List[_Tiket]):
+        """Isi _commit yang berjalan di dalam kunci"""
+        self._segarkan()
+        baris = []
+        perubahan = []
+        pemeriksa = TabelPemeriksaan()
+        for tiket in batch:
+            try:
+                self._periksa_tiket(tiket, pemeriksa)
+            except DataTidakValid as e:
+                tiket.error = e
+                continue
+            tiket.hasil = []
+            for op, nilai in tiket.operasi:
+                if op == 'tambah':
+                    self.id_terakhir += 1
+                    data = hasil = dict(nilai, id=self.id_terakhir)
+                    entri = {'op': 'tambah', 'data': data}
+                else:
+                    id_pemeriksaan = nilai[0] if op == 'ubah' else nilai
+                    rekaman = self.tabel.cari_id(id_pemeriksaan)
+                    if rekaman is None:
+                        tiket.hasil.append(None)
+                        continue
+                    data = hasil = self.tabel.ke_dict(rekaman)
+                    if op == 'ubah':
+                        entri = {'op': 'ubah', 'id': id_pemeriksaan, 'data': nilai[1]}
+                    else:
+                        entri = {'op': 'hapus', 'id': id_pemeriksaan}
+                baris.append(enkode_baris(entri))
+                self._terapkan(entri)
+                if op == 'ubah':
+                    hasil = self.tabel.ke_dict(self.tabel.cari_id(id_pemeriksaan))
+                    data = (data, hasil)
+                perubahan.append((op, data))
+                tiket.hasil.append(hasil)
+
+        if baris:
+            with open(self.wal_file, 'ab') as f:
+                f.write(b''.join(baris))
+                f.flush()
+                os.fsync(f.fileno())
+                self._posisi = f.tell()
+            self._beri_tahu(perubahan)
+            if self._posisi >= self.batas_checkpoint:
+                self._checkpoint()
+
+    def _beri_tahu(self, perubahan):
+        """Memanggil semua pengamat setelah data durable; error pengamat hanya dicatat"""
+        if self._pengamat_gagal:
+            # Pengamat melewatkan perubahan sebelumnya: minta bangun ulang penuh
+            perubahan = None
+        self._pengamat_gagal = False
+        for pengamat in self.pengamat:
+            try:
+                pengamat(self.tabel, perubahan)
+            except Exception:
+                # Data sudah ter-fsync: commit tidak boleh dilaporkan gagal, karena
+                # pemanggil yang mengulang akan membuat rekaman ganda
+                self._pengamat_gagal = True
+                logger.exception('Pengamat %r gagal setelah commit', pengamat)
+
+    def _jalankan(self, operasi) -> list:
+        """Mengantrikan operasi dan menunggu hingga ter-commit (group commit)"""
+        tiket = _Tiket(operasi)
+        with self._kondisi:
+            self._antrian.append(tiket)
+            while not tiket.selesai:
+                if self._sedang_commit:
+                    self._kondisi.wait()
+                    continue
+                # Thread ini menjadi pemimpin: commit semua yang sedang antri
+                self._sedang_commit = True
+                batch, self._antrian = self._antrian, []
+                self._kondisi.release()
+                try:
+                    self._commit(batch)
+                except Exception as e:
+                    # Error I/O: tidak ada tiket dalam batch yang pasti tersimpan
+                    for t in batch:
+                        t.error = e
+                finally:
+                    self._kondisi.acquire()
+                    for t in batch:
+                        t.selesai = True
+                    self._sedang_commit = False
+                    self._kondisi.notify_all()
+        if tiket.error:
+            raise tiket.error
+        return tiket.hasil
+
+    def tambah_banyak(self, daftar_pemeriksaan: List[dict]) -> List[dict]:
+        """Menambahkan banyak pemeriksaan; ID diberikan oleh penyimpanan"""
+        return self._jalankan([('tambah', p) for p in daftar_pemeriksaan])
+
+    def tambah(self, pemeriksaan: dict) -> dict:
+        """Menambahkan satu pemeriksaan, mengembalikan dict beserta ID-nya"""
+        return self.tambah_banyak([pemeriksaan])[0]
+
+    def hapus(self, id_pemeriksaan: int) -> Optional[dict]:
+        """Menghapus pemeriksaan, mengembalikan dict yang dihapus atau None"""
+        return self._jalankan([('hapus', id_pemeriksaan)])[0]
+
+    def ubah_banyak(self, daftar_perubahan: List[Tuple[int, dict]]) -> List[Optional[dict]]:
+        """Mengubah field banyak pemeriksaan (ID, {field: nilai baru}); None untuk ID yang tidak ada"""
+        return self._jalankan([('ubah', (id_pemeriksaan, perubahan)) for id_pemeriksaan, perubahan in daftar_perubahan])
+
+    def ubah(self, id_pemeriksaan: int, perubahan: dict) -> Optional[dict]:
+        """Mengubah field satu pemeriksaan, mengembalikan dict barunya atau None"""
+        return self.ubah_banyak([(id_pemeriksaan, perubahan)])[0]
+
+    # ---------- checkpoint ----------
+
+    def _checkpoint(self):
+        """Menggabungkan WAL ke snapshot lalu memulai WAL baru (harus dalam kunci)"""
+        self.tabel.meta = {
+            'id_terakhir': self.id_terakhir,
+            'wal': {'generasi': self._generasi, 'posisi': self._posisi}
+        }
+        simpan_tabel(self.tabel, self.data_file)
+        self._buat_wal_baru()
+
+    def checkpoint(self):
+        """Memaksa checkpoint sekarang"""
+        with self._terkunci():
+            self._segarkan()
+            self._checkpoint()
+
+    def tulis_ulang(self, tabel: TabelPemeriksaan):
+        """Mengganti seluruh isi penyimpanan dengan tabel baru"""
+        with self._terkunci():
+            self._segarkan()
+            self.tabel = tabel
+            self.id_terakhir = max([self.id_terakhir] + [r.id for r in tabel])
+            self._checkpoint()
+            self._beri_tahu(None)
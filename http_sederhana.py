@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+SERVER HTTP/JSON SEDERHANA BERBASIS ASYNCIO
+============================================
+Dipakai bersama oleh layanan lokal di projek ini. Hanya memakai
+standard library:
+- HTTP/1.1 dengan keep-alive
+- Body request dan response berupa JSON
+- Routing berdasarkan metode dan path
+"""
+
+import asyncio
+import json
+from http import HTTPStatus
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+# Batas ukuran body request (byte)
+BATAS_BODY = 1024 * 1024
+
+class HTTPError(Exception):
+    """Error yang dikirim ke klien sebagai response JSON"""
+
+    def __init__(self, status: int, pesan: str):
+        super().__init__(pesan)
+        self.status = status
+        self.pesan = pesan
+
+class Permintaan:
+    """Satu request HTTP yang sudah dibaca"""
+
+    __slots__ = ('metode', 'path', 'query', 'header', 'body')
+
+    def __init__(self, metode: str, path: str, query: Dict[str, str], header: Dict[str, str], body: bytes):
+        self.metode = metode
+        self.path = path
+        self.query = query
+        self.header = header
+        self.body = body
+
+    def json(self):
+        """Body request sebagai JSON"""
+        if not self.body:
+            raise HTTPError(400, 'Body JSON kosong')
+        try:
+            return json.loads(self.body.decode('utf-8'))
+        except (ValueError, UnicodeDecodeError):
+            raise HTTPError(400, 'Body bukan JSON yang valid')
+
+Handler = Callable[[Permintaan], Awaitable[object]]
+
+async def baca_permintaan(reader: asyncio.StreamReader, batas_body: int = BATAS_BODY) -> Optional[Permintaan]:
+    """Membaca satu request dari stream, None jika koneksi ditutup"""
+    try:
+        baris_awal = await reader.readline()
+    except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+        return None
+    if not baris_awal:
+        return None
+    try:
+        metode, target, _ = baris_awal.decode('latin-1').split(' ', 2)
+    except ValueError:
+        raise HTTPError(400, 'Baris request tidak valid')
+
+    header = {}
+    while True:
+        baris = await reader.readline()
+        if baris in (b'\r\n', b'\n', b''):
+            break
+        kunci, _, nilai = baris.decode('latin-1').partition(':')
+        header[kunci.strip().lower()] = nilai.strip()
+
+    teks_panjang = header.get('content-length', '') or '0'
+    # Hanya digit ASCII: int() juga menerima '+5', ' 5' dan '1_0'
+    if not (teks_panjang.isascii() and teks_panjang.isdigit()):
+        raise HTTPError(400, 'Content-Length tidak valid')
+    panjang = int(teks_panjang)
+    if panjang > batas_body:
+        raise HTTPError(413, 'Body request terlalu besar')
+    body = await reader.readexactly(panjang) if panjang else b''
+
+    url = urlsplit(target)
+    query = {k: v[0] for k, v in parse_qs(url.query).items()}
+    return Permintaan(metode.upper(), url.path, query, header, body)
+
+def tulis_respons(writer: asyncio.StreamWriter, status: int, isi, tutup: bool = False):
+    """Menulis response JSON ke stream"""
+    body = json.dumps(isi, ensure_ascii=False).encode('utf-8')
+    header = (
+        f'HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n'
+        f'Content-Type: application/json; charset=utf-8\r\n'
+        f'Content-Length: {len(body)}\r\n'
+        f'Connection: {"close" if tutup else "keep-alive"}\r\n\r\n'
+    )
+    writer.write(header.encode('latin-1') + body)
+
+class ServerJSON:
+    """Server HTTP/JSON dengan routing sederhana"""
+
+    def __init__(self):
+        self._rute: Dict[Tuple[str, str], Handler] = {}
+
+    def rute(self, metode: str, path: str):
+        """Dekorator untuk mendaftarkan handler async(permintaan) -> isi atau (status, isi)"""
+        def daftar(handler: Handler) -> Handler:
+            self._rute[(metode.upper(), path)] = handler
+            return handler
+        return daftar
+
+    async def _proses(self, permintaan: Permintaan):
+        """Menjalankan handler yang sesuai dan mengembalikan (status, isi)"""
+        handler = self._rute.get((permintaan.metode, permintaan.path))
+        if handler is None:
+            if any(path == permintaan.path for _, path in self._rute):
+                raise HTTPError(405, 'Metode tidak diizinkan')
+            raise HTTPError(404, 'Path tidak ditemukan')
+        hasil = await handler(permintaan)
+        if isinstance(hasil, tuple):
+            return hasil
+        return 200, hasil
+
+    async def tangani_koneksi(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Melayani satu koneksi (bisa beberapa request dengan keep-alive)"""
+        try:
+            while True:
+                try:
+                    permintaan = await baca_permintaan(reader)
+                    if permintaan is None:
+                        break
+                    status, isi = await self._proses(permintaan)
+                    tutup = permintaan.header.get('connection', '').lower() == 'close'
+                except HTTPError as e:
+                    status, isi, tutup = e.status, {'error': e.pesan}, True
+                except asyncio.IncompleteReadError:
+                    break
+                except Exception as e:
+                    status, isi, tutup = 500, {'error': f'{type(e).__name__}: {e}'}, True
+                tulis_respons(writer, status, isi, tutup)
+                await writer.drain()
+                if tutup:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def jalankan(self, host: str, port: int, saat_siap: Optional[Callable[[], None]] = None):
+        """Menjalankan server sampai dihentikan"""
+        server = await asyncio.start_server(self.tangani_koneksi, host, port)
+        async with server:
+            if saat_siap:
+                saat_siap()
+            await server.serve_forever()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+KAYU - PELUNCUR SEMUA APLIKASI
+===============================
+Satu pintu masuk untuk semua aplikasi dan tool di repo ini:
+✓ Satu subcommand per tool (keuangan, deteksi, konversi, ...)
+✓ Modul tool baru diimpor saat subcommand-nya dipanggil
+✓ Tabel berat (GEJALA_DATABASE, kamus converter) baru dibangun saat pertama dipakai
+✓ Peluncur hanya mengimpor sys, sehingga startup tetap beberapa milidetik
+✓ Benchmark waktu startup: kayu startup
+
+Argumen setelah nama subcommand diteruskan apa adanya ke tool tersebut.
+
+Contoh:
+    python kayu.py keuangan
+    python kayu.py deteksi
+    python kayu.py konversi --verbose
+    python kayu.py konversi-batch artikel/ hasil/ --workers 4
+    python kayu.py startup --ulang 20
+"""
+
+import sys
+
+# Subcommand -> (modul, fungsi, menerima argv, keterangan)
+PERINTAH = {
+    'keuangan': ('Aku', 'main_menu', False, 'aplikasi manajemen keuangan'),
+    'deteksi': ('deteksi_kejiwaan', 'menu_utama', False, 'aplikasi deteksi kesehatan mental'),
+    'deteksi-server': ('deteksi_server', 'main', True, 'layanan HTTP/JSON deteksi kesehatan mental'),
+    'deteksi-skor-ulang': ('deteksi_skor_ulang', 'main', True, 'nilai ulang pemeriksaan dengan database gejala terbaru'),
+    'deteksi-bench': ('deteksi_bench', 'main', True, 'benchmark deteksi kesehatan mental'),
+    'konversi': ('ai_to_human', 'main', True, 'konversi teks AI ke teks manusiawi'),
+    'konversi-paralel': ('ai_to_human_parallel', 'main', True, 'konversi file besar dengan banyak proses'),
+    'konversi-batch': ('ai_to_human_batch', 'main', True, 'konversi semua file dalam satu folder'),
+    'konversi-server': ('ai_to_human_server', 'main', True, 'layanan HTTP/JSON konversi teks'),
+    'konversi-skor': ('ai_to_human_scoring', 'main', True, 'skor humanness banyak file sekaligus'),
+    'konversi-bench': ('ai_to_human_bench', 'main', True, 'benchmark throughput converter'),
+    'frekuensi': ('ai_to_human_frequency', 'main', True, 'model frekuensi kata korpus'),
+    'startup': ('kayu_bench', 'main', True, 'benchmark waktu startup peluncur dan tool'),
+}
+
+
+def bantuan() -> str:
+    """Teks bantuan peluncur"""
+    lines = ['usage: kayu <perintah> [argumen...]', '', 'Perintah:']
+    for nama, (_, _, _, keterangan) in PERINTAH.items():
+        lines.append(f'  {nama:<18} {keterangan}')
+    lines += ['', "Gunakan 'kayu <perintah> --help' untuk opsi tiap tool."]
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    """Main program peluncur"""
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or argv[0] in ('-h', '--help'):
+        print(bantuan())
+        return 0 if argv else 2
+
+    perintah, argumen = argv[0], argv[1:]
+    if perintah not in PERINTAH:
+        print(f"kayu: perintah tidak dikenal: '{perintah}'\n\n{bantuan()}", file=sys.stderr)
+        return 2
+    nama_modul, nama_fungsi, terima_argv, _ = PERINTAH[perintah]
+    if argumen and not terima_argv:
+        print(f"kayu: '{perintah}' adalah aplikasi interaktif dan tidak menerima argumen", file=sys.stderr)
+        return 2
+
+    # Nama program pada pesan argparse tool: "kayu <perintah>"
+    sys.argv[0] = f'kayu {perintah}'
+    fungsi = getattr(__import__(nama_modul), nama_fungsi)
+    return fungsi(argumen) if terima_argv else fungsi()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
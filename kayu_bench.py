@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK WAKTU STARTUP KAYU
+=============================
+Mengukur biaya cold start peluncur kayu dan setiap tool, mirip laporan
+python -X importtime:
+✓ Waktu impor setiap modul (di dalam proses) dan waktu proses total
+✓ Biaya pemakaian pertama (GEJALA_DATABASE, tabel kamus converter)
+✓ Modul dengan waktu impor sendiri (self) terbesar per target
+✓ Batas waktu impor peluncur; exit code 1 jika terlampaui
+
+Setiap pengukuran memakai proses Python baru. File .pyc diizinkan
+(PYTHONDONTWRITEBYTECODE diabaikan) dan satu run pemanasan dijalankan
+lebih dulu, seperti startup pada instalasi biasa.
+
+Contoh:
+    python kayu_bench.py
+    python kayu_bench.py --ulang 30 --json startup.json
+    python kayu.py startup --batas 2
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# Target: (label, kode yang diukur)
+TARGET = [
+    ('python', 'pass'),
+    ('kayu', 'import kayu'),
+    ('Aku', 'import Aku'),
+    ('deteksi_kejiwaan', 'import deteksi_kejiwaan'),
+    ('deteksi + database', 'import deteksi_kejiwaan; deteksi_kejiwaan.get_gejala_database()'),
+    ('ai_to_human', 'import ai_to_human'),
+    ('ai_to_human + converter', 'import ai_to_human; ai_to_human.AItoHumanConverter()'),
+]
+
+# Batas default waktu impor peluncur kayu (milidetik)
+BATAS_MS = 5.0
+
+# Jumlah modul terberat yang ditampilkan per target
+TOP_MODUL = 3
+
+# Kode pembungkus: ukur waktu target di dalam proses dan cetak ke stdout
+PEMBUNGKUS = 'import time as _t\n_m = _t.perf_counter()\n{kode}\nprint(_t.perf_counter() - _m)'
+
+FOLDER = os.path.dirname(os.path.abspath(__file__))
+
+
+def lingkungan() -> dict:
+    """Environment proses anak: .pyc boleh ditulis dan dipakai"""
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    return env
+
+
+def jalankan(kode: str, env: dict, importtime: bool = False):
+    """(detik di dalam proses, detik proses total, stderr) untuk satu proses baru"""
+    perintah = [sys.executable] + (['-X', 'importtime'] if importtime else []) + ['-c', PEMBUNGKUS.format(kode=kode)]
+    mulai = time.perf_counter()
+    hasil = subprocess.run(perintah, cwd=FOLDER, env=env, capture_output=True, text=True)
+    total = time.perf_counter() - mulai
+    if hasil.returncode != 0:
+        raise RuntimeError(f'{kode!r} gagal:\n{hasil.stderr}')
+    return float(hasil.stdout.strip().splitlines()[-1]), total, hasil.stderr
+
+
+def parse_importtime(stderr: str) -> dict:
+    """Baris -X importtime -> {modul: (self us, kumulatif us)}"""
+    modul = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, kumulatif_us, nama = line[len('import time:'):].split('|')
+        modul[nama.strip()] = (int(self_us), int(kumulatif_us))
+    return modul
+
+
+def ukur_target(label: str, kode: str, ulang: int, env: dict, modul_dasar: set) -> dict:
+    """Median waktu impor dan waktu proses, plus modul terberat dari satu run -X importtime"""
+    jalankan(kode, env)  # pemanasan: tulis .pyc
+    impor, proses = [], []
+    for _ in range(ulang):
+        detik_impor, detik_proses, _ = jalankan(kode, env)
+        impor.append(detik_impor)
+        proses.append(detik_proses)
+    modul = parse_importtime(jalankan(kode, env, importtime=True)[2])
+    # Modul yang sudah diimpor saat interpreter start tidak dihitung
+    milik_target = {nama: waktu for nama, waktu in modul.items() if nama not in modul_dasar}
+    terberat = sorted(milik_target.items(), key=lambda item: item[1][0], reverse=True)[:TOP_MODUL]
+    return {
+        'target': label,
+        'kode': kode,
+        'impor_ms': statistics.median(impor) * 1000,
+        'proses_ms': statistics.median(proses) * 1000,
+        'jumlah_modul': len(milik_target),
+        'terberat': [{'modul': nama, 'self_ms': s / 1000, 'kumulatif_ms': k / 1000} for nama, (s, k) in terberat]
+    }
+
+
+def tampilkan_hasil(hasil: list):
+    """Tampilkan hasil benchmark dalam format tabel"""
+    print('\n' + '=' * 100)
+    print(f"{'Target':<26} {'Impor(ms)':>10} {'Proses(ms)':>11} {'Modul':>6}  Modul terberat (self ms)")
+    print('=' * 100)
+    for h in hasil:
+        terberat = ', '.join(f"{m['modul']} {m['self_ms']:.1f}" for m in h['terberat'])
+        print(f"{h['target']:<26} {h['impor_ms']:>10.2f} {h['proses_ms']:>11.1f} {h['jumlah_modul']:>6}  {terberat}")
+    print('=' * 100)
+
+
+def main(argv=None):
+    """Main program benchmark startup"""
+    parser = argparse.ArgumentParser(description='Benchmark waktu startup peluncur kayu dan tool-toolnya')
+    parser.add_argument('--ulang', type=int, default=10, help='jumlah pengukuran per target (default: 10)')
+    parser.add_argument('--batas', type=float, default=BATAS_MS,
+                        help=f'batas waktu impor peluncur kayu dalam ms (default: {BATAS_MS})')
+    parser.add_argument('--json', metavar='FILE', help='simpan hasil benchmark ke file JSON')
+    args = parser.parse_args(argv)
+
+    env = lingkungan()
+    modul_dasar = set(parse_importtime(jalankan('pass', env, importtime=True)[2]))
+    hasil = []
+    for label, kode in TARGET:
+        print(f'[*] {label}...')
+        hasil.append(ukur_target(label, kode, args.ulang, env, modul_dasar))
+
+    tampilkan_hasil(hasil)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'python': sys.version.split()[0], 'ulang': args.ulang, 'hasil': hasil}, f, ensure_ascii=False, indent=2)
+        print(f'✓ Hasil tersimpan ke {args.json}')
+
+    kayu = next(h for h in hasil if h['target'] == 'kayu')
+    if kayu['impor_ms'] > args.batas:
+        print(f"✗ Impor peluncur kayu {kayu['impor_ms']:.2f} ms melebihi batas {args.batas} ms")
+        sys.exit(1)
+    print(f"✓ Impor peluncur kayu {kayu['impor_ms']:.2f} ms (batas {args.batas} ms)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+"""Tes layanan konversi ai_to_human_server"""
+
+import asyncio
+import os
+import signal
+import unittest
+
+from ai_to_human_server import ConversionService
+from http_sederhana import HTTPError
+
+TEKS = 'Oleh karena itu, hal ini sangat penting untuk diperhatikan.'
+
+class TesPoolRusak(unittest.TestCase):
+
+    def test_worker_mati_pool_dibuat_ulang(self):
+        async def skenario():
+            layanan = ConversionService(seed=0, workers=1, batch_delay=0)
+            layanan.start()
+            try:
+                self.assertIn('text', await layanan.submit('convert', TEKS))
+
+                pool_lama = layanan.pool
+                for proses in list(pool_lama._processes.values()):
+                    os.kill(proses.pid, signal.SIGKILL)
+                # Request yang sedang/segera berjalan di pool yang rusak boleh gagal
+                try:
+                    await layanan.submit('convert', TEKS)
+                except HTTPError as e:
+                    self.assertEqual(e.status, 500)
+                    self.assertIn('BrokenProcessPool', e.pesan)
+
+                # Request berikutnya berhasil di pool baru
+                hasil = await layanan.submit('convert', TEKS)
+                self.assertIn('text', hasil)
+                self.assertIsNot(layanan.pool, pool_lama)
+                self.assertEqual(layanan.metrics.pool_restarts, 1)
+            finally:
+                layanan.close()
+
+        asyncio.run(skenario())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+"""Tes penyimpanan bersama deteksi_kejiwaan"""
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+import deteksi_analitik
+import deteksi_kejiwaan
+import deteksi_wal
+
+class PenyimpananLambat(deteksi_wal.PenyimpananWAL):
+    """PenyimpananWAL yang lambat dibuat, agar thread lain sempat masuk"""
+
+    def __init__(self, *args, **kwargs):
+        time.sleep(0.01)
+        super().__init__(*args, **kwargs)
+
+class TesGetPenyimpanan(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        data_file = os.path.join(self.folder, 'pemeriksaan.json')
+        asli = (deteksi_kejiwaan.DATA_FILE, deteksi_kejiwaan.ANALITIK_FILE, deteksi_kejiwaan._penyimpanan)
+        deteksi_kejiwaan.DATA_FILE = data_file
+        deteksi_kejiwaan.ANALITIK_FILE = deteksi_analitik.file_analitik(data_file)
+        deteksi_kejiwaan._penyimpanan = None
+        self.addCleanup(setattr, deteksi_kejiwaan, '_penyimpanan', asli[2])
+        self.addCleanup(setattr, deteksi_kejiwaan, 'ANALITIK_FILE', asli[1])
+        self.addCleanup(setattr, deteksi_kejiwaan, 'DATA_FILE', asli[0])
+        self.addCleanup(shutil.rmtree, self.folder, True)
+
+    def test_satu_penyimpanan_untuk_banyak_thread(self):
+        jumlah_thread = 8
+        mulai = threading.Barrier(jumlah_thread)
+        hasil = []
+
+        def ambil():
+            mulai.wait()
+            hasil.append(deteksi_kejiwaan.get_penyimpanan())
+
+        with mock.patch.object(deteksi_wal, 'PenyimpananWAL', PenyimpananLambat):
+            threads = [threading.Thread(target=ambil) for _ in range(jumlah_thread)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(5)
+
+        self.assertEqual(len(hasil), jumlah_thread)
+        self.assertEqual(len({id(p) for p in hasil}), 1)
+        self.assertEqual(hasil[0].pengamat, [deteksi_kejiwaan.perbarui_analitik])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+"""Tes validasi layanan skrining deteksi_server"""
+
+import asyncio
+import json
+import unittest
+
+import deteksi_server
+from http_sederhana import HTTPError, Permintaan
+
+def kirim(server, path, isi):
+    """Menjalankan satu request POST JSON lewat routing server, mengembalikan (status, isi)"""
+    permintaan = Permintaan('POST', path, {}, {}, json.dumps(isi).encode('utf-8'))
+    try:
+        return asyncio.run(server._proses(permintaan))
+    except HTTPError as e:
+        return e.status, {'error': e.pesan}
+
+class TesValidasiResponden(unittest.TestCase):
+
+    def setUp(self):
+        self.server = deteksi_server.buat_server(deteksi_server.LayananDeteksi())
+
+    def test_usia_boolean_ditolak(self):
+        for usia in (True, False):
+            status, isi = kirim(self.server, '/skrining', {
+                'gejala': ['sulit tidur'],
+                'simpan': {'nama': 'Ani', 'usia': usia, 'jenis_kelamin': 'Perempuan'}
+            })
+            self.assertEqual(status, 400)
+            self.assertIn('Usia', isi['error'])
+
+    def test_usia_angka_diterima(self):
+        hasil = deteksi_server.validasi_responden({'nama': ' Ani ', 'usia': 1, 'jenis_kelamin': 'Perempuan'})
+        self.assertEqual(hasil, ('Ani', 1, 'Perempuan'))
+
+if __name__ == '__main__':
+    unittest.main()
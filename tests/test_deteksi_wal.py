@@ -0,0 +1,87 @@
+"""Tes penyimpanan WAL deteksi (group commit)"""
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from deteksi_ringkas import DataTidakValid
+from deteksi_wal import PenyimpananWAL
+
+def pemeriksaan(nama, **ubah):
+    data = {
+        'nama': nama,
+        'usia': 30,
+        'jenis_kelamin': 'Perempuan',
+        'gejala': ['sulit tidur'],
+        'kategori_utama': 'sehat',
+        'tanggal_pemeriksaan': '2026-01-01 08:00:00'
+    }
+    data.update(ubah)
+    return data
+
+class TesGroupCommit(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.data_file = os.path.join(self.folder, 'pemeriksaan.json')
+        self.penyimpanan = PenyimpananWAL(self.data_file)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def test_data_tidak_valid_hanya_menggagalkan_pemiliknya(self):
+        """Tiket valid dan tidak valid dalam satu batch: hanya yang tidak valid gagal"""
+        commit_pertama = threading.Event()
+        lanjut = threading.Event()
+
+        def tahan(tabel, perubahan):
+            if not commit_pertama.is_set():
+                commit_pertama.set()
+                lanjut.wait(5)
+        self.penyimpanan.pengamat.append(tahan)
+
+        hasil = {}
+
+        def tulis(kunci, data):
+            try:
+                hasil[kunci] = self.penyimpanan.tambah(data)
+            except Exception as e:
+                hasil[kunci] = e
+
+        # Commit pertama ditahan agar dua tiket berikutnya masuk satu batch
+        pemimpin = threading.Thread(target=tulis, args=('pemimpin', pemeriksaan('Ani')))
+        pemimpin.start()
+        self.assertTrue(commit_pertama.wait(5))
+        valid = threading.Thread(target=tulis, args=('valid', pemeriksaan('Budi')))
+        rusak = threading.Thread(target=tulis, args=('rusak', pemeriksaan('Citra', tanggal_pemeriksaan='bukan tanggal')))
+        valid.start()
+        rusak.start()
+        batas = time.monotonic() + 5
+        while len(self.penyimpanan._antrian) < 2 and time.monotonic() < batas:
+            time.sleep(0.001)
+        self.assertEqual(len(self.penyimpanan._antrian), 2)
+        lanjut.set()
+        for thread in (pemimpin, valid, rusak):
+            thread.join(5)
+
+        self.assertIsInstance(hasil['rusak'], DataTidakValid)
+        self.assertIn('bukan tanggal', str(hasil['rusak']))
+        self.assertEqual(hasil['valid']['nama'], 'Budi')
+
+        # Yang tersimpan (juga setelah dibaca ulang dari file) hanya tiket valid
+        for penyimpanan in (self.penyimpanan, PenyimpananWAL(self.data_file)):
+            nama = [r.nama for r in penyimpanan.baca()]
+            self.assertEqual(nama, ['Ani', 'Budi'])
+
+    def test_ubah_tidak_valid_tidak_mengubah_data(self):
+        data = self.penyimpanan.tambah(pemeriksaan('Ani'))
+        with self.assertRaises(DataTidakValid):
+            self.penyimpanan.ubah(data['id'], {'jenis_kelamin': 'L'})
+        rekaman = PenyimpananWAL(self.data_file).baca()
+        self.assertEqual(rekaman.ke_data(), [data])
+
+if __name__ == '__main__':
+    unittest.main()